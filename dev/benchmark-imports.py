@@ -0,0 +1,69 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SCRIPT = """
+import time
+started_at = time.perf_counter()
+import {module}
+from supriya.ugens import core
+print(time.perf_counter() - started_at, core._generated_code_misses)
+"""
+
+
+def measure(module: str, count: int, cold: bool) -> tuple[list[float], int]:
+    durations: list[float] = []
+    misses = 0
+    with tempfile.TemporaryDirectory() as directory:
+        environment = {**os.environ, "PYTHONPYCACHEPREFIX": directory}
+        environment.pop("PYTHONDONTWRITEBYTECODE", None)
+        # Prime bytecode and generated code caches, unless measuring cold imports
+        if not cold:
+            run_import(module, environment)
+        for _ in range(count):
+            if cold:
+                environment["PYTHONPYCACHEPREFIX"] = tempfile.mkdtemp(dir=directory)
+            duration, misses = run_import(module, environment)
+            durations.append(duration)
+    return durations, misses
+
+
+def run_import(module: str, environment: dict[str, str]) -> tuple[float, int]:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(module=module)],
+        capture_output=True,
+        check=True,
+        env=environment,
+        text=True,
+    ).stdout
+    duration, misses = output.split()
+    return float(duration), int(misses)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Benchmark import times in fresh interpreters"
+    )
+    parser.add_argument("--count", default=10, type=int)
+    parser.add_argument("--module", default="supriya")
+    return parser
+
+
+def run():
+    parser = build_parser()
+    parsed_args = parser.parse_args()
+    for label, cold in [("cold", True), ("warm", False)]:
+        durations, misses = measure(parsed_args.module, parsed_args.count, cold)
+        print(
+            f"{label}: import {parsed_args.module}"
+            f" min={min(durations) * 1000:.1f}ms"
+            f" median={statistics.median(durations) * 1000:.1f}ms"
+            f" generated-code-misses={misses}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,76 @@
+import argparse
+import logging
+import statistics
+import time
+
+from supriya.enums import BootStatus
+from supriya.osc import OscMessage, ThreadedOscProtocol
+
+
+def build(capture: bool, debug: bool) -> ThreadedOscProtocol:
+    logging.getLogger("supriya").setLevel(logging.DEBUG if debug else logging.WARNING)
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.status = BootStatus.ONLINE
+    for pattern in (["/n_end"], ["/n_go"], ["/n_move"], ["/n_off"], ["/n_on"]):
+        osc_protocol.register(pattern=pattern, procedure=lambda message: None)
+    osc_protocol._process_command_queue()
+    if capture:
+        osc_protocol.capture().__enter__()
+    return osc_protocol
+
+
+def measure(
+    message_count: int, count: int, capture: bool, debug: bool
+) -> dict[str, float]:
+    osc_protocol = build(capture=capture, debug=debug)
+    sent_message = OscMessage("/n_set", 1000, "frequency", 440.0, "amplitude", 0.5)
+    received_datagram = OscMessage("/n_go", 1000, 1, -1, -1, 0).to_datagram()
+    receive_durations: list[float] = []
+    send_durations: list[float] = []
+    for _ in range(count):
+        for capture_ in osc_protocol.captures:
+            capture_.entries.clear()
+        started_at = time.perf_counter()
+        for _ in range(message_count):
+            osc_protocol._send(sent_message)
+        send_durations.append((time.perf_counter() - started_at) / message_count)
+        started_at = time.perf_counter()
+        for _ in range(message_count):
+            for _ in osc_protocol._validate_receive(received_datagram):
+                pass
+        receive_durations.append((time.perf_counter() - started_at) / message_count)
+    return {
+        "receive": statistics.median(receive_durations),
+        "send": statistics.median(send_durations),
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the per-message cost of sending and receiving OSC"
+    )
+    parser.add_argument("--capture", action="store_true")
+    parser.add_argument("--count", default=5, type=int)
+    parser.add_argument("--debug", action="store_true")
+    parser.add_argument("--messages", default=100_000, type=int)
+    return parser
+
+
+def run():
+    parser = build_parser()
+    parsed_args = parser.parse_args()
+    results = measure(
+        parsed_args.messages,
+        parsed_args.count,
+        capture=parsed_args.capture,
+        debug=parsed_args.debug,
+    )
+    print(
+        f"{parsed_args.messages} messages:"
+        f" send={results['send'] * 1_000_000:.2f}us"
+        f" receive={results['receive'] * 1_000_000:.2f}us"
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,68 @@
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from supriya.ugens import LFNoise1, Out, SinOsc, SynthDefBuilder
+
+
+def build(voice_count: int):
+    with SynthDefBuilder(amplitude=0.1, frequency=440) as builder:
+        voices = []
+        for i in range(voice_count):
+            modulator = LFNoise1.kr(frequency=0.5 + i % 7) * 0.01 + 1
+            frequency = builder["frequency"] * (i + 1) * modulator
+            voices.append(SinOsc.ar(frequency=frequency) * (1 / (i + 1)))
+        Out.ar(bus=0, source=sum(voices) * builder["amplitude"])
+    return builder
+
+
+def measure(voice_count: int, count: int) -> dict[str, float]:
+    build_durations: list[float] = []
+    compile_durations: list[float] = []
+    ugen_count = 0
+    for _ in range(count):
+        started_at = time.perf_counter()
+        builder = build(voice_count)
+        build_durations.append(time.perf_counter() - started_at)
+        started_at = time.perf_counter()
+        synthdef = builder.build(name="benchmark")
+        synthdef.compile()
+        compile_durations.append(time.perf_counter() - started_at)
+        ugen_count = len(synthdef.ugens)
+    tracemalloc.start()
+    builder = build(voice_count)
+    graph_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "build": statistics.median(build_durations),
+        "compile": statistics.median(compile_durations),
+        "memory": graph_size,
+        "ugens": ugen_count,
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Benchmark building and compiling a large UGen graph"
+    )
+    parser.add_argument("--count", default=5, type=int)
+    parser.add_argument("--voices", default=500, type=int)
+    return parser
+
+
+def run():
+    parser = build_parser()
+    parsed_args = parser.parse_args()
+    results = measure(parsed_args.voices, parsed_args.count)
+    print(
+        f"{results['ugens']} ugens:"
+        f" build={results['build'] * 1000:.1f}ms"
+        f" compile={results['compile'] * 1000:.1f}ms"
+        f" graph-memory={results['memory'] / 1024:.1f}KiB"
+        f" ({results['memory'] / results['ugens']:.0f}B/ugen)"
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -26,10 +26,12 @@ from .contexts import (
     Context,
     Group,
     Node,
+    RenderCache,
     ScopeBuffer,
     Score,
     Server,
     ServerLifecycleCallback,
+    ServerPool,
     Synth,
 )
 from .enums import (  # noqa
@@ -66,6 +68,8 @@ if not (
     except IOError:
         pass
 
+render_cache = RenderCache(output_path / "render-cache")
+
 samples_path = Path(__file__).parent / "samples"
 
 __all__ = [
@@ -95,12 +99,14 @@ __all__ = [
     "OscCallback",
     "OscMessage",
     "Pattern",
+    "RenderCache",
     "SampleFormat",
     "ScopeBuffer",
     "Score",
     "Server",
     "ServerLifecycleCallback",
     "ServerLifecycleEvent",
+    "ServerPool",
     "ServerShutdownEvent",
     "Synth",
     "SynthDef",
@@ -118,6 +124,7 @@ __all__ = [
     "play",
     "plot",
     "render",
+    "render_cache",
     "synthdef",
 ]
 
@@ -310,19 +310,26 @@ static nb::tuple decode_message_clean(const uint8_t* data, size_t len) {
             case 'b': {
                 auto [blob_data, blob_size, off4] = decode_blob(data, offset, len);
                 offset = off4;
+                // Only blobs holding OSC packets which re-encode exactly are
+                // decoded, so others, like SCgf files in /d_recv, stay raw bytes
                 nb::object parsed;
                 bool did_parse = false;
-                if (starts_with_bundle(blob_data, blob_size)) {
-                    try {
+                try {
+                    if (starts_with_bundle(blob_data, blob_size)) {
                         parsed = decode_bundle_from_raw(blob_data, blob_size);
                         did_parse = true;
-                    } catch (...) { PyErr_Clear(); }
-                }
-                if (!did_parse) {
-                    try {
+                    } else if (blob_size > 0 && blob_data[0] == '/') {
                         parsed = decode_message_from_raw(blob_data, blob_size);
                         did_parse = true;
-                    } catch (...) { PyErr_Clear(); }
+                    }
+                    if (did_parse) {
+                        nb::bytes encoded = nb::cast<nb::bytes>(parsed.attr("to_datagram")());
+                        did_parse = encoded.size() == blob_size &&
+                            std::memcmp(encoded.c_str(), blob_data, blob_size) == 0;
+                    }
+                } catch (...) {
+                    PyErr_Clear();
+                    did_parse = false;
                 }
                 if (did_parse) {
                     array_stack.back().append(parsed);
@@ -477,6 +484,51 @@ static nb::tuple decode_bundle_bytes(nb::bytes datagram) {
     return nb::make_tuple(timestamp, elements);
 }
 
+// --- Templates ---
+
+// Copy a pre-encoded message, patching int32/float32 values in at each slot's offset.
+// Offsets and type tags are borrowed as a tuple and bytes to avoid per-call conversion.
+static nb::bytes fill_template(nb::bytes datagram, nb::tuple offsets, nb::bytes type_tags,
+                               nb::args values) {
+    const size_t count = values.size();
+    if (offsets.size() != count || type_tags.size() != count)
+        throw nb::value_error("expected one value per template slot");
+    const char* tags = type_tags.c_str();
+    const size_t size = datagram.size();
+    nb::bytes result = nb::steal<nb::bytes>(
+        PyBytes_FromStringAndSize(nullptr, static_cast<Py_ssize_t>(size)));
+    if (!result.is_valid())
+        throw nb::python_error();
+    uint8_t* buffer = reinterpret_cast<uint8_t*>(PyBytes_AS_STRING(result.ptr()));
+    std::memcpy(buffer, datagram.c_str(), size);
+    for (size_t i = 0; i < count; i++) {
+        size_t offset;
+        if (!nb::try_cast(offsets[i], offset))
+            throw nb::type_error("template offsets must be ints");
+        if (offset + 4 > size)
+            throw nb::value_error("template slot out of range");
+        uint32_t bits;
+        if (tags[i] == 'i') {
+            int32_t value;
+            if (!nb::try_cast(values[i], value))
+                throw nb::type_error("template slot requires an int32");
+            std::memcpy(&bits, &value, 4);
+        } else if (tags[i] == 'f') {
+            float value;
+            if (!nb::try_cast(values[i], value))
+                throw nb::type_error("template slot requires a float");
+            std::memcpy(&bits, &value, 4);
+        } else {
+            throw nb::value_error("template slots must be 'i' or 'f'");
+        }
+        buffer[offset] = static_cast<uint8_t>(bits >> 24);
+        buffer[offset + 1] = static_cast<uint8_t>(bits >> 16);
+        buffer[offset + 2] = static_cast<uint8_t>(bits >> 8);
+        buffer[offset + 3] = static_cast<uint8_t>(bits);
+    }
+    return result;
+}
+
 NB_MODULE(_osc, m) {
     m.doc() = "Native OSC encode/decode for supriya";
 
@@ -495,4 +547,11 @@ NB_MODULE(_osc, m) {
     m.def("decode_bundle", &decode_bundle_bytes,
           nb::arg("datagram"),
           "Decode an OSC bundle datagram. Returns (timestamp_or_None, [element_bytes, ...]).");
+
+    m.def("fill_template", &fill_template,
+          nb::arg("datagram"), nb::arg("offsets"), nb::arg("type_tags"), nb::arg("values"),
+          "Copy a pre-encoded OSC message, patching int32/float32 values in at the given offsets.");
+
+    // Blobs only decode to nested messages when they re-encode exactly
+    m.attr("LOSSLESS_BLOBS") = true;
 }
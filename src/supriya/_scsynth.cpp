@@ -5,8 +5,13 @@
 #include <nanobind/stl/string.h>
 #include <nanobind/stl/optional.h>
 
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
 #include <cstdarg>
+#include <cstdint>
 #include <cstdio>
+#include <deque>
 #include <mutex>
 #include <string>
 
@@ -55,11 +60,33 @@ struct WorldStrings {
 };
 
 // ---------------------------------------------------------------------------
-// No-op reply function for World_SendPacket (avoids null dereference when
-// scsynth internally replies to commands like /quit or /notify).
+// In-process reply channel
+//
+// Replies to packets injected via World_SendPacket (including /notify
+// notifications) are copied into a queue which Python drains with
+// receive_replies(). The reply function runs on scsynth's own threads, so it
+// never touches the GIL, and only holds the queue mutex long enough to append.
+// While the channel is closed replies are dropped, which also avoids a null
+// dereference when scsynth replies to commands like /quit or /notify.
 // ---------------------------------------------------------------------------
 
-static void noop_reply_func(struct ReplyAddress*, char*, int) {}
+static std::atomic<bool> g_reply_channel_open{false};
+// Bumped under the mutex whenever the channel opens or closes, so receivers wake
+// on the transition without spinning while the channel stays closed
+static uint64_t g_reply_channel_generation = 0;
+static std::condition_variable g_reply_condition;
+static std::mutex g_reply_mutex;
+static std::deque<std::string> g_reply_queue;
+
+static void queue_reply_func(struct ReplyAddress*, char* data, int size) {
+    if (!g_reply_channel_open.load(std::memory_order_acquire) || size <= 0)
+        return;
+    {
+        std::lock_guard<std::mutex> lock(g_reply_mutex);
+        g_reply_queue.emplace_back(data, static_cast<size_t>(size));
+    }
+    g_reply_condition.notify_one();
+}
 
 // ---------------------------------------------------------------------------
 // Module functions
@@ -239,8 +266,77 @@ static bool py_world_send_packet(nb::capsule& world_cap, nb::bytes data) {
     bool result;
     {
         nb::gil_scoped_release release;
-        result = World_SendPacket(world, size, buf, noop_reply_func);
+        result = World_SendPacket(world, size, buf, queue_reply_func);
+    }
+    return result;
+}
+
+static void py_world_nonrealtime_synthesis(
+    nb::capsule& world_cap,
+    const std::string& command_file_path,
+    std::optional<std::string> input_file_path,
+    const std::string& output_file_path,
+    uint32_t sample_rate,
+    const std::string& header_format,
+    const std::string& sample_format,
+    uint32_t num_input_bus_channels,
+    uint32_t num_output_bus_channels,
+    uint32_t block_size
+) {
+    World* world = extract_world(world_cap);
+    // Mirror scsynth's -N handling: only these fields are consulted by
+    // World_NonRealTimeSynthesis, everything else was fixed by World_New.
+    WorldOptions opts;
+    opts.mRealTime = false;
+    opts.mPreferredSampleRate = sample_rate;
+    opts.mNumInputBusChannels = num_input_bus_channels;
+    opts.mNumOutputBusChannels = num_output_bus_channels;
+    opts.mBufLength = block_size;
+    opts.mNonRealTimeCmdFilename = command_file_path.c_str();
+    opts.mNonRealTimeInputFilename =
+        input_file_path.has_value() ? input_file_path->c_str() : nullptr;
+    opts.mNonRealTimeOutputFilename = output_file_path.c_str();
+    opts.mNonRealTimeOutputHeaderFormat = header_format.c_str();
+    opts.mNonRealTimeOutputSampleFormat = sample_format.c_str();
+    {
+        nb::gil_scoped_release release;
+        // Runs the command file to completion and disposes of the World
+        World_NonRealTimeSynthesis(world, &opts);
+    }
+}
+
+static void py_set_reply_channel(bool open) {
+    {
+        std::lock_guard<std::mutex> lock(g_reply_mutex);
+        g_reply_queue.clear();
+        g_reply_channel_open.store(open, std::memory_order_release);
+        g_reply_channel_generation++;
+    }
+    // Wake any receiver blocked in receive_replies()
+    g_reply_condition.notify_all();
+}
+
+static nb::list py_receive_replies(double timeout) {
+    std::deque<std::string> replies;
+    {
+        nb::gil_scoped_release release;
+        std::unique_lock<std::mutex> lock(g_reply_mutex);
+        // A closed channel never fills, so wait out the timeout rather than
+        // returning at once and letting pump loops spin
+        const uint64_t generation = g_reply_channel_generation;
+        g_reply_condition.wait_for(
+            lock,
+            std::chrono::duration<double>(timeout),
+            [generation] {
+                return !g_reply_queue.empty() ||
+                    g_reply_channel_generation != generation;
+            }
+        );
+        replies.swap(g_reply_queue);
     }
+    nb::list result;
+    for (const std::string& reply : replies)
+        result.append(nb::bytes(reply.data(), reply.size()));
     return result;
 }
 
@@ -306,4 +402,22 @@ NB_MODULE(_scsynth, m) {
     m.def("world_send_packet", &py_world_send_packet,
           nb::arg("world"), nb::arg("data"),
           "Send an OSC packet directly to the world. Returns True on success.");
+
+    m.def("world_nonrealtime_synthesis", &py_world_nonrealtime_synthesis,
+          nb::arg("world"), nb::arg("command_file_path"),
+          nb::arg("input_file_path").none(), nb::arg("output_file_path"),
+          nb::arg("sample_rate"), nb::arg("header_format"),
+          nb::arg("sample_format"), nb::arg("num_input_bus_channels") = 8u,
+          nb::arg("num_output_bus_channels") = 8u, nb::arg("block_size") = 64u,
+          "Render an OSC command file through a World created with "
+          "realtime=False. The World is consumed.");
+
+    m.def("set_reply_channel", &py_set_reply_channel,
+          nb::arg("open"),
+          "Open or close the in-process reply channel, discarding queued replies.");
+
+    m.def("receive_replies", &py_receive_replies,
+          nb::arg("timeout"),
+          "Wait up to timeout seconds for replies to directly sent packets, "
+          "returning all queued reply datagrams.");
 }
@@ -1,6 +1,9 @@
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <nanobind/stl/vector.h>
 #include <nanobind/stl/pair.h>
+#include <algorithm>
+#include <cstring>
 #include <stdexcept>
 
 #include "server_shm.hpp"
@@ -69,10 +72,38 @@ public:
         unsigned int available_frames = 0;
         reader.pull(available_frames);
         float* data = reader.data();
-        std::vector<float> pydata(data, data + 8192);
+        // Only the frames the writer pushed are valid, not the whole region
+        std::vector<float> pydata(data, data + available_frames * reader.channels());
         return {available_frames, pydata};
     }
 
+    // Pull the scope buffer and, only if the writer has pushed new frames
+    // since the last pull, copy the valid frames into ``out``.
+    //
+    // Returns (changed, frames). The reader swaps its region with the staged
+    // one when new data is available, so a changed read address signals an
+    // advance by the writer.
+    std::pair<bool, unsigned int> pull_scope_buffer(
+        unsigned int index,
+        nb::ndarray<float, nb::ndim<1>, nb::c_contig, nb::device::cpu> out
+    ) {
+        scope_buffer_reader reader = client->get_scope_buffer_reader(index);
+        if (!reader.valid())
+            throw std::runtime_error("Invalid scope buffer");
+        float* previous = reader.data();
+        unsigned int frames = 0;
+        reader.pull(frames);
+        float* data = reader.data();
+        if (data == previous)
+            return {false, frames};
+        size_t count = std::min(
+            static_cast<size_t>(frames) * reader.channels(),
+            static_cast<size_t>(out.shape(0))
+        );
+        std::memcpy(out.data(), data, count * sizeof(float));
+        return {true, frames};
+    }
+
     unsigned int get_bus_count() const { return bus_count; }
 };
 
@@ -91,5 +122,7 @@ NB_MODULE(_shm, m) {
              nb::arg("start"), nb::arg("stop"), nb::arg("step"), nb::arg("values"))
         .def("describe_scope_buffer", &ServerSHM::describe_scope_buffer, nb::arg("index"))
         .def("read_scope_buffer", &ServerSHM::read_scope_buffer, nb::arg("index"))
+        .def("pull_scope_buffer", &ServerSHM::pull_scope_buffer,
+             nb::arg("index"), nb::arg("out"))
         .def_prop_ro("bus_count", &ServerSHM::get_bus_count);
 }
@@ -0,0 +1,158 @@
+// SynthDef decode module for supriya.
+// Parses SCgf (version 1 and 2) SynthDef files in a single pass into plain Python
+// structures, matching supriya.ugens.core._decode_synthdef_specs:
+//   [(name, constants, parameter_values, parameter_names, ugens), ...]
+// where parameter_names is [(name, index), ...] and ugens is
+//   [(ugen_name, calculation_rate, special_index, output_count, inputs), ...]
+// with inputs as [(ugen_index, output_index), ...], ugen_index -1 for constants.
+// Variants are skipped.
+
+#include <nanobind/nanobind.h>
+
+#include <cstdint>
+#include <cstring>
+#include <stdexcept>
+#include <string>
+
+namespace nb = nanobind;
+
+namespace {
+
+class Reader {
+public:
+    Reader(const uint8_t* data, size_t size) : data_(data), size_(size) {}
+
+    void require(size_t count) const {
+        if (offset_ + count > size_)
+            throw std::invalid_argument("truncated SynthDef data");
+    }
+
+    uint8_t u8() {
+        require(1);
+        return data_[offset_++];
+    }
+
+    uint16_t u16() {
+        require(2);
+        uint16_t value = static_cast<uint16_t>(
+            (static_cast<uint16_t>(data_[offset_]) << 8) | data_[offset_ + 1]);
+        offset_ += 2;
+        return value;
+    }
+
+    uint32_t u32(bool wide = true) {
+        if (!wide)
+            return u16();
+        require(4);
+        uint32_t value = (static_cast<uint32_t>(data_[offset_]) << 24) |
+                         (static_cast<uint32_t>(data_[offset_ + 1]) << 16) |
+                         (static_cast<uint32_t>(data_[offset_ + 2]) << 8) |
+                          static_cast<uint32_t>(data_[offset_ + 3]);
+        offset_ += 4;
+        return value;
+    }
+
+    double f32() {
+        uint32_t bits = u32();
+        float value;
+        std::memcpy(&value, &bits, 4);
+        return static_cast<double>(value);
+    }
+
+    nb::str pstring() {
+        size_t length = u8();
+        require(length);
+        nb::str value(reinterpret_cast<const char*>(data_ + offset_), length);
+        offset_ += length;
+        return value;
+    }
+
+    void skip_pstring() {
+        size_t length = u8();
+        require(length);
+        offset_ += length;
+    }
+
+private:
+    const uint8_t* data_;
+    size_t size_;
+    size_t offset_ = 0;
+};
+
+nb::tuple decode_synthdef(Reader& reader, bool wide) {
+    nb::str name = reader.pstring();
+    uint32_t constant_count = reader.u32(wide);
+    nb::list constants;
+    for (uint32_t i = 0; i < constant_count; i++)
+        constants.append(nb::float_(reader.f32()));
+    uint32_t parameter_count = reader.u32(wide);
+    nb::list parameter_values;
+    for (uint32_t i = 0; i < parameter_count; i++)
+        parameter_values.append(nb::float_(reader.f32()));
+    uint32_t parameter_name_count = reader.u32(wide);
+    nb::list parameter_names;
+    for (uint32_t i = 0; i < parameter_name_count; i++) {
+        nb::str parameter_name = reader.pstring();
+        parameter_names.append(nb::make_tuple(parameter_name, reader.u32(wide)));
+    }
+    uint32_t ugen_count = reader.u32(wide);
+    nb::list ugens;
+    for (uint32_t i = 0; i < ugen_count; i++) {
+        nb::str ugen_name = reader.pstring();
+        int calculation_rate = reader.u8();
+        uint32_t input_count = reader.u32(wide);
+        uint32_t output_count = reader.u32(wide);
+        int special_index = reader.u16();
+        nb::list inputs;
+        for (uint32_t j = 0; j < input_count; j++) {
+            uint32_t ugen_index = reader.u32(wide);
+            uint32_t output_index = reader.u32(wide);
+            bool is_constant = wide ? ugen_index == 0xFFFFFFFF : ugen_index == 0xFFFF;
+            if (!is_constant && ugen_index >= i)
+                throw std::invalid_argument("UGen input refers to a later UGen");
+            if (is_constant && output_index >= constant_count)
+                throw std::invalid_argument("UGen input refers to a missing constant");
+            inputs.append(nb::make_tuple(
+                is_constant ? -1 : static_cast<long>(ugen_index),
+                static_cast<long>(output_index)));
+        }
+        for (uint32_t j = 0; j < output_count; j++)
+            reader.u8();
+        ugens.append(nb::make_tuple(
+            ugen_name, calculation_rate, special_index, output_count, inputs));
+    }
+    uint16_t variant_count = reader.u16();
+    for (uint16_t i = 0; i < variant_count; i++) {
+        reader.skip_pstring();
+        for (uint32_t j = 0; j < parameter_count; j++)
+            reader.f32();
+    }
+    return nb::make_tuple(name, constants, parameter_values, parameter_names, ugens);
+}
+
+nb::list decode_synthdefs(nb::bytes value) {
+    const uint8_t* data = reinterpret_cast<const uint8_t*>(value.c_str());
+    Reader reader(data, value.size());
+    reader.require(4);
+    if (std::memcmp(data, "SCgf", 4) != 0)
+        throw std::invalid_argument("not a SynthDef file");
+    reader.u32();
+    uint32_t file_version = reader.u32();
+    if (file_version != 1 && file_version != 2)
+        throw std::invalid_argument("unsupported SynthDef file version");
+    uint16_t synthdef_count = reader.u16();
+    nb::list synthdefs;
+    for (uint16_t i = 0; i < synthdef_count; i++)
+        synthdefs.append(decode_synthdef(reader, file_version == 2));
+    return synthdefs;
+}
+
+}  // namespace
+
+NB_MODULE(_synthdef, m) {
+    m.doc() = "Native SynthDef decoding for supriya";
+
+    m.def("decode_synthdefs", &decode_synthdefs,
+          nb::arg("value"),
+          "Decode a SynthDef file into lists of constants, parameters and UGen specs.");
+}
@@ -0,0 +1,11 @@
+def decode_synthdefs(
+    value: bytes,
+) -> list[
+    tuple[
+        str,
+        list[float],
+        list[float],
+        list[tuple[str, int]],
+        list[tuple[str, int, int, int, list[tuple[int, int]]]],
+    ]
+]: ...
@@ -14,28 +14,41 @@ from .entities import (
     ScopeBuffer,
     Synth,
 )
-from .nonrealtime import Score
+from .nonrealtime import CommandFile, RenderCache, RenderCacheStatistics, Score
+from .pool import ServerPool, ServerPoolStatistics
 from .realtime import (
     AsyncServer,
     BaseServer,
     Server,
     ServerLifecycleCallback,
 )
+from .streams import ParameterStream, ParameterStreamStatistics
+from .timelines import BaseTimeline, EncodedTimeline, Timeline
 
 __all__ = [
     "AsyncServer",
     "BaseServer",
+    "BaseTimeline",
     "Buffer",
     "BufferGroup",
     "Bus",
     "BusGroup",
+    "CommandFile",
     "Context",
     "ContextObject",
+    "EncodedTimeline",
     "Group",
     "Node",
+    "ParameterStream",
+    "ParameterStreamStatistics",
+    "RenderCache",
+    "RenderCacheStatistics",
     "ScopeBuffer",
     "Score",
     "Server",
     "ServerLifecycleCallback",
+    "ServerPool",
+    "ServerPoolStatistics",
     "Synth",
+    "Timeline",
 ]
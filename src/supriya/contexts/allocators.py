@@ -120,6 +120,21 @@ class BlockAllocator:
                     index
                 ).stop_offset
 
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def used_range(self) -> tuple[int, int] | None:
+        """
+        Get the smallest range covering all allocated blocks, if any.
+        """
+        with self._lock:
+            if not self._used_dict:
+                return None
+            return (
+                min(block.start_offset for block in self._used_dict.values()),
+                max(block.stop_offset for block in self._used_dict.values()),
+            )
+
 
 class NodeIdAllocator:
     """
@@ -216,3 +231,25 @@ class NodeIdAllocator:
             node_id = node_id & 0x03FFFFFF
             if node_id < self._initial_node_id:
                 self._freed_permanent_ids.add(node_id)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def used_node_id_range(self) -> tuple[int, int]:
+        """
+        Get the range of non-permanent node IDs allocated so far.
+        """
+        with self._lock:
+            return self._initial_node_id | self._mask, self._temp | self._mask
+
+    @property
+    def used_permanent_node_ids(self) -> list[int]:
+        """
+        Get the permanent node IDs currently allocated.
+        """
+        with self._lock:
+            return [
+                x | self._mask
+                for x in range(1, self._next_permanent_id)
+                if x not in self._freed_permanent_ids
+            ]
@@ -14,9 +14,11 @@ import threading
 from collections.abc import Sequence as SequenceABC
 from os import PathLike
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Literal,
+    Mapping,
     Optional,
     Sequence,
     SupportsFloat,
@@ -34,6 +36,7 @@ from ..exceptions import (
     InvalidCalculationRate,
     MomentClosed,
 )
+from ..osc import OscTemplate
 from ..scsynth import Options
 from ..typing import (
     AddActionLike,
@@ -64,14 +67,20 @@ from .requests import (
     CloseBuffer,
     CopyBuffer,
     DoNothing,
+    EncodedRequest,
     FillBuffer,
     FillControlBusRange,
     FreeAllSynthDefs,
     FreeBuffer,
     FreeGroupChildren,
     FreeGroupDeep,
+    FreeNode,
     FreeSynthDef,
     GenerateBuffer,
+    GetControlBus,
+    GetControlBusRange,
+    GetSynthControl,
+    GetSynthControlRange,
     LoadSynthDefDirectory,
     LoadSynthDefs,
     MapAudioBusToNode,
@@ -85,6 +94,8 @@ from .requests import (
     NewSynth,
     NormalizeBuffer,
     OrderNodes,
+    QueryNode,
+    QueryTree,
     ReadBuffer,
     ReadBufferChannel,
     ReceiveSynthDefs,
@@ -98,12 +109,40 @@ from .requests import (
     SetControlBusRange,
     SetNodeControl,
     SetNodeControlRange,
+    TemplatedRequest,
     WriteBuffer,
     ZeroBuffer,
 )
+from .streams import ParameterStream
+
+if TYPE_CHECKING:
+    from .shm import ServerSHM
 
 BUS_PATTERN = re.compile("([ac])(\\d+)")
 
+# Requests which control and bus updates may not be coalesced across
+_BUS_BARRIER_TYPES = (
+    EncodedRequest,
+    GetControlBus,
+    GetControlBusRange,
+    TemplatedRequest,
+)
+_NODE_BARRIER_TYPES = (
+    EncodedRequest,
+    FreeGroupChildren,
+    FreeGroupDeep,
+    FreeNode,
+    GetSynthControl,
+    GetSynthControlRange,
+    NewGroup,
+    NewParallelGroup,
+    NewSynth,
+    QueryNode,
+    QueryTree,
+    ReleaseNode,
+    TemplatedRequest,
+)
+
 
 @dataclasses.dataclass
 class Moment:
@@ -112,6 +151,9 @@ class Moment:
 
     Multiple requests made inside a moment are bundled together.
 
+    Control and bus updates superseded by later updates inside the moment are
+    dropped, and counted in ``coalesced_count``.
+
     :param context: The moment's context.
     :param seconds: The moment's timestamp.
     """
@@ -119,6 +161,7 @@ class Moment:
     context: "Context"
     seconds: float | None = None
     closed: bool = dataclasses.field(default=False, init=False)
+    coalesced_count: int = dataclasses.field(default=0, init=False)
     requests: list[tuple[Request, Optional["Completion"]]] = dataclasses.field(
         default_factory=list, init=False
     )
@@ -137,7 +180,8 @@ class Moment:
         Unset this moment as the current "request context".
         """
         self.context._pop_moment()
-        requests = self.context._apply_completions(self.requests)
+        requests, coalesced_count = self.context._apply_completions(self.requests)
+        self.coalesced_count += coalesced_count
         timestamp = (
             self.seconds + self.context._latency if self.seconds is not None else None
         )
@@ -175,7 +219,8 @@ class Completion:
         """
         if not hasattr(request, "on_completion"):
             raise ValueError(request)
-        requests = self.context._apply_completions(self.requests)
+        requests, coalesced_count = self.context._apply_completions(self.requests)
+        self.moment.coalesced_count += coalesced_count
         if len(requests) > 1:
             request = new(request, on_completion=RequestBundle(contents=requests))
         elif len(requests) == 1:
@@ -307,20 +352,67 @@ class Context(metaclass=abc.ABCMeta):
             raise AllocationError
         return id_
 
-    @staticmethod
+    @classmethod
     def _apply_completions(
+        cls,
         pairs: list[tuple[Request, Completion | None]],
-    ) -> list[Request]:
+    ) -> tuple[list[Request], int]:
         requests: list[Request] = []
-        for key, group in itertools.groupby(
+        coalesced_requests, coalesced_count = cls._coalesce_requests(
             [
                 request if completion is None else completion(request)
                 for request, completion in pairs
-            ],
-            key=lambda x: type(x),
-        ):
+            ]
+        )
+        for key, group in itertools.groupby(coalesced_requests, key=lambda x: type(x)):
             requests.extend(key.merge(list(group)))
-        return requests
+        return requests, coalesced_count
+
+    @staticmethod
+    def _coalesce_requests(requests: list[Request]) -> tuple[list[Request], int]:
+        # Walk backwards, dropping control and bus updates wholly overwritten by
+        # later updates. Controls are keyed as given, by name or by index.
+        bus_indices: set[int] = set()
+        node_controls: dict[tuple[int, int | str], int] = {}
+        coalesced_requests: list[Request] = []
+        coalesced_count = 0
+        for request in reversed(requests):
+            if isinstance(request, (SetControlBus, SetControlBusRange)):
+                bus_items: list[Any] = []
+                for index, values in reversed(request.items):
+                    count = len(values) if isinstance(values, Sequence) else 1
+                    indices = range(int(index), int(index) + count)
+                    if bus_indices.issuperset(indices):
+                        coalesced_count += 1
+                        continue
+                    bus_indices.update(indices)
+                    bus_items.insert(0, (index, values))
+                if not bus_items:
+                    continue
+                if len(bus_items) < len(request.items):
+                    request = new(request, items=bus_items)
+            elif isinstance(request, (SetNodeControl, SetNodeControlRange)):
+                node_id = int(request.node_id)
+                node_items: list[Any] = []
+                for control, values in reversed(request.items):
+                    count = len(values) if isinstance(values, Sequence) else 1
+                    if node_controls.get((node_id, control), 0) >= count:
+                        coalesced_count += 1
+                        continue
+                    node_controls[node_id, control] = count
+                    node_items.insert(0, (control, values))
+                if not node_items:
+                    continue
+                if len(node_items) < len(request.items):
+                    request = new(request, items=node_items)
+            else:
+                if isinstance(request, _BUS_BARRIER_TYPES):
+                    bus_indices.clear()
+                if isinstance(request, _NODE_BARRIER_TYPES):
+                    node_controls.clear()
+            coalesced_requests.append(request)
+        coalesced_requests.reverse()
+        return coalesced_requests, coalesced_count
 
     @abc.abstractmethod
     def _free_id(
@@ -382,6 +474,16 @@ class Context(metaclass=abc.ABCMeta):
             return moments[-1]
         return None
 
+    def _get_control_indices(
+        self, synthdef: SynthDef
+    ) -> Mapping[str, tuple[int, int]] | None:
+        return None
+
+    def _get_shared_memory(
+        self, use_shared_memory: bool | None, write: bool = False
+    ) -> Optional["ServerSHM"]:
+        return None
+
     def _pop_completion(self) -> None:
         self._get_completions().pop()
 
@@ -394,6 +496,9 @@ class Context(metaclass=abc.ABCMeta):
     def _push_moment(self, moment: Moment) -> None:
         self._get_moments().append(moment)
 
+    def _record_synthdef(self, synth_id: int, synthdef: SynthDef) -> None:
+        pass  # Only realtime contexts mirror their node trees
+
     @abc.abstractmethod
     def _resolve_node(self, node: Node | SupportsInt | None) -> int:
         raise NotImplementedError
@@ -650,8 +755,9 @@ class Context(metaclass=abc.ABCMeta):
             if add_action_ not in target_node._valid_add_actions:
                 raise ValueError(add_action_)
         target_node_id = self._resolve_node(target_node)
+        use_control_indices = self._get_control_indices(synthdef) is not None
         synthdef_kwargs: dict[int | str, float | str | tuple[float | str, ...]] = {}
-        for _, parameter in synthdef.indexed_parameters:
+        for index, parameter in synthdef.indexed_parameters:
             if parameter.name not in settings:
                 continue
             value = settings[parameter.name]
@@ -667,10 +773,11 @@ class Context(metaclass=abc.ABCMeta):
                     processed_values.append(v)
                 else:
                     processed_values.append(float(v))
+            key = index if use_control_indices else parameter.name
             if len(processed_values) == 1:
-                synthdef_kwargs[parameter.name] = processed_values[0]
+                synthdef_kwargs[key] = processed_values[0]
             else:
-                synthdef_kwargs[parameter.name] = tuple(processed_values)
+                synthdef_kwargs[key] = tuple(processed_values)
         id_ = self._allocate_id(Node, permanent=permanent)
         self._add_requests(
             NewSynth(
@@ -681,6 +788,7 @@ class Context(metaclass=abc.ABCMeta):
                 controls=synthdef_kwargs,
             )
         )
+        self._record_synthdef(id_, synthdef)
         return Synth(context=self, id_=id_, synthdef=synthdef)
 
     def add_synthdefs(
@@ -801,7 +909,11 @@ class Context(metaclass=abc.ABCMeta):
         self._add_requests(request)
 
     def fill_bus_range(
-        self, bus: Bus, count: int, value: float, use_shared_memory: bool = False
+        self,
+        bus: Bus,
+        count: int,
+        value: float,
+        use_shared_memory: bool | None = None,
     ) -> None:
         """
         Fill a contiguous range of buses with a single value.
@@ -811,12 +923,13 @@ class Context(metaclass=abc.ABCMeta):
         :param count: The number of buses to fill.
         :param value: The value to fill with.
         :param use_shared_memory: If true, use the shared memory interface.
-            Skip bundling the request in any open moment.
+            Skip bundling the request in any open moment. If ``None``, defer to the
+            context's shared memory policy.
         """
         self._validate_can_request()
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
-        if use_shared_memory and (shared_memory := getattr(self, "_shared_memory")):
+        if shared_memory := self._get_shared_memory(use_shared_memory, write=True):
             shared_memory[int(bus) : int(bus) + count] = [value] * count
             return
         request = FillControlBusRange(items=[(int(bus), count, value)])
@@ -1229,6 +1342,19 @@ class Context(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def send_template(self, template: OscTemplate, *values: float) -> None:
+        """
+        Fill in and send a pre-encoded OSC message template.
+
+        Templates avoid re-encoding messages sent repeatedly with only their numeric
+        arguments changing.
+
+        :param template: The template to fill in.
+        :param values: The values to fill the template's variable arguments with.
+        """
+        self._validate_can_request()
+        self._add_requests(TemplatedRequest(template=template, values=values))
+
     def set_buffer(self, buffer: Buffer, index: int, value: float) -> None:
         """
         set a buffer sample.
@@ -1259,7 +1385,9 @@ class Context(metaclass=abc.ABCMeta):
         request = SetBufferRange(buffer_id=buffer, items=[(index, values)])
         self._add_requests(request)
 
-    def set_bus(self, bus: Bus, value: float, use_shared_memory: bool = False) -> None:
+    def set_bus(
+        self, bus: Bus, value: float, use_shared_memory: bool | None = None
+    ) -> None:
         """
         set a control bus to a value.
 
@@ -1268,19 +1396,23 @@ class Context(metaclass=abc.ABCMeta):
         :param bus: The control bus to set.
         :param value: The value to set the control bus to.
         :param use_shared_memory: If true, use the shared memory interface.
-            Skip bundling the request in any open moment.
+            Skip bundling the request in any open moment. If ``None``, defer to the
+            context's shared memory policy.
         """
         self._validate_can_request()
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
-        if use_shared_memory and (shared_memory := getattr(self, "_shared_memory")):
+        if shared_memory := self._get_shared_memory(use_shared_memory, write=True):
             shared_memory[int(bus)] = value
             return
         request = SetControlBus(items=[(int(bus), value)])
         self._add_requests(request)
 
     def set_bus_range(
-        self, bus: Bus, values: Sequence[float], use_shared_memory: bool = False
+        self,
+        bus: Bus,
+        values: Sequence[float],
+        use_shared_memory: bool | None = None,
     ) -> None:
         """
         set a range of control buses.
@@ -1290,12 +1422,13 @@ class Context(metaclass=abc.ABCMeta):
         :param bus: The bus to start writing at.
         :param values: The values to write.
         :param use_shared_memory: If true, use the shared memory interface.
-            Skip bundling the request in any open moment.
+            Skip bundling the request in any open moment. If ``None``, defer to the
+            context's shared memory policy.
         """
         self._validate_can_request()
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
-        if use_shared_memory and (shared_memory := getattr(self, "_shared_memory")):
+        if shared_memory := self._get_shared_memory(use_shared_memory, write=True):
             shared_memory[int(bus) : int(bus) + len(values)] = values
             return
         request = SetControlBusRange(items=[(int(bus), values)])
@@ -1328,8 +1461,30 @@ class Context(metaclass=abc.ABCMeta):
                 coerced_settings[key] = [float(value) for value in values]
             else:
                 coerced_settings[key] = float(values)
-        request = SetNodeControl(node_id=node.id_, items=list(coerced_settings.items()))
-        self._add_requests(request)
+        if not isinstance(node, Synth) or not (
+            control_indices := self._get_control_indices(node.synthdef)
+        ):
+            request = SetNodeControl(
+                node_id=node.id_, items=list(coerced_settings.items())
+            )
+            self._add_requests(request)
+            return
+        # Resolve names to indices, and send multi-value controls as ranges
+        items: list[tuple[int | str, float | Sequence[float]]] = []
+        range_items: list[tuple[int | str, Sequence[float]]] = []
+        for control, value in coerced_settings.items():
+            if isinstance(control, str) and control in control_indices:
+                control = control_indices[control][0]
+            if isinstance(value, Sequence):
+                range_items.append((control, value))
+            else:
+                items.append((control, value))
+        requests: list[Request] = []
+        if items or not range_items:
+            requests.append(SetNodeControl(node_id=node.id_, items=items))
+        if range_items:
+            requests.append(SetNodeControlRange(node_id=node.id_, items=range_items))
+        self._add_requests(*requests)
 
     def set_node_range(
         self,
@@ -1357,6 +1512,28 @@ class Context(metaclass=abc.ABCMeta):
         )
         self._add_requests(request)
 
+    def stream_parameters(
+        self,
+        rate: float = 60.0,
+        maximum_queue_depth: int = 8,
+        overflow_policy: Literal["drop-oldest", "merge"] = "merge",
+    ) -> ParameterStream:
+        """
+        Create a rate-limited stream of node control updates.
+
+        :param rate: The stream's background thread's ticks per second.
+        :param maximum_queue_depth: The number of flushed bundles the stream's
+            outbound queue holds before applying the overflow policy.
+        :param overflow_policy: ``"merge"`` to merge new bundles into the newest
+            queued bundle, or ``"drop-oldest"`` to drop the oldest queued bundle.
+        """
+        return ParameterStream(
+            self,
+            rate=rate,
+            maximum_queue_depth=maximum_queue_depth,
+            overflow_policy=overflow_policy,
+        )
+
     def unpause_node(self, node: Node) -> None:
         """
         Unpause a node.
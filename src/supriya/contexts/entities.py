@@ -166,6 +166,36 @@ class Buffer(ContextObject):
             target_starting_frame=target_starting_frame,
         )
 
+    def download(
+        self,
+        *,
+        frame_count: int | None = None,
+        starting_frame: int = 0,
+        use_file: bool | None = None,
+    ) -> Awaitable["numpy.ndarray"] | "numpy.ndarray":
+        """
+        Download the buffer's samples into a NumPy array.
+
+        Emit ``/b_write`` requests via a temporary soundfile if the server is local,
+        otherwise pipelined ``/b_getn`` requests.
+
+        :param frame_count: The number of frames to download. Defaults to every frame
+            from ``starting_frame`` onward.
+        :param starting_frame: The frame to start downloading at.
+        :param use_file: Flag for transferring via a temporary soundfile. Defaults to
+            whether the server is local.
+        """
+        from .realtime import AsyncServer, Server
+
+        if not isinstance(self.context, (AsyncServer, Server)):
+            raise ContextError
+        return self.context.download_buffer(
+            self,
+            frame_count=frame_count,
+            starting_frame=starting_frame,
+            use_file=use_file,
+        )
+
     def fill(self, starting_frame: int, frame_count: int, value: float) -> None:
         """
         Fill the buffer with a single value.
@@ -354,6 +384,33 @@ class Buffer(ContextObject):
         """
         self.context.set_buffer_range(buffer=self, index=index, values=values)
 
+    def upload(
+        self,
+        array: "numpy.ndarray",
+        *,
+        starting_frame: int = 0,
+        use_file: bool | None = None,
+    ) -> Awaitable[None] | None:
+        """
+        Upload a NumPy array into the buffer.
+
+        Emit ``/b_read`` requests via a temporary soundfile if the server is local,
+        otherwise pipelined ``/b_setn`` requests.
+
+        :param array: A ``(frame_count,)`` array for single-channel buffers, otherwise
+            a ``(frame_count, channel_count)`` array.
+        :param starting_frame: The frame to start uploading at.
+        :param use_file: Flag for transferring via a temporary soundfile. Defaults to
+            whether the server is local.
+        """
+        from .realtime import AsyncServer, Server
+
+        if not isinstance(self.context, (AsyncServer, Server)):
+            raise ContextError
+        return self.context.upload_buffer(
+            self, array, starting_frame=starting_frame, use_file=use_file
+        )
+
     def write(
         self,
         file_path: PathLike,
@@ -468,7 +525,9 @@ class Bus(ContextObject):
 
     calculation_rate: CalculationRate
 
-    def fill(self, count: int, value: float, use_shared_memory: bool = False) -> None:
+    def fill(
+        self, count: int, value: float, use_shared_memory: bool | None = None
+    ) -> None:
         """
         Fill contiguous buses with a single value, starting with this bus.
 
@@ -477,7 +536,8 @@ class Bus(ContextObject):
         :param count: The number of buses to fill.
         :param value: The value to fill with.
         :param use_shared_memory: If true, use the shared memory interface.
-            Skips bundling the request in any open moment.
+            Skips bundling the request in any open moment. If ``None``, defer to
+            the context's shared memory policy.
         """
         self.context.fill_bus_range(
             self, count, value, use_shared_memory=use_shared_memory
@@ -492,7 +552,7 @@ class Bus(ContextObject):
         self.context.free_bus(self)
 
     def get(
-        self, sync: bool = True, use_shared_memory: bool = False
+        self, sync: bool = True, use_shared_memory: bool | None = None
     ) -> Awaitable[float | None] | float | None:
         """
         Get the control bus' value.
@@ -502,6 +562,7 @@ class Bus(ContextObject):
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
         :param use_shared_memory: If true and ``sync=True``, use the shared memory interface.
+            If ``None``, defer to the context's shared memory policy.
         """
         from .realtime import AsyncServer, Server
 
@@ -512,7 +573,7 @@ class Bus(ContextObject):
         )
 
     def get_range(
-        self, count: int, sync: bool = True, use_shared_memory: bool = False
+        self, count: int, sync: bool = True, use_shared_memory: bool | None = None
     ) -> Awaitable[Sequence[float] | None] | Sequence[float] | None:
         """
         Get a range of control bus values.
@@ -523,6 +584,7 @@ class Bus(ContextObject):
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
         :param use_shared_memory: If true and ``sync=True``, use the shared memory interface.
+            If ``None``, defer to the context's shared memory policy.
         """
         from .realtime import AsyncServer, Server
 
@@ -542,7 +604,7 @@ class Bus(ContextObject):
             return f"c{self.id_}"
         raise InvalidCalculationRate
 
-    def set(self, value: float, use_shared_memory: bool = False) -> None:
+    def set(self, value: float, use_shared_memory: bool | None = None) -> None:
         """
         Set the control bus's value.
 
@@ -550,12 +612,13 @@ class Bus(ContextObject):
 
         :param value: The value to set the control bus to.
         :param use_shared_memory: If true, use the shared memory interface.
-            Skips bundling the request in any open moment.
+            Skips bundling the request in any open moment. If ``None``, defer to
+            the context's shared memory policy.
         """
         self.context.set_bus(self, value, use_shared_memory=use_shared_memory)
 
     def set_range(
-        self, values: Sequence[float], use_shared_memory: bool = False
+        self, values: Sequence[float], use_shared_memory: bool | None = None
     ) -> None:
         """
         Set a range of control buses.
@@ -564,7 +627,8 @@ class Bus(ContextObject):
 
         :param values: The values to write.
         :param use_shared_memory: If true, use the shared memory interface.
-            Skips bundling the request in any open moment.
+            Skips bundling the request in any open moment. If ``None``, defer to
+            the context's shared memory policy.
         """
         self.context.set_bus_range(self, values, use_shared_memory=use_shared_memory)
 
@@ -620,7 +684,7 @@ class BusGroup(ContextObject):
         self.context.free_bus_group(self)
 
     def get(
-        self, sync: bool = True, use_shared_memory: bool = False
+        self, sync: bool = True, use_shared_memory: bool | None = None
     ) -> Awaitable[Sequence[float] | None] | Sequence[float] | None:
         """
         Get the control bus group's values.
@@ -629,6 +693,8 @@ class BusGroup(ContextObject):
 
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
+        :param use_shared_memory: If true and ``sync=True``, use the shared memory interface.
+            If ``None``, defer to the context's shared memory policy.
         """
         from .realtime import AsyncServer, Server
 
@@ -649,7 +715,7 @@ class BusGroup(ContextObject):
         raise InvalidCalculationRate
 
     def set(
-        self, values: float | Sequence[float], use_shared_memory: bool = False
+        self, values: float | Sequence[float], use_shared_memory: bool | None = None
     ) -> None:
         """
         Set a range of control buses.
@@ -658,7 +724,8 @@ class BusGroup(ContextObject):
 
         :param values: The values to write. If a float is passed, use that as a fill.
         :param use_shared_memory: If true, use the shared memory interface.
-            Skips bundling the request in any open moment.
+            Skips bundling the request in any open moment. If ``None``, defer to
+            the context's shared memory policy.
         """
         if isinstance(values, SupportsFloat):
             if len(self) == 1:
@@ -980,6 +1047,19 @@ class Group(Node):
             group=self, include_controls=include_controls, sync=sync
         )
 
+    @property
+    def child_count(self) -> int:
+        """
+        Get the group's number of children, as currently cached on the context.
+        """
+        from .realtime import BaseServer
+
+        if not isinstance(self.context, BaseServer):
+            raise ContextError
+        if (children := self.context._node_children.get(self.id_)) is None:
+            return 0
+        return len(children)
+
     @property
     def children(self) -> list[Node]:
         """
@@ -990,14 +1070,32 @@ class Group(Node):
         if not isinstance(self.context, BaseServer):
             raise ContextError
         children: list[Node] = []
-        for id_ in self.context._node_children.get(self.id_, []):
-            if id_ in self.context._node_children:
-                children.append(Group(context=self.context, id_=id_))
-            else:
-                # cannot get synthdef name without running /g_queryTree
-                children.append(Synth(context=self.context, id_=id_, synthdef=default))
+        with self.context._lock:
+            node_children = self.context._node_children
+            for id_ in node_children.get(self.id_, ()):
+                if id_ in node_children:
+                    children.append(Group(context=self.context, id_=id_))
+                else:
+                    # cannot get synthdef name without running /g_queryTree
+                    children.append(
+                        Synth(context=self.context, id_=id_, synthdef=default)
+                    )
         return children
 
+    @property
+    def descendant_count(self) -> int:
+        """
+        Get the number of nodes in the group's subtree, excluding the group itself,
+        as currently cached on the context.
+        """
+        from .realtime import BaseServer
+
+        if not isinstance(self.context, BaseServer):
+            raise ContextError
+        if (children := self.context._node_children.get(self.id_)) is None:
+            return 0
+        return children.descendant_count
+
 
 @dataclasses.dataclass(frozen=True)
 class RootNode(Group):
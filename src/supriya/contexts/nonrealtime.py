@@ -2,47 +2,924 @@
 Tools for interacting with non-realtime execution contexts.
 """
 
+import asyncio
+import copy
 import dataclasses
+import functools
 import hashlib
 import logging
+import math
+import mmap
+import os
 import platform
 import shlex
 import shutil
 import struct
+import subprocess
+import threading
+from collections.abc import Callable, Sequence
 from collections.abc import Sequence as SequenceABC
 from contextlib import ExitStack
 from os import PathLike
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Iterator, SupportsInt, Type
+from tempfile import TemporaryDirectory, mkstemp
+from typing import Any, BinaryIO, Iterator, SupportsInt, Type, cast
 
-from ..enums import BootStatus, CalculationRate, HeaderFormat, SampleFormat
-from ..exceptions import ContextError
-from ..osc import OscBundle
-from ..scsynth import AsyncNonrealtimeProcessProtocol, Options
+from ..enums import (
+    AddAction,
+    BootStatus,
+    CalculationRate,
+    HeaderFormat,
+    RequestName,
+    SampleFormat,
+)
+from ..exceptions import AllocationError, ContextError
+from ..osc import BUNDLE_PREFIX, SECONDS_TO_NTP_TIMESTAMP, OscBundle, OscMessage
+from ..scsynth import (
+    AsyncEmbeddedNonrealtimeProcessProtocol,
+    AsyncNonrealtimeProcessProtocol,
+    Options,
+    find,
+    find_ugen_plugins_path,
+)
 from ..typing import HeaderFormatLike, SampleFormatLike, SupportsOsc
-from ..ugens import SYSTEM_SYNTHDEFS
+from ..ugens import SYSTEM_SYNTHDEFS, DiskIn, Out, SynthDef, SynthDefBuilder
+from .allocators import BlockAllocator
 from .core import Context
 from .entities import ContextObject, Node
-from .requests import DoNothing, Requestable, RequestBundle
+from .requests import (
+    DoNothing,
+    EncodedRequest,
+    Request,
+    Requestable,
+    RequestBundle,
+)
+from .timelines import (
+    BaseTimeline,
+    Timeline,
+    _encode_request,
+    _iterate_bundle_datagrams,
+    _join_completion,
+    _split_completion,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _copy_atomically(source_path: Path, target_path: Path) -> None:
+    """
+    Copy a file such that readers never observe a partially-written target.
+    """
+    file_descriptor, temporary_path = mkstemp(
+        dir=target_path.parent, prefix=f".{target_path.name}.", suffix=".tmp"
+    )
+    os.close(file_descriptor)
+    try:
+        shutil.copyfile(source_path, temporary_path)
+        os.replace(temporary_path, target_path)
+    except BaseException:
+        Path(temporary_path).unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache
+def _get_scsynth_version(executable_path: Path, modified: float) -> str:
+    try:
+        return subprocess.run(
+            [str(executable_path), "-v"],
+            capture_output=True,
+            check=False,
+            text=True,
+            timeout=10,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def _get_plugins_fingerprint(plugins_path: Path) -> str:
+    """
+    Describe every file under a plugins directory by path, size and mtime.
+
+    Directory mtimes don't change when files are rewritten in place or nested
+    directories change, so nothing cheaper than a full scan can key this. Scanning
+    via ``os.scandir()`` avoids building and resolving a ``Path`` per entry.
+    """
+    pieces: list[str] = []
+    directories = [str(plugins_path)]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    directories.append(entry.path)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    path = os.path.relpath(entry.path, plugins_path)
+                    pieces.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+    return "\n".join(sorted(pieces))
+
+
+def _get_render_environment(options: Options, embedded: bool) -> str:
+    """
+    Describe the synthesis engine and plugin set a render depends on.
+    """
+    from .. import __version__
+
+    pieces: list[str] = []
+    if embedded:
+        pieces.append(f"embedded {__version__}")
+    else:
+        try:
+            executable_path = find(options.executable).resolve()
+            pieces.append(
+                _get_scsynth_version(executable_path, executable_path.stat().st_mtime)
+            )
+        except (OSError, RuntimeError):
+            pass
+    plugins_path = (
+        Path(options.ugen_plugins_path)
+        if options.ugen_plugins_path
+        else find_ugen_plugins_path()
+    )
+    if plugins_path and plugins_path.is_dir():
+        pieces.append(_get_plugins_fingerprint(plugins_path))
+    return "\n".join(pieces)
+
+
+def _build_segment_join_synthdef(channel_count: int) -> SynthDef:
+    with SynthDefBuilder(buffer_id=0) as builder:
+        Out.ar(
+            bus=0,
+            source=DiskIn.ar(
+                buffer_id=builder["buffer_id"], channel_count=channel_count
+            ),
+        )
+    return builder.build(name=f"supriya:segment-join:{channel_count}")
+
+
+class _TimelineState:
+    """
+    Tracks the server state implied by a score's requests, to find safe cut points.
+
+    Synths and buffers carry audio state which cannot be reproduced mid-score, so a
+    cut is only safe when none are live. Everything else the score may depend on
+    across a cut - SynthDefs, control bus values and the group tree - can be replayed
+    at the start of the following segment.
+
+    Requests are tracked via their encoded datagrams, so both storage engines are
+    handled alike and replayed requests keep their payloads byte-for-byte.
+    """
+
+    _REPLAYABLE = frozenset(
+        x.value
+        for x in (
+            RequestName.CONTROL_BUS_FILL,
+            RequestName.CONTROL_BUS_SET,
+            RequestName.CONTROL_BUS_SET_CONTIGUOUS,
+            RequestName.SYNTHDEF_FREE,
+            RequestName.SYNTHDEF_FREE_ALL,
+            RequestName.SYNTHDEF_LOAD,
+            RequestName.SYNTHDEF_LOAD_DIR,
+            RequestName.SYNTHDEF_RECEIVE,
+        )
+    )
+
+    def __init__(self, release_ends_node: bool) -> None:
+        self.buffers: set[int] = set()
+        self.children: dict[int, list[int]] = {0: []}
+        self.parents: dict[int, int] = {}
+        self.group_kinds: dict[int, str] = {}
+        self.release_ends_node = release_ends_node
+        self.replayable: list[Request] = []
+
+    def _add_node(self, node_id: int, add_action: AddAction, target_id: int) -> None:
+        if add_action == AddAction.REPLACE:
+            parent_id = self.parents.get(target_id, 0)
+            siblings = self.children.setdefault(parent_id, [])
+            index = siblings.index(target_id) if target_id in siblings else 0
+            self._free_node(target_id)
+            siblings.insert(index, node_id)
+        elif add_action in (AddAction.ADD_TO_HEAD, AddAction.ADD_TO_TAIL):
+            parent_id = target_id
+            siblings = self.children.setdefault(parent_id, [])
+            if add_action == AddAction.ADD_TO_HEAD:
+                siblings.insert(0, node_id)
+            else:
+                siblings.append(node_id)
+        else:
+            parent_id = self.parents.get(target_id, 0)
+            siblings = self.children.setdefault(parent_id, [])
+            index = siblings.index(target_id) if target_id in siblings else 0
+            siblings.insert(index + (add_action == AddAction.ADD_AFTER), node_id)
+        self.parents[node_id] = parent_id
+
+    def _free_children(self, group_id: int, deep: bool) -> None:
+        for child_id in list(self.children.get(group_id, [])):
+            if deep and child_id in self.group_kinds:
+                self._free_children(child_id, deep=True)
+            else:
+                self._free_node(child_id)
+
+    def _free_node(self, node_id: int) -> None:
+        if node_id not in self.parents:
+            return
+        self._free_children(node_id, deep=False)
+        self.children.pop(node_id, None)
+        self.group_kinds.pop(node_id, None)
+        siblings = self.children.get(self.parents.pop(node_id), [])
+        if node_id in siblings:
+            siblings.remove(node_id)
+
+    def _move_node(self, node_id: int, add_action: AddAction, target_id: int) -> None:
+        if node_id not in self.parents:
+            return
+        siblings = self.children.get(self.parents.pop(node_id), [])
+        if node_id in siblings:
+            siblings.remove(node_id)
+        self._add_node(node_id, add_action, target_id)
+
+    def apply(self, request: Requestable) -> None:
+        self.apply_datagram(_encode_request(request))
+
+    def apply_datagram(self, datagram: bytes) -> None:
+        if datagram.startswith(BUNDLE_PREFIX):
+            for x in _iterate_bundle_datagrams(datagram):
+                self.apply_datagram(x)
+            return
+        datagram, completion = _split_completion(datagram)
+        message = OscMessage.from_datagram(datagram)
+        address = message.address
+        contents = cast(Sequence[int | str], message.contents)
+        if address in self._REPLAYABLE:
+            self.replayable.append(EncodedRequest(datagram))
+        elif address in ("/g_new", "/p_new"):
+            for i in range(0, len(contents), 3):
+                group_id, add_action, target_id = contents[i : i + 3]
+                self._add_node(
+                    int(group_id), AddAction(int(add_action)), int(target_id)
+                )
+                self.group_kinds[int(group_id)] = str(address)
+        elif address == "/s_new":
+            synth_id, add_action, target_id = contents[1:4]
+            self._add_node(int(synth_id), AddAction(int(add_action)), int(target_id))
+        elif address == "/n_free":
+            for node_id in contents:
+                self._free_node(int(node_id))
+        elif address == "/n_set":
+            # releasing a gated synth, which may or may not end within the tail
+            if self.release_ends_node and tuple(contents[1:]) == ("gate", 0):
+                self._free_node(int(contents[0]))
+        elif address in ("/g_freeAll", "/g_deepFree"):
+            for node_id in contents:
+                self._free_children(int(node_id), deep=address == "/g_deepFree")
+        elif address in ("/n_after", "/n_before"):
+            add_action = (
+                AddAction.ADD_AFTER if address == "/n_after" else AddAction.ADD_BEFORE
+            )
+            for i in range(0, len(contents), 2):
+                self._move_node(int(contents[i]), add_action, int(contents[i + 1]))
+        elif address in ("/g_head", "/g_tail"):
+            add_action = (
+                AddAction.ADD_TO_HEAD if address == "/g_head" else AddAction.ADD_TO_TAIL
+            )
+            for i in range(0, len(contents), 2):
+                self._move_node(int(contents[i + 1]), add_action, int(contents[i]))
+        elif address == "/n_order":
+            add_action, target_id = AddAction(int(contents[0])), int(contents[1])
+            for node_id in contents[2:]:
+                self._move_node(int(node_id), add_action, target_id)
+                add_action, target_id = AddAction.ADD_AFTER, int(node_id)
+        elif address in ("/b_alloc", "/b_allocRead", "/b_allocReadChannel"):
+            self.buffers.add(int(contents[0]))
+        elif address == "/b_free":
+            self.buffers.discard(int(contents[0]))
+        if completion is not None:
+            self.apply_datagram(completion)
+
+    def get_replay(self) -> list[Request]:
+        """
+        Get requests recreating the replayable state in a fresh server.
+        """
+        requests = list(self.replayable)
+        stack = list(reversed(self.children.get(0, [])))
+        while stack:
+            node_id = stack.pop()
+            requests.append(
+                EncodedRequest(
+                    OscMessage(
+                        self.group_kinds[node_id],
+                        node_id,
+                        AddAction.ADD_TO_TAIL.value,
+                        self.parents[node_id],
+                    ).to_datagram()
+                )
+            )
+            stack.extend(reversed(self.children.get(node_id, [])))
+        return requests
+
+    @property
+    def is_quiescent(self) -> bool:
+        """
+        True if no synths or buffers are live.
+        """
+        return not self.buffers and len(self.parents) == len(self.group_kinds)
+
+
+class _IdRemapper:
+    """
+    Remaps node, buffer and bus IDs in encoded requests.
+
+    IDs are remapped where the protocol fixes their position, and wherever synth
+    controls are mapped to buses via ``"c<bus>"`` or ``"a<bus>"``. Numeric synth
+    controls are only remapped when named in one of the ``*_controls`` collections,
+    as nothing else distinguishes a buffer ID from any other number.
+    """
+
+    _BUFFER_ADDRESSES = frozenset(
+        x.value
+        for x in (
+            RequestName.BUFFER_ALLOCATE,
+            RequestName.BUFFER_ALLOCATE_READ,
+            RequestName.BUFFER_ALLOCATE_READ_CHANNEL,
+            RequestName.BUFFER_CLOSE,
+            RequestName.BUFFER_FILL,
+            RequestName.BUFFER_FREE,
+            RequestName.BUFFER_GET,
+            RequestName.BUFFER_GET_CONTIGUOUS,
+            RequestName.BUFFER_READ,
+            RequestName.BUFFER_READ_CHANNEL,
+            RequestName.BUFFER_SET,
+            RequestName.BUFFER_SET_CONTIGUOUS,
+            RequestName.BUFFER_WRITE,
+            RequestName.BUFFER_ZERO,
+        )
+    )
+
+    _NODE_LIST_ADDRESSES = frozenset(
+        ["/g_deepFree", "/g_freeAll", "/n_free", "/n_query", "/n_trace", "/s_noid"]
+    )
+
+    _NODE_PAIR_ADDRESSES = frozenset(["/g_head", "/g_tail", "/n_after", "/n_before"])
+
+    def __init__(
+        self,
+        node_ids: Callable[[int], int],
+        buffer_ids: Callable[[int], int],
+        audio_bus_ids: Callable[[int], int],
+        control_bus_ids: Callable[[int], int],
+        audio_bus_controls: Sequence[str] = (),
+        buffer_controls: Sequence[str] = (),
+        control_bus_controls: Sequence[str] = (),
+    ) -> None:
+        self.node_ids = node_ids
+        self.buffer_ids = buffer_ids
+        self.audio_bus_ids = audio_bus_ids
+        self.control_bus_ids = control_bus_ids
+        self.numeric_controls: dict[str, Callable[[int], int]] = {
+            **{name: audio_bus_ids for name in audio_bus_controls},
+            **{name: buffer_ids for name in buffer_controls},
+            **{name: control_bus_ids for name in control_bus_controls},
+        }
+
+    def _remap_control_value(self, name: Any, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self._remap_control_value(name, x) for x in value]
+        if isinstance(value, str) and value[:1] in ("a", "c"):
+            remap = self.audio_bus_ids if value[0] == "a" else self.control_bus_ids
+            return f"{value[0]}{remap(int(value[1:]))}"
+        if isinstance(value, (float, int)) and (
+            remap_ := self.numeric_controls.get(name)
+        ):
+            return type(value)(remap_(int(value)))
+        return value
+
+    def _remap_controls(self, contents: list[Any], start: int) -> None:
+        for i in range(start + 1, len(contents), 2):
+            contents[i] = self._remap_control_value(contents[i - 1], contents[i])
+
+    def _remap_every(self, contents: list[Any], remap, start: int, step: int) -> None:
+        for i in range(start, len(contents), step):
+            contents[i] = remap(contents[i])
+
+    def _remap_contents(self, address: str, contents: list[Any]) -> None:
+        if address in ("/g_new", "/p_new"):
+            self._remap_every(contents, self.node_ids, 0, 3)
+            self._remap_every(contents, self.node_ids, 2, 3)
+        elif address == "/s_new":
+            contents[1] = self.node_ids(contents[1])
+            contents[3] = self.node_ids(contents[3])
+            self._remap_controls(contents, 4)
+        elif address == "/n_set":
+            contents[0] = self.node_ids(contents[0])
+            self._remap_controls(contents, 1)
+        elif address in ("/n_fill", "/n_setn", "/s_get", "/s_getn"):
+            contents[0] = self.node_ids(contents[0])
+        elif address in ("/n_map", "/n_mapn", "/n_mapa", "/n_mapan"):
+            contents[0] = self.node_ids(contents[0])
+            remap = self.audio_bus_ids if "mapa" in address else self.control_bus_ids
+            step = 3 if address.endswith("n") else 2
+            self._remap_every(contents, remap, 2, step)
+        elif address in self._NODE_LIST_ADDRESSES | self._NODE_PAIR_ADDRESSES:
+            self._remap_every(contents, self.node_ids, 0, 1)
+        elif address in ("/g_dumpTree", "/g_queryTree", "/n_run"):
+            self._remap_every(contents, self.node_ids, 0, 2)
+        elif address == "/n_order":
+            self._remap_every(contents, self.node_ids, 1, 1)
+        elif address in self._BUFFER_ADDRESSES:
+            contents[0] = self.buffer_ids(contents[0])
+        elif address == "/b_query":
+            self._remap_every(contents, self.buffer_ids, 0, 1)
+        elif address == "/b_gen":
+            contents[0] = self.buffer_ids(contents[0])
+            if contents[1] == "copy":
+                contents[3] = self.buffer_ids(contents[3])
+        elif address in ("/c_set", "/c_getn"):
+            self._remap_every(contents, self.control_bus_ids, 0, 2)
+        elif address == "/c_get":
+            self._remap_every(contents, self.control_bus_ids, 0, 1)
+        elif address == "/c_fill":
+            self._remap_every(contents, self.control_bus_ids, 0, 3)
+        elif address == "/c_setn":
+            i = 0
+            while i < len(contents):
+                count = contents[i + 1]
+                contents[i] = self.control_bus_ids(contents[i])
+                i += 2 + count
+
+    def remap(self, datagram: bytes) -> bytes:
+        if datagram.startswith(BUNDLE_PREFIX):
+            pieces = [datagram[:16]]  # prefix and timetag
+            for x in _iterate_bundle_datagrams(datagram):
+                x = self.remap(x)
+                pieces.extend([struct.pack(">i", len(x)), x])
+            return b"".join(pieces)
+        prefix, completion = _split_completion(datagram)
+        address = prefix[: prefix.index(b"\x00")].decode()
+        # only decode messages which may carry IDs, keeping others byte-for-byte
+        if address[:3] in ("/b_", "/c_", "/g_", "/n_", "/p_", "/s_"):
+            contents = list(OscMessage.from_datagram(prefix).contents)
+            self._remap_contents(address, contents)
+            prefix = OscMessage(address, *contents).to_datagram()
+        if completion is None:
+            return prefix
+        return _join_completion(prefix, self.remap(completion))
+
+
+@dataclasses.dataclass
+class RenderCacheStatistics:
+    """
+    Counters describing a :py:class:`RenderCache`'s activity.
+    """
+
+    evictions: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+class RenderCache:
+    """
+    A content-addressed cache of rendered scores.
+
+    Entries are keyed on the score's render digest, plus the engine version and plugin
+    set. Files are written atomically, so concurrent renderers sharing a directory
+    never observe partial output. Once the cache outgrows ``maximum_size`` bytes, the
+    least-recently-used entries are evicted.
+
+    :param directory_path: The directory to store rendered files in.
+    :param maximum_size: The cache's size limit in bytes, or ``None`` for no limit.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self, directory_path: PathLike, maximum_size: int | None = 2**30
+    ) -> None:
+        self._directory_path = Path(directory_path)
+        self._lock = threading.Lock()
+        self._statistics = RenderCacheStatistics()
+        self.maximum_size = maximum_size
+
+    ### PRIVATE METHODS ###
+
+    def _evict(self, keep: Path) -> None:
+        if self.maximum_size is None:
+            return
+        entries: list[tuple[float, int, Path]] = []
+        total_size = 0
+        for path in self._directory_path.glob("score-*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # evicted concurrently
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+        for _, size, path in sorted(entries):
+            if total_size <= self.maximum_size:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total_size -= size
+            with self._lock:
+                self._statistics.evictions += 1
+
+    def _get_path(self, key: str, suffix: str) -> Path:
+        return self._directory_path / f"score-{key}.{suffix}"
+
+    ### PUBLIC METHODS ###
+
+    def clear(self) -> None:
+        """
+        Remove all cached files.
+        """
+        for path in self._directory_path.glob("score-*"):
+            path.unlink(missing_ok=True)
+
+    def get(self, key: str, suffix: str) -> Path | None:
+        """
+        Look up a cached file, marking it as recently used.
+
+        :param key: The cache key.
+        :param suffix: The file suffix, i.e. the header format.
+        """
+        path = self._get_path(key, suffix)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._statistics.misses += 1
+            return None
+        with self._lock:
+            self._statistics.hits += 1
+        return path
+
+    def get_key(self, digest: str, *parts: str) -> str:
+        """
+        Build a cache key from a render digest and anything else the output depends
+        on.
+
+        :param digest: The render digest.
+        :param parts: Additional parts to key on.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(digest.encode())
+        for part in parts:
+            hasher.update(b"\0")
+            hasher.update(part.encode())
+        return hasher.hexdigest()
+
+    def put(self, key: str, suffix: str, source_path: Path) -> Path:
+        """
+        Store a rendered file in the cache.
+
+        :param key: The cache key.
+        :param suffix: The file suffix, i.e. the header format.
+        :param source_path: The rendered file to copy into the cache.
+        """
+        self._directory_path.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(key, suffix)
+        _copy_atomically(source_path, path)
+        self._evict(keep=path)
+        return path
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self) -> Path:
+        """
+        Get the cache's directory path.
+        """
+        return self._directory_path
+
+    @property
+    def size(self) -> int:
+        """
+        Get the total size in bytes of all cached files.
+        """
+        return sum(path.stat().st_size for path in self._directory_path.glob("score-*"))
+
+    @property
+    def statistics(self) -> RenderCacheStatistics:
+        """
+        Get the cache's hit, miss and eviction statistics.
+        """
+        return self._statistics
+
+
+async def _render(
+    write_commands: Callable[[BinaryIO, "hashlib._Hash"], None],
+    output_file_path: PathLike | None,
+    *,
+    cache: RenderCache | bool,
+    embedded: bool,
+    header_format: HeaderFormatLike,
+    input_file_path: PathLike | None,
+    options: Options,
+    render_directory_path: PathLike | None,
+    sample_format: SampleFormatLike,
+    sample_rate: float,
+    suppress_output: bool,
+) -> tuple[Path | None, int]:
+    """
+    Render a command file, streamed into the render directory by ``write_commands``.
+    """
+    from .. import output_path, render_cache
+
+    # validate inputs
+    header_format_ = HeaderFormat.from_expr(header_format).name.lower()
+    sample_format_ = SampleFormat.from_expr(sample_format).name.lower()
+    # build initial command
+    command = [] if embedded else options.serialize()
+    # embedded renders have no executable to find, so hash the options instead
+    options_key = (
+        repr(dataclasses.replace(options, executable=None))
+        if embedded
+        else " ".join(command[1:])
+    )
+    # resolve render cache
+    render_cache_: RenderCache | None = None
+    if not suppress_output:
+        render_cache_ = render_cache if cache is True else (cache or None)
+    exit_stack = ExitStack()
+    with exit_stack:
+        # setup render directory
+        if render_directory_path:
+            render_directory_path_ = Path(render_directory_path).resolve()
+        else:
+            render_directory_path_ = Path(
+                exit_stack.enter_context(TemporaryDirectory())
+            )
+        logger.info(f"Render directory: {render_directory_path_}")
+        # calculate input path relative to render directory
+        input_file_path_ = "_"  # underscore, not dash
+        if input_file_path:
+            input_file_path_ = str(Path(input_file_path).resolve())
+        # stream the command file to disk, hashing it along the way
+        file_descriptor, temporary_path = mkstemp(
+            dir=render_directory_path_, prefix=".score-", suffix=".osc"
+        )
+        exit_stack.callback(Path(temporary_path).unlink, missing_ok=True)
+        hasher = hashlib.sha256()
+
+        def write_command_file() -> None:
+            with open(file_descriptor, "wb") as file_pointer:
+                write_commands(file_pointer, hasher)
+
+        # long scores take a while to encode, so keep the write off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, write_command_file)
+        # build file name
+        hasher.update(options_key.encode())
+        hasher.update(input_file_path_.encode())
+        hasher.update(str(sample_rate).encode())
+        digest = hasher.hexdigest()
+        # build render file path and output file path
+        if suppress_output:
+            render_file_name = "NUL" if platform.system() == "Windows" else "/dev/null"
+            output_file_path_ = None
+        else:
+            render_file_name = f"score-{digest}.{header_format_}"
+            output_file_path_ = Path(
+                output_file_path or (output_path / render_file_name)
+            )
+        # consult render cache
+        if render_cache_ and output_file_path_:
+            cache_key = render_cache_.get_key(
+                digest,
+                header_format_,
+                sample_format_,
+                _get_render_environment(options, embedded),
+            )
+            if cached_path := render_cache_.get(cache_key, header_format_):
+                logger.info(f"Render cache hit: {cached_path}")
+                if output_file_path_.resolve() != cached_path.resolve():
+                    _copy_atomically(cached_path, output_file_path_)
+                return output_file_path_, 0
+        # move .osc file into place
+        osc_file_name = f"score-{digest}.osc"
+        os.replace(temporary_path, render_directory_path_ / osc_file_name)
+        # build nonrealtime arguments
+        arguments = [
+            osc_file_name,
+            input_file_path_,
+            render_file_name,
+            str(sample_rate),
+            header_format_,
+            sample_format_,
+        ]
+        # render the command file
+        protocol: (
+            AsyncEmbeddedNonrealtimeProcessProtocol | AsyncNonrealtimeProcessProtocol
+        )
+        if embedded:
+            protocol = AsyncEmbeddedNonrealtimeProcessProtocol()
+            await protocol.run(options, arguments, render_directory_path_)
+        else:
+            protocol = AsyncNonrealtimeProcessProtocol()
+            await protocol.run([*command, "-N", *arguments], render_directory_path_)
+        exit_code: int = await protocol.exit_future
+        if output_file_path_:
+            _copy_atomically(
+                render_directory_path_ / render_file_name, output_file_path_
+            )
+            if render_cache_ and not exit_code:
+                render_cache_.put(cache_key, header_format_, output_file_path_)
+    return output_file_path_, exit_code
+
+
+class CommandFile:
+    """
+    A memory-mapped reader for non-realtime ``.osc`` command files.
+
+    Bundles are located by scanning their length prefixes, and only decoded when
+    accessed, so large command files can be inspected or re-rendered without decoding
+    them in full.
+
+    :param file_path: The command file to read.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, file_path: PathLike) -> None:
+        self._file_path = Path(file_path)
+        self._data: mmap.mmap | bytes | None = None
+        self._offsets: list[int] = []
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "CommandFile":
+        return self.open()
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __getitem__(self, index: int) -> OscBundle:
+        # non-realtime timestamps are relative, not offset from the NTP epoch
+        return OscBundle(
+            contents=OscBundle.from_datagram(self._get_datagram(index)).contents,
+            timestamp=self._get_timestamp(index),
+        )
+
+    def __iter__(self) -> Iterator[OscBundle]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        self._get_data()
+        return len(self._offsets)
+
+    ### PRIVATE METHODS ###
+
+    def _get_data(self) -> mmap.mmap | bytes:
+        if self._data is None:
+            raise ValueError("Command file not open")
+        return self._data
+
+    def _get_datagram(self, index: int) -> bytes:
+        data = self._get_data()
+        offset = self._offsets[index]
+        (length,) = struct.unpack_from(">i", data, offset)
+        return data[offset + 4 : offset + 4 + length]
+
+    def _get_timestamp(self, index: int) -> float:
+        data = self._get_data()
+        # skip the length prefix and "#bundle\0"
+        (timetag,) = struct.unpack_from(">Q", data, self._offsets[index] + 12)
+        return timetag / SECONDS_TO_NTP_TIMESTAMP
+
+    def _write_datagrams(self, file_pointer: BinaryIO, hasher: "hashlib._Hash") -> None:
+        data = self._get_data()
+        chunk_size = 1 << 20
+        for offset in range(0, len(data), chunk_size):
+            chunk = data[offset : offset + chunk_size]
+            file_pointer.write(chunk)
+            hasher.update(chunk)
+
+    ### PUBLIC METHODS ###
+
+    def close(self) -> None:
+        """
+        Close the command file.
+        """
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = None
+        self._offsets = []
+
+    def iterate_datagrams(self) -> Iterator[bytes]:
+        """
+        Iterate datagrams, without decoding them.
+        """
+        for index in range(len(self)):
+            yield self._get_datagram(index)
+
+    def open(self) -> "CommandFile":
+        """
+        Open the command file and index its bundles.
+        """
+        if self._data is not None:
+            return self
+        with self._file_path.open("rb") as file_pointer:
+            if os.fstat(file_pointer.fileno()).st_size:
+                self._data = mmap.mmap(
+                    file_pointer.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            else:
+                self._data = b""  # empty files can't be mapped
+        offset, size = 0, len(self._data)
+        while offset < size:
+            if offset + 4 > size:
+                self.close()
+                raise ValueError(f"Truncated command file: {self._file_path}")
+            length = struct.unpack_from(">i", self._data, offset)[0]
+            # every bundle carries at least a prefix and timetag, and corrupt negative
+            # lengths would otherwise never advance
+            if length < len(BUNDLE_PREFIX) + 8:
+                self.close()
+                raise ValueError(f"Truncated command file: {self._file_path}")
+            self._offsets.append(offset)
+            offset += 4 + length
+        if offset != size:
+            self.close()
+            raise ValueError(f"Truncated command file: {self._file_path}")
+        return self
+
+    async def render(
+        self,
+        output_file_path: PathLike | None = None,
+        *,
+        cache: RenderCache | bool = True,
+        embedded: bool = False,
+        header_format: HeaderFormatLike = HeaderFormat.AIFF,
+        input_file_path: PathLike | None = None,
+        options: Options | None = None,
+        render_directory_path: PathLike | None = None,
+        sample_format: SampleFormatLike = SampleFormat.INT24,
+        sample_rate: float = 44100,
+        suppress_output: bool = False,
+        **kwargs,
+    ) -> tuple[Path | None, int]:
+        """
+        Render the command file.
+
+        Hashes, and therefore output paths and cache entries, match those of
+        :py:meth:`Score.render` for the score the command file was written from.
+
+        See :py:meth:`Score.render` for parameters.
+        """
+        self._get_data()
+        return await _render(
+            self._write_datagrams,
+            output_file_path,
+            cache=cache,
+            embedded=embedded,
+            header_format=header_format,
+            input_file_path=input_file_path,
+            options=dataclasses.replace(options or Options(), **kwargs, realtime=False),
+            render_directory_path=render_directory_path,
+            sample_format=sample_format,
+            sample_rate=sample_rate,
+            suppress_output=suppress_output,
+        )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def file_path(self) -> Path:
+        """
+        Get the command file's path.
+        """
+        return self._file_path
+
+    @property
+    def timestamps(self) -> list[float]:
+        """
+        Get the timestamps of the command file's bundles, without decoding them.
+        """
+        return [self._get_timestamp(index) for index in range(len(self))]
+
+
 class Score(Context):
     """
     A non-realtime execution context.
 
     :param options: The context's options.
+    :param timeline: The timeline to store requests in, defaulting to a
+        :py:class:`~supriya.contexts.timelines.Timeline` of request objects. Use an
+        :py:class:`~supriya.contexts.timelines.EncodedTimeline` to store large scores
+        compactly.
     :param kwargs: Keyword arguments for options.
     """
 
     ### INITIALIZER ###
 
-    def __init__(self, options: Options | None = None, **kwargs) -> None:
+    def __init__(
+        self,
+        options: Options | None = None,
+        timeline: BaseTimeline | None = None,
+        **kwargs,
+    ) -> None:
         super().__init__(options=options, **kwargs)
         self._boot_status: BootStatus = BootStatus.ONLINE
-        self._requests: dict[float, list[Requestable]] = {}
+        self._timeline = timeline if timeline is not None else Timeline()
         self._setup_allocators()
 
     ### CLASS METHODS ###
@@ -65,6 +942,17 @@ class Score(Context):
 
     ### PRIVATE METHODS ###
 
+    def _clone(self) -> "Score":
+        score = Score(options=self._options, timeline=type(self._timeline)())
+        for name in (
+            "_audio_bus_allocator",
+            "_buffer_allocator",
+            "_control_bus_allocator",
+            "_node_id_allocator",
+        ):
+            setattr(score, name, copy.deepcopy(getattr(self, name)))
+        return score
+
     def _free_id(
         self,
         type_: Type[ContextObject],
@@ -73,11 +961,104 @@ class Score(Context):
     ) -> None:
         pass
 
+    def _iterate_timeline(
+        self, until: float | None, encoded: bool
+    ) -> Iterator[tuple[float, list[Any]]]:
+        items: Iterator[tuple[float, list[Any]]] = (
+            self._timeline.iterate_encoded() if encoded else self._timeline.iterate()
+        )
+        do_nothing = _encode_request(DoNothing()) if encoded else DoNothing()
+        timestamp = 0.0
+        for timestamp, requests in items:
+            if until:
+                if timestamp == until:
+                    yield timestamp, [*requests, do_nothing]
+                    return
+                elif timestamp > until:
+                    yield until, [do_nothing]
+                    return
+            if requests:
+                yield timestamp, requests
+        if until and until > timestamp:
+            yield until, [do_nothing]
+
+    @staticmethod
+    def _reserve_block(
+        target: BlockAllocator, source: BlockAllocator
+    ) -> Callable[[int], int]:
+        if (used_range := source.used_range) is None:
+            return lambda x: x
+        start, stop = used_range
+        if (base := target.allocate(stop - start)) is None:
+            raise AllocationError
+        delta = base - start
+        return lambda x: x + delta if start <= x < stop else x
+
+    def _reserve_node_ids(self, source: "Score") -> Callable[[int], int]:
+        start, stop = source._node_id_allocator.used_node_id_range
+        delta = 0
+        if stop > start:
+            delta = self._node_id_allocator.allocate_node_id(stop - start) - start
+        permanent_ids = {
+            x: self._node_id_allocator.allocate_permanent_node_id()
+            for x in source._node_id_allocator.used_permanent_node_ids
+        }
+        return lambda x: x + delta if start <= x < stop else permanent_ids.get(x, x)
+
     def _resolve_node(self, node: Node | SupportsInt | None) -> int:
         if node is None:
             return 0
         return int(node)
 
+    def _split(
+        self,
+        count: int,
+        duration: float,
+        sample_rate: float,
+        block_size: int,
+        tail: float,
+    ) -> list[tuple[float, float, "Score"]]:
+        """
+        Split the score at safe cut points into at most ``count`` segments.
+
+        Each segment is a triple of its block-aligned offset into the score, its
+        duration, and a score which replays the state at the cut before continuing.
+        """
+        state = _TimelineState(release_ends_node=tail > 0)
+        replays: dict[float, list[Request]] = {}
+        for timestamp, datagrams in self._timeline.iterate_encoded(stop=duration):
+            if 0 < timestamp and state.is_quiescent:
+                replays[timestamp] = state.get_replay()
+            for datagram in datagrams:
+                state.apply_datagram(datagram)
+        # pick the safe cuts nearest evenly-spaced targets
+        cuts: list[float] = []
+        for i in range(1, count):
+            if not (candidates := [x for x in replays if not cuts or x > cuts[-1]]):
+                break
+            cut = min(candidates, key=lambda x: abs(x - duration * i / count))
+            if cut not in cuts:
+                cuts.append(cut)
+        segments: list[tuple[float, float, Score]] = []
+        block_duration = block_size / sample_rate
+        for start, stop in zip([0.0, *cuts], [*cuts, duration]):
+            offset = math.floor(start / block_duration) * block_duration
+            segment = Score(options=self._options, timeline=type(self._timeline)())
+            if replay := replays.get(start):
+                segment.send(RequestBundle(timestamp=0.0, contents=replay))
+            for timestamp, datagrams in self._timeline.iterate_encoded(start, stop):
+                segment.send(
+                    RequestBundle(
+                        timestamp=timestamp - offset,
+                        contents=[EncodedRequest(x) for x in datagrams],
+                    )
+                )
+            segment_duration = stop - offset
+            if stop < duration:
+                segment_duration += tail
+            segments.append((offset, segment_duration, segment))
+        return segments
+
     def _validate_can_request(self) -> None:
         if self._get_moment() is None:
             raise ContextError
@@ -86,13 +1067,26 @@ class Score(Context):
         if seconds is None or seconds < 0:
             raise ContextError
 
+    def _write_datagrams(
+        self,
+        file_pointer: BinaryIO,
+        hasher: "hashlib._Hash",
+        until: float | None = None,
+    ) -> None:
+        for datagram in self.iterate_datagrams(until=until):
+            for piece in (struct.pack(">i", len(datagram)), datagram):
+                file_pointer.write(piece)
+                hasher.update(piece)
+
     ### PUBLIC METHODS ###
 
     async def render(
         self,
         output_file_path: PathLike | None = None,
         *,
+        cache: RenderCache | bool = True,
         duration: float | None = None,
+        embedded: bool = False,
         header_format: HeaderFormatLike = HeaderFormat.AIFF,
         input_file_path: PathLike | None = None,
         options: Options | None = None,
@@ -105,7 +1099,11 @@ class Score(Context):
         """
         Render the score.
 
+        :param cache: The render cache to consult, ``True`` for the default
+            ``supriya.render_cache``, or ``False`` to always render.
         :param duration: Optional duration to render the score until.
+        :param embedded: Flag for rendering through the embedded libscsynth in a pool
+            of worker processes rather than spawning ``scsynth``.
         :param header_format: The :term:`header format` to render with.
         :param input_file_path: The input file to render with.
         :param options: The context's options.
@@ -123,87 +1121,36 @@ class Score(Context):
             of the score's datagram, its input file (if provided) and any flags to
             ``scsynth`` that affect rendering.
         """
-        from .. import output_path
-
-        # validate inputs
-        header_format_ = HeaderFormat.from_expr(header_format).name.lower()
-        sample_format_ = SampleFormat.from_expr(sample_format).name.lower()
-        # build initial command
-        command = dataclasses.replace(
-            options or self._options, **kwargs, realtime=False
-        ).serialize()
-        # build datagram
-        datagram_pieces: list[bytes] = []
-        for datagram_piece in self.iterate_datagrams(until=duration):
-            datagram_pieces.append(struct.pack(">i", len(datagram_piece)))
-            datagram_pieces.append(datagram_piece)
-        datagram = b"".join(datagram_pieces)
-        # setup render directory
-        exit_stack = ExitStack()
-        with exit_stack:
-            # setup render directory
-            if render_directory_path:
-                render_directory_path_ = Path(render_directory_path).resolve()
-            else:
-                render_directory_path_ = Path(
-                    exit_stack.enter_context(TemporaryDirectory())
-                )
-            logger.info(f"Render directory: {render_directory_path_}")
-            # calculate input path relative to render directory
-            input_file_path_ = "_"  # underscore, not dash
-            if input_file_path:
-                input_file_path_ = str(Path(input_file_path).resolve())
-            # build file name
-            hasher = hashlib.sha256()
-            hasher.update(datagram)
-            hasher.update((" ".join(command[1:])).encode())
-            hasher.update(input_file_path_.encode())
-            hasher.update(str(sample_rate).encode())
-            digest = hasher.hexdigest()
-            # build render file path and output file path
-            if suppress_output:
-                render_file_name = (
-                    "NUL" if platform.system() == "Windows" else "/dev/null"
-                )
-                output_file_path_ = None
-            else:
-                render_file_name = f"score-{digest}.{header_format_}"
-                output_file_path_ = Path(
-                    output_file_path or (output_path / render_file_name)
-                )
-            # write .osc file
-            osc_file_name = f"score-{digest}.osc"
-            (render_directory_path_ / osc_file_name).write_bytes(datagram)
-            # build nonrealtime command
-            command.extend(
-                [
-                    "-N",
-                    osc_file_name,
-                    input_file_path_,
-                    render_file_name,
-                    str(sample_rate),
-                    header_format_,
-                    sample_format_,
-                ]
-            )
-            # render the datagram
-            protocol = AsyncNonrealtimeProcessProtocol()
-            await protocol.run(command, render_directory_path_)
-            exit_code: int = await protocol.exit_future
-            if output_file_path_:
-                shutil.copy(
-                    render_directory_path_ / render_file_name, output_file_path_
-                )
-        return output_file_path_, exit_code
+        return await _render(
+            functools.partial(self._write_datagrams, until=duration),
+            output_file_path,
+            cache=cache,
+            embedded=embedded,
+            header_format=header_format,
+            input_file_path=input_file_path,
+            options=dataclasses.replace(
+                options or self._options, **kwargs, realtime=False
+            ),
+            render_directory_path=render_directory_path,
+            sample_format=sample_format,
+            sample_rate=sample_rate,
+            suppress_output=suppress_output,
+        )
 
     def iterate_datagrams(self, until: float | None = None) -> Iterator[bytes]:
         """
         Iterate datagrams.
 
+        Bundles are assembled from the timeline's encoded requests, without building
+        intermediate request or OSC objects.
+
         :param until: Timestamp to stop iterating at.
         """
-        for osc_bundle in self.iterate_osc_bundles(until=until):
-            yield osc_bundle.to_datagram(realtime=False)
+        for timestamp, datagrams in self._iterate_timeline(until, encoded=True):
+            pieces = [BUNDLE_PREFIX, OscBundle._encode_date(timestamp, realtime=False)]
+            for datagram in datagrams:
+                pieces.extend([struct.pack(">i", len(datagram)), datagram])
+            yield b"".join(pieces)
 
     def iterate_osc_bundles(self, until: float | None = None) -> Iterator[OscBundle]:
         """
@@ -222,20 +1169,233 @@ class Score(Context):
 
         :param until: Timestamp to stop iterating at.
         """
-        for timestamp, requests in sorted(self._requests.items()):
-            if until:
-                if timestamp == until:
-                    yield RequestBundle(
-                        timestamp=timestamp, contents=requests + [DoNothing()]
+        for timestamp, requests in self._iterate_timeline(until, encoded=False):
+            yield RequestBundle(timestamp=timestamp, contents=requests)
+
+    def merge(
+        self,
+        score: "Score",
+        offset: float = 0.0,
+        *,
+        audio_bus_controls: Sequence[str] = (),
+        buffer_controls: Sequence[str] = (),
+        control_bus_controls: Sequence[str] = (),
+    ) -> None:
+        """
+        Merge another score's requests into this score.
+
+        The other score's node, buffer and bus IDs are remapped in bulk into ranges
+        reserved in this score's allocators, so merged scores never collide. Requests
+        are remapped in their encoded form, rather than replayed through the context.
+
+        Mapped bus controls (``"c0"``, ``"a16"``) are remapped automatically. Numeric
+        synth controls can't be told apart from IDs, so only those named are remapped.
+
+        :param score: The score to merge in.
+        :param offset: The time in seconds to merge the score in at.
+        :param audio_bus_controls: Names of synth controls holding audio bus IDs.
+        :param buffer_controls: Names of synth controls holding buffer IDs.
+        :param control_bus_controls: Names of synth controls holding control bus IDs.
+        """
+        if offset < 0:
+            raise ValueError(offset)
+        remapper = _IdRemapper(
+            node_ids=self._reserve_node_ids(score),
+            buffer_ids=self._reserve_block(
+                self._buffer_allocator, score._buffer_allocator
+            ),
+            audio_bus_ids=self._reserve_block(
+                self._audio_bus_allocator, score._audio_bus_allocator
+            ),
+            control_bus_ids=self._reserve_block(
+                self._control_bus_allocator, score._control_bus_allocator
+            ),
+            audio_bus_controls=audio_bus_controls,
+            buffer_controls=buffer_controls,
+            control_bus_controls=control_bus_controls,
+        )
+        for timestamp, datagrams in score._timeline.iterate_encoded():
+            self._timeline.add(
+                timestamp + offset,
+                [EncodedRequest(remapper.remap(x)) for x in datagrams],
+            )
+
+    async def render_segmented(
+        self,
+        output_file_path: PathLike | None = None,
+        *,
+        cache: RenderCache | bool = True,
+        duration: float | None = None,
+        embedded: bool = False,
+        header_format: HeaderFormatLike = HeaderFormat.AIFF,
+        maximum_concurrency: int | None = None,
+        options: Options | None = None,
+        render_directory_path: PathLike | None = None,
+        sample_format: SampleFormatLike = SampleFormat.INT24,
+        sample_rate: float = 44100,
+        segment_count: int | None = None,
+        tail: float = 0.0,
+        **kwargs,
+    ) -> tuple[Path | None, int]:
+        """
+        Render the score in concurrently-rendered segments.
+
+        The score is cut only where no synths or buffers are live, so no audio state
+        crosses a cut. SynthDefs, control bus values and groups live at a cut are
+        replayed at the start of the following segment. Segments are rendered in
+        parallel, then mixed back together sample-accurately by a final render which
+        streams each segment from disk at its block-aligned offset.
+
+        Falls back to :py:meth:`render` if the score has no safe cut points.
+
+        :param cache: The render cache to consult for the joined output. Segments
+            are rendered into a temporary directory, and never cached.
+        :param duration: Optional duration to render the score until.
+        :param embedded: Flag for rendering through the embedded libscsynth.
+        :param header_format: The :term:`header format` to render with.
+        :param maximum_concurrency: The maximum number of segments to render at once,
+            defaulting to the CPU count.
+        :param options: The context's options.
+        :param render_directory_path: The directory to render the output in.
+        :param sample_format: The :term:`sample format` to render with.
+        :param sample_rate: The sample rate to render at.
+        :param segment_count: The number of segments to aim for, defaulting to the
+            maximum concurrency.
+        :param tail: Seconds to keep rendering each segment past its cut. Releasing a
+            gated node is treated as ending it when the tail is non-zero, so the tail
+            should cover the longest release.
+        :param kwargs: Keyword arguments for options.
+
+        :return: A pair of the output path (if output exists) and the process exit code.
+        """
+        if tail < 0:
+            raise ValueError(tail)
+        options_ = dataclasses.replace(
+            options or self._options, **kwargs, realtime=False
+        )
+        maximum_concurrency_ = maximum_concurrency or os.cpu_count() or 1
+        duration_ = duration or (self._timeline.timestamps or [0.0])[-1]
+        segments = self._split(
+            count=segment_count or maximum_concurrency_,
+            duration=duration_,
+            sample_rate=sample_rate,
+            block_size=options_.block_size,
+            tail=tail,
+        )
+        render_kwargs: dict[str, Any] = {
+            "embedded": embedded,
+            "options": options_,
+            "render_directory_path": render_directory_path,
+            "sample_rate": sample_rate,
+        }
+        if len(segments) < 2:
+            return await self.render(
+                output_file_path,
+                cache=cache,
+                duration=duration,
+                header_format=header_format,
+                sample_format=sample_format,
+                **render_kwargs,
+            )
+        from .. import output_path, render_cache
+
+        header_format_ = HeaderFormat.from_expr(header_format).name.lower()
+        sample_format_ = SampleFormat.from_expr(sample_format).name.lower()
+        # The join reads segments from a temporary directory, so its own digest
+        # changes every time. Key the output on the segments' requests instead.
+        hasher = hashlib.sha256()
+        hasher.update(repr(dataclasses.replace(options_, executable=None)).encode())
+        hasher.update(f"{embedded}:{sample_rate}".encode())
+        for offset, segment_duration, segment in segments:
+            hasher.update(f"\0{offset}:{segment_duration}\0".encode())
+            for datagram in segment.iterate_datagrams(until=segment_duration):
+                hasher.update(struct.pack(">i", len(datagram)))
+                hasher.update(datagram)
+        digest = hasher.hexdigest()
+        output_file_path_ = Path(
+            output_file_path or (output_path / f"score-{digest}.{header_format_}")
+        )
+        render_cache_ = render_cache if cache is True else (cache or None)
+        if render_cache_:
+            cache_key = render_cache_.get_key(
+                f"segmented-{digest}",
+                header_format_,
+                sample_format_,
+                _get_render_environment(options_, embedded),
+            )
+            if cached_path := render_cache_.get(cache_key, header_format_):
+                logger.info(f"Render cache hit: {cached_path}")
+                if output_file_path_.resolve() != cached_path.resolve():
+                    _copy_atomically(cached_path, output_file_path_)
+                return output_file_path_, 0
+        # render the segments as float WAVs, so mixing them quantizes only once
+        semaphore = asyncio.Semaphore(maximum_concurrency_)
+
+        async def render_segment(
+            segment: Score, segment_duration: float, segment_path: Path
+        ) -> tuple[Path | None, int]:
+            async with semaphore:
+                return await segment.render(
+                    segment_path,
+                    cache=False,
+                    duration=segment_duration,
+                    header_format=HeaderFormat.WAV,
+                    sample_format=SampleFormat.FLOAT,
+                    **render_kwargs,
+                )
+
+        # segments are only inputs to the join, so they never outlive it
+        with TemporaryDirectory() as segments_directory:
+            results = await asyncio.gather(
+                *(
+                    render_segment(
+                        segment,
+                        segment_duration,
+                        Path(segments_directory) / f"segment-{i}.wav",
                     )
-                    return
-                elif timestamp > until:
-                    yield RequestBundle(timestamp=until, contents=[DoNothing()])
-                    return
-            if requests:
-                yield RequestBundle(timestamp=timestamp, contents=requests)
-        if until and until > timestamp:
-            yield RequestBundle(timestamp=until, contents=[DoNothing()])
+                    for i, (_, segment_duration, segment) in enumerate(segments)
+                )
+            )
+            for _, exit_code in results:
+                if exit_code:
+                    return None, exit_code
+            # mix the segments back together
+            channel_count = options_.output_bus_channel_count
+            synthdef = _build_segment_join_synthdef(channel_count)
+            block_duration = options_.block_size / sample_rate
+            join = Score(
+                options=dataclasses.replace(
+                    options_, buffer_count=max(options_.buffer_count, len(segments))
+                )
+            )
+            with join.at(0):
+                join.add_synthdefs(synthdef)
+                buffers = []
+                for path, _ in results:
+                    assert path is not None
+                    buffer_ = join.add_buffer(
+                        channel_count=channel_count, frame_count=32768
+                    )
+                    join.read_buffer(buffer_, path, leave_open=True)
+                    buffers.append(buffer_)
+            for (offset, segment_duration, _), buffer_ in zip(segments, buffers):
+                with join.at(offset):
+                    synth = join.add_synth(synthdef, buffer_id=buffer_)
+                with join.at(offset + segment_duration + block_duration):
+                    synth.free()
+                    join.close_buffer(buffer_)
+                    join.free_buffer(buffer_)
+            path, exit_code = await join.render(
+                output_file_path_,
+                cache=False,
+                duration=duration_,
+                header_format=header_format,
+                sample_format=sample_format,
+                **render_kwargs,
+            )
+        if render_cache_ and path and not exit_code:
+            render_cache_.put(cache_key, header_format_, path)
+        return path, exit_code
 
     def send(self, message: SequenceABC | SupportsOsc | str) -> None:
         """
@@ -247,7 +1407,7 @@ class Score(Context):
             raise ContextError
         elif message.timestamp is None:
             raise ContextError
-        self._requests.setdefault(message.timestamp, []).extend(message.contents)
+        self._timeline.add(message.timestamp, message.contents)
 
     def setup_system_synthdefs(self) -> None:
         """
@@ -255,3 +1415,47 @@ class Score(Context):
         """
         with self.at(0):
             self.add_synthdefs(*SYSTEM_SYNTHDEFS.values())
+
+    def shift(self, delta: float) -> "Score":
+        """
+        Get a copy of the score with every request shifted in time.
+
+        :param delta: The time in seconds to shift by.
+        """
+        timestamps = self._timeline.timestamps
+        if timestamps and timestamps[0] + delta < 0:
+            raise ValueError(delta)
+        score = self._clone()
+        for timestamp, requests in self._timeline.iterate():
+            score._timeline.add(timestamp + delta, requests)
+        return score
+
+    def slice(self, start: float | None = None, stop: float | None = None) -> "Score":
+        """
+        Get a copy of the score with only the requests in a time range.
+
+        Timestamps are kept as-is. No state is replayed, so nodes or buffers created
+        before ``start`` won't exist in the slice.
+
+        :param start: The timestamp to start at, inclusive.
+        :param stop: The timestamp to stop at, exclusive.
+        """
+        score = self._clone()
+        for timestamp, requests in self._timeline.iterate(start, stop):
+            score._timeline.add(timestamp, requests)
+        return score
+
+    def write(self, file_path: PathLike, until: float | None = None) -> str:
+        """
+        Write the score to an ``.osc`` command file, without holding it all in
+        memory.
+
+        :param file_path: The command file path to write to.
+        :param until: Timestamp to stop writing at.
+
+        :return: The SHA-256 hex digest of the command file.
+        """
+        hasher = hashlib.sha256()
+        with Path(file_path).open("wb") as file_pointer:
+            self._write_datagrams(file_pointer, hasher, until=until)
+        return hasher.hexdigest()
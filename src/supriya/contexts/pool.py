@@ -0,0 +1,296 @@
+"""
+Tools for pooling pre-booted embedded execution contexts.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from multiprocessing.connection import Connection
+
+from ..enums import BootStatus
+from ..exceptions import ServerCannotBoot, ServerOffline, ServerOnline
+from ..osc import OscMessage, find_free_port
+from ..scsynth import Options
+from .realtime import AsyncServer, BaseServer, Server
+
+logger = logging.getLogger(__name__)
+
+
+def _run_worker(options: Options, connection: Connection) -> None:
+    """Boot an embedded World and keep it alive until told to quit."""
+    from ..scsynth import EmbeddedProcessProtocol
+
+    protocol = EmbeddedProcessProtocol(name=f"pool:{options.port}")
+    try:
+        protocol.boot(options)
+    except (ImportError, ServerCannotBoot) as exc:
+        connection.send((False, str(exc)))
+        return
+    connection.send((True, ""))
+    # Either the parent asks us to quit, or the World quits on its own
+    while not protocol.exit_future.done():
+        if connection.poll(0.1):
+            connection.recv()
+            protocol.send_packet(OscMessage("/quit").to_datagram())
+            protocol.quit()
+            break
+
+
+@dataclasses.dataclass
+class ServerPoolStatistics:
+    """
+    Counters describing a :py:class:`ServerPool`'s activity.
+    """
+
+    acquire_count: int = 0
+    boot_durations: list[float] = dataclasses.field(default_factory=list)
+    reset_count: int = 0
+    reset_durations: list[float] = dataclasses.field(default_factory=list)
+
+    @property
+    def reuse_count(self) -> int:
+        """
+        Get the number of acquisitions served without booting a World.
+        """
+        return max(self.acquire_count - len(self.boot_durations), 0)
+
+
+@dataclasses.dataclass
+class _Slot:
+    connection: Connection
+    options: Options
+    process: multiprocessing.process.BaseProcess
+    handle: BaseServer | None = None
+
+
+class ServerPool:
+    """
+    A pool of pre-booted embedded scsynth Worlds.
+
+    Only one embedded World may exist per Python process, so each World lives in its
+    own worker process, listening on its own UDP port. Acquiring from the pool hands
+    out a :py:class:`~supriya.contexts.realtime.Server` or
+    :py:class:`~supriya.contexts.realtime.AsyncServer` connected to an idle World.
+    Releasing resets the World's state via ``reset()`` rather than rebooting it.
+
+    :param size: The number of Worlds to keep booted.
+    :param options: The Worlds' options.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, size: int = 2, options: Options | None = None, **kwargs) -> None:
+        if size < 1:
+            raise ValueError(size)
+        self._idle: queue.Queue[_Slot] = queue.Queue()
+        self._lock = threading.Lock()
+        self._options = dataclasses.replace(options or Options(), **kwargs)
+        self._size = size
+        self._slots: list[_Slot] = []
+        self._statistics = ServerPoolStatistics()
+
+    ### SPECIAL METHODS ###
+
+    async def __aenter__(self) -> "ServerPool":
+        return await asyncio.get_running_loop().run_in_executor(None, self.start)
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop_async()
+
+    def __enter__(self) -> "ServerPool":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    ### PRIVATE METHODS ###
+
+    def _get_slot(self, timeout: float | None) -> _Slot:
+        if not self._slots:
+            raise ServerOffline("Server pool not started")
+        try:
+            slot = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No idle server available")
+        with self._lock:
+            self._statistics.acquire_count += 1
+        return slot
+
+    def _get_slot_by_handle(self, server: BaseServer) -> _Slot:
+        for slot in self._slots:
+            if slot.handle is server:
+                return slot
+        raise ValueError(server)
+
+    def _record_reset(self, started_at: float) -> None:
+        with self._lock:
+            self._statistics.reset_count += 1
+            self._statistics.reset_durations.append(time.monotonic() - started_at)
+
+    def _stop_workers(self) -> None:
+        for slot in self._slots:
+            slot.handle = None
+            try:
+                slot.connection.send("quit")
+            except (BrokenPipeError, OSError):
+                pass
+            slot.process.join(timeout=5)
+            if slot.process.is_alive():
+                slot.process.kill()
+        self._slots.clear()
+        self._idle = queue.Queue()
+
+    ### PUBLIC METHODS ###
+
+    def acquire(self, timeout: float | None = None) -> Server:
+        """
+        Acquire a server connected to an idle World.
+
+        :param timeout: How long to wait for an idle World, or forever if ``None``.
+        """
+        slot = self._get_slot(timeout)
+        if not isinstance(slot.handle, Server):
+            slot.handle = Server().connect(options=slot.options)
+        return slot.handle
+
+    async def acquire_async(self, timeout: float | None = None) -> AsyncServer:
+        """
+        Acquire an async server connected to an idle World.
+
+        :param timeout: How long to wait for an idle World, or forever if ``None``.
+        """
+        slot = await asyncio.get_running_loop().run_in_executor(
+            None, self._get_slot, timeout
+        )
+        if isinstance(slot.handle, Server):
+            # Handles aren't shared across concurrency models, swap it out
+            slot.handle.disconnect()
+        if not isinstance(slot.handle, AsyncServer):
+            slot.handle = await AsyncServer().connect(options=slot.options)
+        return slot.handle
+
+    def release(self, server: Server) -> None:
+        """
+        Reset a server's World and return it to the pool.
+
+        :param server: The server to release.
+        """
+        slot = self._get_slot_by_handle(server)
+        started_at = time.monotonic()
+        server.reset()
+        self._record_reset(started_at)
+        self._idle.put(slot)
+
+    async def release_async(self, server: AsyncServer) -> None:
+        """
+        Reset an async server's World and return it to the pool.
+
+        :param server: The server to release.
+        """
+        slot = self._get_slot_by_handle(server)
+        started_at = time.monotonic()
+        await server.reset()
+        self._record_reset(started_at)
+        self._idle.put(slot)
+
+    def start(self) -> "ServerPool":
+        """
+        Boot the pool's Worlds.
+        """
+        if self._slots:
+            return self
+        context = multiprocessing.get_context("spawn")
+        pending: list[tuple[_Slot, float]] = []
+        for _ in range(self._size):
+            options = dataclasses.replace(self._options, port=find_free_port())
+            parent_connection, child_connection = context.Pipe()
+            process = context.Process(
+                args=(options, child_connection), daemon=True, target=_run_worker
+            )
+            pending.append(
+                (_Slot(parent_connection, options, process), time.monotonic())
+            )
+            process.start()
+        errors: list[str] = []
+        for slot, started_at in pending:
+            try:
+                booted, error = slot.connection.recv()
+            except EOFError:
+                booted, error = False, "Worker process exited"
+            if not booted:
+                errors.append(error)
+                slot.process.join()
+                continue
+            self._statistics.boot_durations.append(time.monotonic() - started_at)
+            logger.info(f"pooled World booted on port {slot.options.port}")
+            self._slots.append(slot)
+            self._idle.put(slot)
+        if errors:
+            self.stop()
+            raise ServerCannotBoot(errors[0])
+        return self
+
+    def stop(self) -> None:
+        """
+        Quit the pool's Worlds.
+
+        Async servers can only be disconnected from their event loop, so pools which
+        handed them out must be stopped with :py:meth:`stop_async` instead.
+        """
+        for slot in self._slots:
+            if (
+                isinstance(slot.handle, AsyncServer)
+                and slot.handle.boot_status == BootStatus.ONLINE
+            ):
+                raise ServerOnline("Async servers still connected, use stop_async()")
+        for slot in self._slots:
+            if (
+                isinstance(slot.handle, Server)
+                and slot.handle.boot_status == BootStatus.ONLINE
+            ):
+                slot.handle.disconnect()
+        self._stop_workers()
+
+    async def stop_async(self) -> None:
+        """
+        Quit the pool's Worlds, disconnecting any async servers first.
+        """
+        for slot in self._slots:
+            if slot.handle is None or slot.handle.boot_status != BootStatus.ONLINE:
+                continue
+            if isinstance(slot.handle, AsyncServer):
+                await slot.handle.disconnect()
+            elif isinstance(slot.handle, Server):
+                slot.handle.disconnect()
+        await asyncio.get_running_loop().run_in_executor(None, self._stop_workers)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def options(self) -> Options:
+        """
+        Get the pool's options.
+        """
+        return self._options
+
+    @property
+    def size(self) -> int:
+        """
+        Get the pool's size.
+        """
+        return self._size
+
+    @property
+    def statistics(self) -> ServerPoolStatistics:
+        """
+        Get the pool's boot and reuse statistics.
+        """
+        return self._statistics
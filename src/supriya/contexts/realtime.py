@@ -3,17 +3,26 @@ Tools for interacting with realtime execution contexts.
 """
 
 import asyncio
+import collections
 import concurrent.futures
+import dataclasses
+import functools
 import logging
+import queue
 import shlex
+import tempfile
 import threading
 import warnings
 from collections.abc import Sequence as SequenceABC
+from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Awaitable,
     Callable,
     Iterable,
+    Iterator,
     Literal,
+    Mapping,
     NamedTuple,
     Sequence,
     SupportsInt,
@@ -38,12 +47,15 @@ from ..exceptions import (
     UnownedServerShutdown,
 )
 from ..osc import (
+    AsyncEmbeddedOscProtocol,
     AsyncOscProtocol,
     HealthCheck,
+    OscBundle,
     OscCallback,
     OscMessage,
     OscProtocol,
     OscProtocolOffline,
+    ThreadedEmbeddedOscProtocol,
     ThreadedOscProtocol,
 )
 from ..scsynth import (
@@ -53,7 +65,8 @@ from ..scsynth import (
     ThreadedProcessProtocol,
 )
 from ..typing import AddActionLike, ServerLifecycleEventLike, SupportsOsc
-from ..ugens import SYSTEM_SYNTHDEFS
+from ..ugens import SYSTEM_SYNTHDEFS, SynthDef
+from ..utils import group_by_count
 from .core import Context
 from .entities import (
     Buffer,
@@ -78,9 +91,13 @@ from .requests import (
     QueryTree,
     QueryVersion,
     Quit,
+    ReadBuffer,
+    Requestable,
+    SetBufferRange,
     Sync,
     ToggleNotifications,
     TraceNode,
+    WriteBuffer,
 )
 from .responses import (
     BufferInfo,
@@ -93,16 +110,31 @@ from .responses import (
     GetNodeControlInfo,
     GetNodeControlRangeInfo,
     NodeInfo,
+    QueryTreeControl,
     QueryTreeGroup,
     QueryTreeInfo,
+    QueryTreeSynth,
+    Response,
     StatusInfo,
     VersionInfo,
 )
 from .scopes import AmplitudeScope, FrequencyScope
 from .shm import ServerSHM
 
+if TYPE_CHECKING:
+    import numpy
+
 logger = logging.getLogger(__name__)
 
+# The number of samples per /b_getn or /b_setn message, fitting a 1500-byte MTU
+_BUFFER_CHUNK_SIZE = 288
+
+# The number of /b_getn or /b_setn messages in flight before waiting on replies
+_BUFFER_CHUNKS_IN_FLIGHT = 8
+
+# The maximum datagram size when bundling queries, fitting a 1500-byte MTU
+_QUERY_BUNDLE_SIZE = 1472
+
 
 class FailWarning(Warning):
     pass
@@ -121,6 +153,76 @@ DEFAULT_HEALTHCHECK = HealthCheck(
 )
 
 
+@dataclasses.dataclass
+class BusAccessCounts:
+    """
+    Counts of control bus reads and writes, split by transport.
+
+    :param osc_reads: Synchronous reads made via ``/c_get`` or ``/c_getn``.
+    :param osc_writes: Writes made via ``/c_set``, ``/c_setn`` or ``/c_fill``.
+    :param shm_reads: Synchronous reads made via the shared memory interface.
+    :param shm_writes: Writes made via the shared memory interface.
+    """
+
+    osc_reads: int = 0
+    osc_writes: int = 0
+    shm_reads: int = 0
+    shm_writes: int = 0
+
+
+class _NodeChildren:
+    """
+    A group's children, as a doubly linked list indexed by node ID.
+
+    Also counts the group's descendants, maintained by the context.
+    """
+
+    __slots__ = ("descendant_count", "head", "next_ids", "previous_ids", "tail")
+
+    def __init__(self) -> None:
+        self.descendant_count = 0
+        self.head: int | None = None
+        self.next_ids: dict[int, int | None] = {}
+        self.previous_ids: dict[int, int | None] = {}
+        self.tail: int | None = None
+
+    def __contains__(self, id_: object) -> bool:
+        return id_ in self.next_ids
+
+    def __iter__(self) -> Iterator[int]:
+        id_ = self.head
+        while id_ is not None:
+            yield id_
+            id_ = self.next_ids[id_]
+
+    def __len__(self) -> int:
+        return len(self.next_ids)
+
+    def insert(self, id_: int, previous_id: int | None, next_id: int | None) -> None:
+        self.previous_ids[id_] = previous_id
+        self.next_ids[id_] = next_id
+        if previous_id is None:
+            self.head = id_
+        else:
+            self.next_ids[previous_id] = id_
+        if next_id is None:
+            self.tail = id_
+        else:
+            self.previous_ids[next_id] = id_
+
+    def remove(self, id_: int) -> None:
+        previous_id = self.previous_ids.pop(id_)
+        next_id = self.next_ids.pop(id_)
+        if previous_id is None:
+            self.head = next_id
+        else:
+            self.next_ids[previous_id] = next_id
+        if next_id is None:
+            self.tail = previous_id
+        else:
+            self.previous_ids[next_id] = previous_id
+
+
 class ServerLifecycleCallback(NamedTuple):
     context: "BaseServer"
     events: tuple[ServerLifecycleEvent, ...]
@@ -138,6 +240,10 @@ class BaseServer(Context):
     Base class for realtime execution contexts.
 
     :param options: The context's options.
+    :param prefer_control_indices: If true, address synth controls by integer index
+        rather than by name in ``/s_new`` and ``/n_set`` requests.
+    :param prefer_shared_memory: If true, route control bus reads and writes through
+        the shared memory interface whenever it is available.
     :param kwargs: Keyword arguments for options.
     """
 
@@ -151,10 +257,14 @@ class BaseServer(Context):
         self,
         options: Options | None,
         name: str | None = None,
+        prefer_control_indices: bool = False,
+        prefer_shared_memory: bool = False,
         **kwargs,
     ) -> None:
         Context.__init__(self, options, name=name, **kwargs)
+        self._bus_access_counts = BusAccessCounts()
         self._buffers: set[int] = set()
+        self._control_indices: dict[SynthDef, dict[str, tuple[int, int]]] = {}
         self._is_owner: bool = False
         self._latency: float = 0.1
         self._lifecycle_event_callbacks: dict[
@@ -162,8 +272,11 @@ class BaseServer(Context):
         ] = {}
         self._maximum_logins: int = 1
         self._node_active: dict[int, bool] = {}
-        self._node_children: dict[int, list[int]] = {}
+        self._node_children: dict[int, _NodeChildren] = {}
         self._node_parents: dict[int, int] = {}
+        self._node_synthdefs: dict[int, SynthDef] = {}
+        self._prefer_control_indices = bool(prefer_control_indices)
+        self._prefer_shared_memory = bool(prefer_shared_memory)
         self._shared_memory: ServerSHM | None = None
         self._status: StatusInfo | None = None
 
@@ -200,19 +313,32 @@ class BaseServer(Context):
 
     ### PRIVATE METHODS ###
 
+    def _add_descendant_count(self, parent_id: int | None, count: int) -> None:
+        while (
+            parent_id is not None
+            and (children := self._node_children.get(parent_id)) is not None
+        ):
+            children.descendant_count += count
+            parent_id = self._node_parents.get(parent_id)
+
     def _add_node_to_children(
         self, id_: int, parent_id: int, previous_id: int, next_id: int
     ) -> None:
         self._node_parents[id_] = parent_id
         children = self._node_children[parent_id]
+        if id_ in children:
+            self._remove_node_from_children(id_, parent_id)
         if previous_id == -1:
-            children.insert(0, id_)
+            children.insert(id_, None, children.head)
         elif next_id == -1:
-            children.append(id_)
+            children.insert(id_, children.tail, None)
         elif previous_id in children:
-            children.insert(children.index(previous_id) + 1, id_)
+            children.insert(id_, previous_id, children.next_ids[previous_id])
         elif next_id in children:
-            children.insert(children.index(next_id), id_)
+            children.insert(id_, children.previous_ids[next_id], next_id)
+        else:
+            return
+        self._add_descendant_count(parent_id, self._get_subtree_size(id_))
 
     def _free_id(
         self,
@@ -222,6 +348,116 @@ class BaseServer(Context):
     ) -> None:
         self._get_allocator(type_, calculation_rate).free(id_)
 
+    def _get_buffer_chunks(self, index: int, count: int) -> list[tuple[int, int]]:
+        return [
+            (index + offset, min(_BUFFER_CHUNK_SIZE, count - offset))
+            for offset in range(0, count, _BUFFER_CHUNK_SIZE)
+        ]
+
+    def _get_control_indices(
+        self, synthdef: SynthDef
+    ) -> Mapping[str, tuple[int, int]] | None:
+        if not self._prefer_control_indices:
+            return None
+        if (control_indices := self._control_indices.get(synthdef)) is None:
+            control_indices = self._control_indices[synthdef] = {
+                name: (index, len(parameter))
+                for name, (parameter, index) in synthdef.parameters.items()
+            }
+        return control_indices
+
+    def _get_shared_memory(
+        self, use_shared_memory: bool | None, write: bool = False
+    ) -> ServerSHM | None:
+        if use_shared_memory is None:
+            # Writes inside an open moment or completion keep their OSC timing
+            use_shared_memory = self._prefer_shared_memory and not (
+                write and self._get_request_context()
+            )
+        shared_memory = self._shared_memory if use_shared_memory else None
+        counts = self._bus_access_counts
+        if write and shared_memory is not None:
+            counts.shm_writes += 1
+        elif write:
+            counts.osc_writes += 1
+        elif shared_memory is not None:
+            counts.shm_reads += 1
+        else:
+            counts.osc_reads += 1
+        return shared_memory
+
+    def _get_subtree_size(self, id_: int) -> int:
+        if (children := self._node_children.get(id_)) is None:
+            return 1
+        return 1 + children.descendant_count
+
+    def _get_tree_control_requests(
+        self, group: Group | None, include_controls: bool | Iterable[SupportsInt]
+    ) -> list[Requestable]:
+        if include_controls is False:
+            return []
+        requests: list[Requestable] = []
+        with self._lock:
+            if include_controls is True:
+                synth_ids: list[int] = []
+                stack = [int(group or 0)]
+                while stack:
+                    if (
+                        children := self._node_children.get(id_ := stack.pop())
+                    ) is None:
+                        synth_ids.append(id_)
+                    else:
+                        stack.extend(reversed(list(children)))
+            else:
+                synth_ids = [int(synth) for synth in include_controls]
+            for synth_id in synth_ids:
+                if (synthdef := self._node_synthdefs.get(synth_id)) is None:
+                    continue
+                if synth_id not in self._node_parents:
+                    continue
+                count = sum(
+                    len(parameter) for parameter, _ in synthdef.parameters.values()
+                )
+                if count:
+                    requests.append(
+                        GetSynthControlRange(synth_id=synth_id, items=[(0, count)])
+                    )
+        return requests
+
+    def _get_tree_snapshot(
+        self, group: Group | None, responses: Iterable[Response | None]
+    ) -> QueryTreeGroup:
+        controls: dict[int, Sequence[float]] = {
+            response.node_id: response.items[0][1]
+            for response in responses
+            if isinstance(response, GetNodeControlRangeInfo)
+        }
+
+        def recurse(id_: int) -> QueryTreeGroup | QueryTreeSynth:
+            if (children := self._node_children.get(id_)) is not None:
+                return QueryTreeGroup(
+                    node_id=id_, children=[recurse(child_id) for child_id in children]
+                )
+            synthdef = self._node_synthdefs.get(id_)
+            synth = QueryTreeSynth(
+                node_id=id_,
+                synthdef_name=synthdef.effective_name if synthdef else None,
+            )
+            if synthdef is not None and id_ in controls:
+                names = {
+                    index: name for name, (_, index) in synthdef.parameters.items()
+                }
+                synth.controls.extend(
+                    QueryTreeControl(name_or_index=names.get(index, index), value=value)
+                    for index, value in enumerate(controls[id_])
+                )
+            return synth
+
+        with self._lock:
+            if (id_ := int(group or 0)) not in self._node_children:
+                raise ValueError(f"No group {id_} in node tree")
+            return cast(QueryTreeGroup, recurse(id_))
+
     def _handle_done_b_alloc(self, message: OscMessage) -> None:
         with self._lock:
             self._buffers.add(cast(int, message.contents[1]))
@@ -259,6 +495,7 @@ class BaseServer(Context):
             self._node_active.pop(node_id, None)
             self._node_children.pop(node_id, None)
             self._node_parents.pop(node_id, None)
+            self._node_synthdefs.pop(node_id, None)
 
     def _handle_n_go(self, message: OscMessage) -> None:
         with self._lock:
@@ -270,7 +507,8 @@ class BaseServer(Context):
             self._node_parents[node_id] = parent_id
             self._node_active[node_id] = True
             if is_group:
-                self._node_children[node_id] = []
+                self._node_children[node_id] = _NodeChildren()
+                self._node_synthdefs.pop(node_id, None)
             self._add_node_to_children(node_id, parent_id, previous_id, next_id)
 
     def _handle_n_move(self, message: OscMessage) -> None:
@@ -297,9 +535,20 @@ class BaseServer(Context):
         with self._lock:
             self._status = cast(StatusInfo, StatusInfo.from_osc(message))
 
+    def _is_local(self) -> bool:
+        return (
+            self._is_owner
+            or self._shared_memory is not None
+            or self._options.ip_address in ("127.0.0.1", "::1", "localhost")
+        )
+
     def _log_prefix(self) -> str:
         return f"[{self._options.ip_address}:{self._options.port}/{self.name or hex(id(self))}] "
 
+    def _record_synthdef(self, synth_id: int, synthdef: SynthDef) -> None:
+        with self._lock:
+            self._node_synthdefs[synth_id] = synthdef
+
     def _register_lifecycle_callback(
         self,
         event: ServerLifecycleEventLike | Iterable[ServerLifecycleEventLike],
@@ -328,18 +577,67 @@ class BaseServer(Context):
         return callback
 
     def _remove_node_from_children(self, id_: int, parent_id: int) -> None:
-        if not (children := self._node_children.get(parent_id, [])):
+        if (children := self._node_children.get(parent_id)) is None or (
+            id_ not in children
+        ):
             return
-        try:
-            children.pop(children.index(id_))
-        except ValueError:
-            pass
+        children.remove(id_)
+        self._add_descendant_count(parent_id, -self._get_subtree_size(id_))
 
     def _resolve_node(self, node: Node | SupportsInt | None) -> int:
         if node is None:
             return self._client_id + 1
         return int(node)
 
+    def _send_queries(
+        self,
+        requests: Sequence[Requestable],
+        procedure: Callable[[int, Response], None],
+    ) -> tuple[list[int], list[OscCallback]]:
+        osc_protocol: OscProtocol = getattr(self, "_osc_protocol")
+        # Replies are correlated by the identifying arguments in their patterns, and
+        # requests sharing a pattern are resolved in the order they were sent
+        pending_by_pattern: dict[tuple, collections.deque[int]] = {}
+        failure_patterns: dict[tuple, Sequence[float | str] | None] = {}
+        indices: list[int] = []
+        messages: list[OscBundle | OscMessage] = []
+        for index, request in enumerate(requests):
+            success_pattern, failure_pattern, requestable = (
+                request._get_response_patterns_and_requestable(self)
+            )
+            messages.append(requestable.to_osc())
+            if not success_pattern:
+                continue
+            key = tuple(success_pattern)
+            pending_by_pattern.setdefault(key, collections.deque()).append(index)
+            failure_patterns.setdefault(key, failure_pattern)
+            indices.append(index)
+
+        def resolve(message: OscMessage, pending: collections.deque[int]) -> None:
+            if pending:
+                procedure(pending.popleft(), Response.from_osc(message))
+
+        callbacks = osc_protocol.register_many(
+            (
+                pattern,
+                functools.partial(resolve, pending=pending),
+                failure_patterns[pattern],
+            )
+            for pattern, pending in pending_by_pattern.items()
+        )
+        bundle: list[OscBundle | OscMessage] = []
+        bundle_size = 16  # "#bundle" and the timetag
+        for message in messages:
+            message_size = 4 + len(message.to_datagram())
+            if bundle and bundle_size + message_size > _QUERY_BUNDLE_SIZE:
+                self.send(bundle[0] if len(bundle) == 1 else OscBundle(contents=bundle))
+                bundle, bundle_size = [], 16
+            bundle.append(message)
+            bundle_size += message_size
+        if bundle:
+            self.send(bundle[0] if len(bundle) == 1 else OscBundle(contents=bundle))
+        return indices, callbacks
+
     def _setup_osc_callbacks(self, osc_protocol: OscProtocol) -> None:
         for pattern, procedure in [
             (["/done", "/b_alloc"], self._handle_done_b_alloc),
@@ -365,13 +663,12 @@ class BaseServer(Context):
             pass
 
     def _setup_system(self) -> None:
-        self._node_children[0] = []
+        self._node_children[0] = _NodeChildren()
         with self.at():
             for i in range(self._maximum_logins):
                 self.add_group(permanent=True, add_action="ADD_TO_TAIL", target_node=0)
-        for synthdef in SYSTEM_SYNTHDEFS.values():
-            with self.at():
-                self.add_synthdefs(synthdef)
+        with self.at():
+            self.add_synthdefs(*SYSTEM_SYNTHDEFS.values())
 
     def _teardown_shared_memory(self) -> None:
         self._shared_memory = None
@@ -380,8 +677,43 @@ class BaseServer(Context):
         self._node_active.clear()
         self._node_children.clear()
         self._node_parents.clear()
+        self._node_synthdefs.clear()
         self._buffers.clear()
 
+    def _validate_buffer_transfer(
+        self, buffer_info: BufferInfo.Item, starting_frame: int, frame_count: int | None
+    ) -> int:
+        if frame_count is None:
+            frame_count = buffer_info.frame_count - starting_frame
+        if (
+            starting_frame < 0
+            or frame_count < 0
+            or starting_frame + frame_count > buffer_info.frame_count
+        ):
+            raise ValueError(
+                f"Cannot transfer {frame_count} frames starting at {starting_frame}"
+                f" for buffer {buffer_info.buffer_id} of {buffer_info.frame_count}"
+                " frames"
+            )
+        return frame_count
+
+    def _validate_buffer_upload(
+        self, buffer_info: BufferInfo.Item, array: "numpy.ndarray", starting_frame: int
+    ) -> "numpy.ndarray":
+        import numpy
+
+        array = numpy.asarray(array, dtype=numpy.float32)
+        if array.ndim == 1:
+            array = array.reshape(-1, 1)
+        if array.ndim != 2 or array.shape[1] != buffer_info.channel_count:
+            raise ValueError(
+                f"Cannot upload array of shape {array.shape}"
+                f" to buffer {buffer_info.buffer_id}"
+                f" of {buffer_info.channel_count} channels"
+            )
+        self._validate_buffer_transfer(buffer_info, starting_frame, len(array))
+        return array
+
     def _validate_can_request(self) -> None:
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
             raise ServerOffline("Server offline!")
@@ -453,6 +785,24 @@ class BaseServer(Context):
         """
         self._latency = float(latency)
 
+    def set_prefer_control_indices(self, prefer_control_indices: bool) -> None:
+        """
+        Set the context's control addressing policy.
+
+        :param prefer_control_indices: If true, address synth controls by integer
+            index rather than by name in ``/s_new`` and ``/n_set`` requests.
+        """
+        self._prefer_control_indices = bool(prefer_control_indices)
+
+    def set_prefer_shared_memory(self, prefer_shared_memory: bool) -> None:
+        """
+        Set the context's shared memory policy.
+
+        :param prefer_shared_memory: If true, route control bus reads and writes
+            through the shared memory interface whenever it is available.
+        """
+        self._prefer_shared_memory = bool(prefer_shared_memory)
+
     def unregister_lifecycle_callback(self, callback: ServerLifecycleCallback) -> None:
         """
         Unregister a lifecycle callback.
@@ -469,6 +819,13 @@ class BaseServer(Context):
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def bus_access_counts(self) -> BusAccessCounts:
+        """
+        Get the server's control bus access counts, split by transport.
+        """
+        return self._bus_access_counts
+
     @property
     def default_group(self) -> Group:
         """
@@ -483,6 +840,20 @@ class BaseServer(Context):
         """
         return self._is_owner
 
+    @property
+    def prefer_control_indices(self) -> bool:
+        """
+        Get the server's control addressing policy.
+        """
+        return self._prefer_control_indices
+
+    @property
+    def prefer_shared_memory(self) -> bool:
+        """
+        Get the server's shared memory policy.
+        """
+        return self._prefer_shared_memory
+
     @property
     def shared_memory(self) -> ServerSHM | None:
         """
@@ -503,6 +874,12 @@ class Server(BaseServer):
     A realtime execution context with :py:mod:`threading`-based OSC and process protocols.
 
     :param options: The context's options.
+    :param in_process: If true, exchange OSC with the embedded World in-process
+        rather than over UDP. Requires ``embedded``.
+    :param prefer_control_indices: If true, address synth controls by integer index
+        rather than by name in ``/s_new`` and ``/n_set`` requests.
+    :param prefer_shared_memory: If true, route control bus reads and writes through
+        the shared memory interface whenever it is available.
     :param kwargs: Keyword arguments for options.
     """
 
@@ -513,8 +890,14 @@ class Server(BaseServer):
         options: Options | None = None,
         name: str | None = None,
         embedded: bool = False,
+        in_process: bool = False,
+        prefer_control_indices: bool = False,
+        prefer_shared_memory: bool = False,
         **kwargs,
     ) -> None:
+        if in_process and not embedded:
+            raise ValueError("in_process requires embedded")
+
         def on_panic(event: ServerShutdownEvent) -> None:
             if not self._shutdown_future.done():
                 self._shutdown_future.set_result(event)
@@ -523,6 +906,8 @@ class Server(BaseServer):
             self,
             name=name,
             options=options,
+            prefer_control_indices=prefer_control_indices,
+            prefer_shared_memory=prefer_shared_memory,
             **kwargs,
         )
         self._boot_future: concurrent.futures.Future[bool] = concurrent.futures.Future()
@@ -530,9 +915,6 @@ class Server(BaseServer):
         self._shutdown_future: concurrent.futures.Future[ServerShutdownEvent] = (
             concurrent.futures.Future()
         )
-        self._osc_protocol: ThreadedOscProtocol = ThreadedOscProtocol(
-            name=name, on_panic_callback=lambda: on_panic(ServerShutdownEvent.OSC_PANIC)
-        )
         if embedded:
             self._process_protocol: ThreadedProcessProtocol | EmbeddedProcessProtocol = (
                 EmbeddedProcessProtocol(
@@ -540,6 +922,7 @@ class Server(BaseServer):
                     on_panic_callback=lambda: on_panic(
                         ServerShutdownEvent.PROCESS_PANIC
                     ),
+                    open_udp=not in_process,
                 )
             )
         else:
@@ -547,6 +930,19 @@ class Server(BaseServer):
                 name=name,
                 on_panic_callback=lambda: on_panic(ServerShutdownEvent.PROCESS_PANIC),
             )
+        if in_process:
+            process_protocol = cast(EmbeddedProcessProtocol, self._process_protocol)
+            self._osc_protocol: ThreadedOscProtocol = ThreadedEmbeddedOscProtocol(
+                name=name,
+                on_panic_callback=lambda: on_panic(ServerShutdownEvent.OSC_PANIC),
+                receive_packets=process_protocol.receive_packets,
+                send_packet=process_protocol.send_packet,
+            )
+        else:
+            self._osc_protocol = ThreadedOscProtocol(
+                name=name,
+                on_panic_callback=lambda: on_panic(ServerShutdownEvent.OSC_PANIC),
+            )
         self._setup_osc_callbacks(self._osc_protocol)
 
     ### PRIVATE METHODS ###
@@ -782,6 +1178,101 @@ class Server(BaseServer):
             self._add_requests(request)
         return None
 
+    def download_buffer(
+        self,
+        buffer: Buffer,
+        *,
+        frame_count: int | None = None,
+        starting_frame: int = 0,
+        timeout: float = 1.0,
+        use_file: bool | None = None,
+    ) -> "numpy.ndarray":
+        """
+        Download a buffer's samples into a NumPy array.
+
+        Emit ``/b_write`` requests via a temporary soundfile if the server is local,
+        otherwise pipelined ``/b_getn`` requests.
+
+        Returns a ``(frame_count,)`` array for single-channel buffers, otherwise a
+        ``(frame_count, channel_count)`` array.
+
+        :param buffer: The buffer whose samples to download.
+        :param frame_count: The number of frames to download. Defaults to every frame
+            from ``starting_frame`` onward.
+        :param starting_frame: The frame to start downloading at.
+        :param timeout: The number of seconds to wait on each reply.
+        :param use_file: Flag for transferring via a temporary soundfile, which
+            requires the server to share this machine's filesystem. Defaults to
+            whether the server is local.
+        """
+        import numpy
+
+        from ..soundfiles import read_float_wave
+
+        self._validate_can_request()
+        buffer_info = cast(
+            BufferInfo,
+            QueryBuffer(buffer_ids=[int(buffer)]).communicate(
+                server=self, timeout=timeout
+            ),
+        ).items[0]
+        frame_count = self._validate_buffer_transfer(
+            buffer_info, starting_frame, frame_count
+        )
+        channel_count = buffer_info.channel_count
+        if use_file if use_file is not None else self._is_local():
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "buffer.wav"
+                self.send(
+                    WriteBuffer(
+                        buffer_id=buffer,
+                        path=path,
+                        header_format="wav",
+                        sample_format="float",
+                        frame_count=frame_count,
+                        starting_frame=starting_frame,
+                    )
+                )
+                self.sync(timeout=timeout)
+                samples = read_float_wave(path).reshape(-1)
+        else:
+            samples = numpy.zeros(frame_count * channel_count, dtype=numpy.float32)
+            offset = starting_frame * channel_count
+            replies: queue.Queue[int] = queue.Queue()
+
+            def procedure(message: OscMessage) -> None:
+                index, count = cast(tuple[int, int], message.contents[1:3])
+                # Other /b_setn replies for this buffer, e.g. from a concurrent
+                # get_buffer_range(), may not land inside our samples at all
+                if pending.get(index) != count:
+                    return
+                samples[index - offset : index - offset + count] = message.contents[3:]
+                replies.put(index)
+
+            def wait() -> None:
+                try:
+                    pending.pop(replies.get(timeout=timeout), None)
+                except queue.Empty:
+                    raise TimeoutError(f"No /b_setn reply after {timeout} seconds")
+
+            pending: dict[int, int] = {}
+            callback = self._osc_protocol.register(
+                pattern=["/b_setn", int(buffer)], procedure=procedure
+            )
+            try:
+                for index, count in self._get_buffer_chunks(offset, len(samples)):
+                    while len(pending) >= _BUFFER_CHUNKS_IN_FLIGHT:
+                        wait()
+                    pending[index] = count
+                    self.send(GetBufferRange(buffer_id=buffer, items=[(index, count)]))
+                while pending:
+                    wait()
+            finally:
+                self._osc_protocol.unregister(callback)
+        if channel_count == 1:
+            return samples
+        return samples.reshape(frame_count, channel_count)
+
     def get_buffer(
         self, buffer: Buffer, *indices: int, sync: bool = True
     ) -> dict[int, float] | None:
@@ -824,7 +1315,7 @@ class Server(BaseServer):
         return None
 
     def get_bus(
-        self, bus: Bus, sync: bool = True, use_shared_memory: bool = False
+        self, bus: Bus, sync: bool = True, use_shared_memory: bool | None = None
     ) -> float | None:
         """
         Get a control bus value.
@@ -835,12 +1326,13 @@ class Server(BaseServer):
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
         :param use_shared_memory: If true and ``sync=True``, use the shared memory interface.
+            If ``None``, defer to the context's shared memory policy.
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
         request = GetControlBus(bus_ids=[int(bus)])
         if sync:
-            if use_shared_memory and (shared_memory := getattr(self, "_shared_memory")):
+            if shared_memory := self._get_shared_memory(use_shared_memory):
                 return shared_memory[int(bus)]
             return cast(GetControlBusInfo, request.communicate(server=self)).items[0][
                 -1
@@ -849,7 +1341,11 @@ class Server(BaseServer):
         return None
 
     def get_bus_range(
-        self, bus: Bus, count: int, sync: bool = True, use_shared_memory: bool = False
+        self,
+        bus: Bus,
+        count: int,
+        sync: bool = True,
+        use_shared_memory: bool | None = None,
     ) -> Sequence[float] | None:
         """
         Get a range of control bus values.
@@ -861,12 +1357,13 @@ class Server(BaseServer):
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
         :param use_shared_memory: If true and ``sync=True``, use the shared memory interface.
+            If ``None``, defer to the context's shared memory policy.
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
         request = GetControlBusRange(items=[(int(bus), count)])
         if sync:
-            if use_shared_memory and (shared_memory := getattr(self, "_shared_memory")):
+            if shared_memory := self._get_shared_memory(use_shared_memory):
                 return shared_memory[int(bus) : int(bus) + count]
             return cast(GetControlBusRangeInfo, request.communicate(server=self)).items[
                 0
@@ -933,6 +1430,40 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def query_many(
+        self, requests: Sequence[Requestable], timeout: float = 1.0
+    ) -> list[Response | None]:
+        """
+        Communicate many requests at once.
+
+        Send the requests in as few bundles as fit in a datagram, then wait on all of
+        their replies together, rather than making one round-trip per request.
+        Replies are correlated with requests by their node, bus or buffer IDs.
+
+        Returns one response per request, or ``None`` for requests without replies.
+
+        :param requests: The requests to communicate.
+        :param timeout: The number of seconds to wait on all replies.
+        """
+        self._validate_can_request()
+        futures: list[concurrent.futures.Future[Response]] = [
+            concurrent.futures.Future() for _ in requests
+        ]
+        indices, callbacks = self._send_queries(
+            requests, lambda index, response: futures[index].set_result(response)
+        )
+        try:
+            _, not_done = concurrent.futures.wait(
+                [futures[index] for index in indices], timeout=timeout
+            )
+        finally:
+            self._osc_protocol.unregister_many(callbacks)
+        if not_done:
+            raise concurrent.futures.TimeoutError(
+                f"{len(not_done)} of {len(indices)} requests received no reply"
+            )
+        return [future.result() if future.done() else None for future in futures]
+
     def query_node(self, node: Node, sync: bool = True) -> NodeInfo | None:
         """
         Query a node.
@@ -1087,6 +1618,46 @@ class Server(BaseServer):
         self.sync()
         return self
 
+    def snapshot_tree(
+        self,
+        group: Group | None = None,
+        include_controls: bool | Iterable[SupportsInt] = False,
+        timeout: float = 1.0,
+    ) -> QueryTreeGroup:
+        """
+        Snapshot the server's node tree.
+
+        Build the tree from the node notifications already received rather than
+        querying the server, emitting ``/s_getn`` requests, followed by a ``/sync``,
+        only to refresh the control values of the synths requested. Only synths added
+        by this client have known synthdefs, so other clients' synths are unnamed and
+        have no control values.
+
+        :param group: The group whose tree to snapshot. Defaults to the root node.
+        :param include_controls: Flag for including every synth's control values, or
+            the synths whose control values to include.
+        :param timeout: The number of seconds to wait on control value replies.
+        """
+        self._validate_can_request()
+        requests = self._get_tree_control_requests(group, include_controls)
+        if not requests:
+            return self._get_tree_snapshot(group, [])
+        requests.append(Sync(sync_id=self._get_next_sync_id()))
+        futures: list[concurrent.futures.Future[Response]] = [
+            concurrent.futures.Future() for _ in requests
+        ]
+        _, callbacks = self._send_queries(
+            requests, lambda index, response: futures[index].set_result(response)
+        )
+        try:
+            # Replies to /s_getn precede /synced, unless their synth has since ended
+            futures[-1].result(timeout=timeout)
+        finally:
+            self._osc_protocol.unregister_many(callbacks)
+        return self._get_tree_snapshot(
+            group, [future.result() for future in futures if future.done()]
+        )
+
     def sync(self, sync_id: int | None = None, timeout: float = 1.0) -> "Server":
         """
         Sync the server.
@@ -1127,6 +1698,74 @@ class Server(BaseServer):
         # TODO: Implemented here because BaseServer does not define _osc_protocol
         self._osc_protocol.unregister(callback)
 
+    def upload_buffer(
+        self,
+        buffer: Buffer,
+        array: "numpy.ndarray",
+        *,
+        starting_frame: int = 0,
+        timeout: float = 1.0,
+        use_file: bool | None = None,
+    ) -> None:
+        """
+        Upload a NumPy array into a buffer.
+
+        Emit ``/b_read`` requests via a temporary soundfile if the server is local,
+        otherwise pipelined ``/b_setn`` requests.
+
+        :param buffer: The buffer whose samples to set.
+        :param array: A ``(frame_count,)`` array for single-channel buffers, otherwise
+            a ``(frame_count, channel_count)`` array.
+        :param starting_frame: The frame to start uploading at.
+        :param timeout: The number of seconds to wait on each reply.
+        :param use_file: Flag for transferring via a temporary soundfile, which
+            requires the server to share this machine's filesystem. Defaults to
+            whether the server is local.
+        """
+        from ..soundfiles import write_float_wave
+
+        self._validate_can_request()
+        buffer_info = cast(
+            BufferInfo,
+            QueryBuffer(buffer_ids=[int(buffer)]).communicate(
+                server=self, timeout=timeout
+            ),
+        ).items[0]
+        array = self._validate_buffer_upload(buffer_info, array, starting_frame)
+        if use_file if use_file is not None else self._is_local():
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "buffer.wav"
+                write_float_wave(path, array, int(buffer_info.sample_rate))
+                self.send(
+                    ReadBuffer(
+                        buffer_id=buffer,
+                        path=path,
+                        starting_frame_in_buffer=starting_frame,
+                    )
+                )
+                self.sync(timeout=timeout)
+            return
+        samples = array.reshape(-1)
+        offset = starting_frame * buffer_info.channel_count
+        synced: concurrent.futures.Future[OscMessage] | None = None
+        # Keep one window of /b_setn in flight while waiting on the previous one
+        for chunks in group_by_count(
+            self._get_buffer_chunks(offset, len(samples)), _BUFFER_CHUNKS_IN_FLIGHT
+        ):
+            for index, count in chunks:
+                values = samples[index - offset : index - offset + count].tolist()
+                self.send(SetBufferRange(buffer_id=buffer, items=[(index, values)]))
+            if synced is not None:
+                synced.result(timeout=timeout)
+            synced = concurrent.futures.Future()
+            sync_id = self._get_next_sync_id()
+            self._osc_protocol.register(
+                pattern=["/synced", sync_id], procedure=synced.set_result, once=True
+            )
+            self.send(Sync(sync_id=sync_id))
+        if synced is not None:
+            synced.result(timeout=timeout)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1169,6 +1808,12 @@ class AsyncServer(BaseServer):
     A realtime execution context with :py:mod:`asyncio`-based OSC and process protocols.
 
     :param options: The context's options.
+    :param in_process: If true, exchange OSC with the embedded World in-process
+        rather than over UDP. Requires ``embedded``.
+    :param prefer_control_indices: If true, address synth controls by integer index
+        rather than by name in ``/s_new`` and ``/n_set`` requests.
+    :param prefer_shared_memory: If true, route control bus reads and writes through
+        the shared memory interface whenever it is available.
     :param kwargs: Keyword arguments for options.
     """
 
@@ -1179,8 +1824,14 @@ class AsyncServer(BaseServer):
         options: Options | None = None,
         name: str | None = None,
         embedded: bool = False,
+        in_process: bool = False,
+        prefer_control_indices: bool = False,
+        prefer_shared_memory: bool = False,
         **kwargs,
     ) -> None:
+        if in_process and not embedded:
+            raise ValueError("in_process requires embedded")
+
         def on_panic(event: ServerShutdownEvent) -> None:
             if not self._shutdown_future.done():
                 self._shutdown_future.set_result(event)
@@ -1189,15 +1840,14 @@ class AsyncServer(BaseServer):
             self,
             name=name,
             options=options,
+            prefer_control_indices=prefer_control_indices,
+            prefer_shared_memory=prefer_shared_memory,
             **kwargs,
         )
         self._embedded = embedded
         self._boot_future: asyncio.Future[bool] = asyncio.Future()
         self._exit_future: asyncio.Future[bool] = asyncio.Future()
         self._shutdown_future: asyncio.Future[ServerShutdownEvent] = asyncio.Future()
-        self._osc_protocol: AsyncOscProtocol = AsyncOscProtocol(
-            name=name, on_panic_callback=lambda: on_panic(ServerShutdownEvent.OSC_PANIC)
-        )
         if embedded:
             # Reuse EmbeddedProcessProtocol (blocking World API needs a thread
             # anyway, and AsyncServer._lifecycle wraps it with await-on-future)
@@ -1207,6 +1857,7 @@ class AsyncServer(BaseServer):
                     on_panic_callback=lambda: on_panic(
                         ServerShutdownEvent.PROCESS_PANIC
                     ),
+                    open_udp=not in_process,
                 )
             )
         else:
@@ -1214,6 +1865,19 @@ class AsyncServer(BaseServer):
                 name=name,
                 on_panic_callback=lambda: on_panic(ServerShutdownEvent.PROCESS_PANIC),
             )
+        if in_process:
+            process_protocol = cast(EmbeddedProcessProtocol, self._process_protocol)
+            self._osc_protocol: AsyncOscProtocol = AsyncEmbeddedOscProtocol(
+                name=name,
+                on_panic_callback=lambda: on_panic(ServerShutdownEvent.OSC_PANIC),
+                receive_packets=process_protocol.receive_packets,
+                send_packet=process_protocol.send_packet,
+            )
+        else:
+            self._osc_protocol = AsyncOscProtocol(
+                name=name,
+                on_panic_callback=lambda: on_panic(ServerShutdownEvent.OSC_PANIC),
+            )
         self._setup_osc_callbacks(self._osc_protocol)
 
     ### PRIVATE METHODS ###
@@ -1459,6 +2123,98 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def download_buffer(
+        self,
+        buffer: Buffer,
+        *,
+        frame_count: int | None = None,
+        starting_frame: int = 0,
+        timeout: float = 1.0,
+        use_file: bool | None = None,
+    ) -> "numpy.ndarray":
+        """
+        Download a buffer's samples into a NumPy array.
+
+        Emit ``/b_write`` requests via a temporary soundfile if the server is local,
+        otherwise pipelined ``/b_getn`` requests.
+
+        Returns a ``(frame_count,)`` array for single-channel buffers, otherwise a
+        ``(frame_count, channel_count)`` array.
+
+        :param buffer: The buffer whose samples to download.
+        :param frame_count: The number of frames to download. Defaults to every frame
+            from ``starting_frame`` onward.
+        :param starting_frame: The frame to start downloading at.
+        :param timeout: The number of seconds to wait on each reply.
+        :param use_file: Flag for transferring via a temporary soundfile, which
+            requires the server to share this machine's filesystem. Defaults to
+            whether the server is local.
+        """
+        import numpy
+
+        from ..soundfiles import read_float_wave
+
+        self._validate_can_request()
+        buffer_info = cast(
+            BufferInfo,
+            await QueryBuffer(buffer_ids=[int(buffer)]).communicate_async(
+                server=self, timeout=timeout
+            ),
+        ).items[0]
+        frame_count = self._validate_buffer_transfer(
+            buffer_info, starting_frame, frame_count
+        )
+        channel_count = buffer_info.channel_count
+        if use_file if use_file is not None else self._is_local():
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "buffer.wav"
+                self.send(
+                    WriteBuffer(
+                        buffer_id=buffer,
+                        path=path,
+                        header_format="wav",
+                        sample_format="float",
+                        frame_count=frame_count,
+                        starting_frame=starting_frame,
+                    )
+                )
+                await self.sync(timeout=timeout)
+                samples = read_float_wave(path).reshape(-1)
+        else:
+            samples = numpy.zeros(frame_count * channel_count, dtype=numpy.float32)
+            offset = starting_frame * channel_count
+            replies: asyncio.Queue[int] = asyncio.Queue()
+
+            def procedure(message: OscMessage) -> None:
+                index, count = cast(tuple[int, int], message.contents[1:3])
+                # Other /b_setn replies for this buffer, e.g. from a concurrent
+                # get_buffer_range(), may not land inside our samples at all
+                if pending.get(index) != count:
+                    return
+                samples[index - offset : index - offset + count] = message.contents[3:]
+                replies.put_nowait(index)
+
+            async def wait() -> None:
+                pending.pop(await asyncio.wait_for(replies.get(), timeout), None)
+
+            pending: dict[int, int] = {}
+            callback = self._osc_protocol.register(
+                pattern=["/b_setn", int(buffer)], procedure=procedure
+            )
+            try:
+                for index, count in self._get_buffer_chunks(offset, len(samples)):
+                    while len(pending) >= _BUFFER_CHUNKS_IN_FLIGHT:
+                        await wait()
+                    pending[index] = count
+                    self.send(GetBufferRange(buffer_id=buffer, items=[(index, count)]))
+                while pending:
+                    await wait()
+            finally:
+                self._osc_protocol.unregister(callback)
+        if channel_count == 1:
+            return samples
+        return samples.reshape(frame_count, channel_count)
+
     async def get_buffer(
         self, buffer: Buffer, *indices: int, sync: bool = True
     ) -> dict[int, float] | None:
@@ -1503,7 +2259,7 @@ class AsyncServer(BaseServer):
         return None
 
     async def get_bus(
-        self, bus: Bus, sync: bool = True, use_shared_memory: bool = False
+        self, bus: Bus, sync: bool = True, use_shared_memory: bool | None = None
     ) -> float | None:
         """
         Get a control bus value.
@@ -1514,12 +2270,13 @@ class AsyncServer(BaseServer):
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
         :param use_shared_memory: If true and ``sync=True``, use the shared memory interface.
+            If ``None``, defer to the context's shared memory policy.
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
         request = GetControlBus(bus_ids=[int(bus)])
         if sync:
-            if use_shared_memory and (shared_memory := getattr(self, "_shared_memory")):
+            if shared_memory := self._get_shared_memory(use_shared_memory):
                 return shared_memory[int(bus)]
             return cast(
                 GetControlBusInfo, await request.communicate_async(server=self)
@@ -1528,7 +2285,11 @@ class AsyncServer(BaseServer):
         return None
 
     async def get_bus_range(
-        self, bus: Bus, count: int, sync: bool = True, use_shared_memory: bool = False
+        self,
+        bus: Bus,
+        count: int,
+        sync: bool = True,
+        use_shared_memory: bool | None = None,
     ) -> Sequence[float] | None:
         """
         Get a range of control bus values.
@@ -1540,12 +2301,13 @@ class AsyncServer(BaseServer):
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
         :param use_shared_memory: If true and ``sync=True``, use the shared memory interface.
+            If ``None``, defer to the context's shared memory policy.
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
         request = GetControlBusRange(items=[(int(bus), count)])
         if sync:
-            if use_shared_memory and (shared_memory := getattr(self, "_shared_memory")):
+            if shared_memory := self._get_shared_memory(use_shared_memory):
                 return shared_memory[int(bus) : int(bus) + count]
             return cast(
                 GetControlBusRangeInfo, await request.communicate_async(server=self)
@@ -1616,6 +2378,37 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def query_many(
+        self, requests: Sequence[Requestable], timeout: float = 1.0
+    ) -> list[Response | None]:
+        """
+        Communicate many requests at once.
+
+        Send the requests in as few bundles as fit in a datagram, then wait on all of
+        their replies together, rather than making one round-trip per request.
+        Replies are correlated with requests by their node, bus or buffer IDs.
+
+        Returns one response per request, or ``None`` for requests without replies.
+
+        :param requests: The requests to communicate.
+        :param timeout: The number of seconds to wait on all replies.
+        """
+        self._validate_can_request()
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[Response]] = [
+            loop.create_future() for _ in requests
+        ]
+        indices, callbacks = self._send_queries(
+            requests, lambda index, response: futures[index].set_result(response)
+        )
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(futures[index] for index in indices)), timeout
+            )
+        finally:
+            self._osc_protocol.unregister_many(callbacks)
+        return [future.result() if future.done() else None for future in futures]
+
     async def query_node(self, node: Node, sync: bool = True) -> NodeInfo | None:
         """
         Query a node.
@@ -1770,6 +2563,47 @@ class AsyncServer(BaseServer):
         await self.sync()
         return self
 
+    async def snapshot_tree(
+        self,
+        group: Group | None = None,
+        include_controls: bool | Iterable[SupportsInt] = False,
+        timeout: float = 1.0,
+    ) -> QueryTreeGroup:
+        """
+        Snapshot the server's node tree.
+
+        Build the tree from the node notifications already received rather than
+        querying the server, emitting ``/s_getn`` requests, followed by a ``/sync``,
+        only to refresh the control values of the synths requested. Only synths added
+        by this client have known synthdefs, so other clients' synths are unnamed and
+        have no control values.
+
+        :param group: The group whose tree to snapshot. Defaults to the root node.
+        :param include_controls: Flag for including every synth's control values, or
+            the synths whose control values to include.
+        :param timeout: The number of seconds to wait on control value replies.
+        """
+        self._validate_can_request()
+        requests = self._get_tree_control_requests(group, include_controls)
+        if not requests:
+            return self._get_tree_snapshot(group, [])
+        requests.append(Sync(sync_id=self._get_next_sync_id()))
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[Response]] = [
+            loop.create_future() for _ in requests
+        ]
+        _, callbacks = self._send_queries(
+            requests, lambda index, response: futures[index].set_result(response)
+        )
+        try:
+            # Replies to /s_getn precede /synced, unless their synth has since ended
+            await asyncio.wait_for(futures[-1], timeout)
+        finally:
+            self._osc_protocol.unregister_many(callbacks)
+        return self._get_tree_snapshot(
+            group, [future.result() for future in futures if future.done()]
+        )
+
     async def sync(
         self, sync_id: int | None = None, timeout: float = 1.0
     ) -> "AsyncServer":
@@ -1812,6 +2646,75 @@ class AsyncServer(BaseServer):
         # TODO: Implemented here because BaseServer does not define _osc_protocol
         self._osc_protocol.unregister(callback)
 
+    async def upload_buffer(
+        self,
+        buffer: Buffer,
+        array: "numpy.ndarray",
+        *,
+        starting_frame: int = 0,
+        timeout: float = 1.0,
+        use_file: bool | None = None,
+    ) -> None:
+        """
+        Upload a NumPy array into a buffer.
+
+        Emit ``/b_read`` requests via a temporary soundfile if the server is local,
+        otherwise pipelined ``/b_setn`` requests.
+
+        :param buffer: The buffer whose samples to set.
+        :param array: A ``(frame_count,)`` array for single-channel buffers, otherwise
+            a ``(frame_count, channel_count)`` array.
+        :param starting_frame: The frame to start uploading at.
+        :param timeout: The number of seconds to wait on each reply.
+        :param use_file: Flag for transferring via a temporary soundfile, which
+            requires the server to share this machine's filesystem. Defaults to
+            whether the server is local.
+        """
+        from ..soundfiles import write_float_wave
+
+        self._validate_can_request()
+        buffer_info = cast(
+            BufferInfo,
+            await QueryBuffer(buffer_ids=[int(buffer)]).communicate_async(
+                server=self, timeout=timeout
+            ),
+        ).items[0]
+        array = self._validate_buffer_upload(buffer_info, array, starting_frame)
+        if use_file if use_file is not None else self._is_local():
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "buffer.wav"
+                write_float_wave(path, array, int(buffer_info.sample_rate))
+                self.send(
+                    ReadBuffer(
+                        buffer_id=buffer,
+                        path=path,
+                        starting_frame_in_buffer=starting_frame,
+                    )
+                )
+                await self.sync(timeout=timeout)
+            return
+        samples = array.reshape(-1)
+        offset = starting_frame * buffer_info.channel_count
+        loop = asyncio.get_running_loop()
+        synced: asyncio.Future[OscMessage] | None = None
+        # Keep one window of /b_setn in flight while waiting on the previous one
+        for chunks in group_by_count(
+            self._get_buffer_chunks(offset, len(samples)), _BUFFER_CHUNKS_IN_FLIGHT
+        ):
+            for index, count in chunks:
+                values = samples[index - offset : index - offset + count].tolist()
+                self.send(SetBufferRange(buffer_id=buffer, items=[(index, values)]))
+            if synced is not None:
+                await asyncio.wait_for(synced, timeout)
+            synced = loop.create_future()
+            sync_id = self._get_next_sync_id()
+            self._osc_protocol.register(
+                pattern=["/synced", sync_id], procedure=synced.set_result, once=True
+            )
+            self.send(Sync(sync_id=sync_id))
+        if synced is not None:
+            await asyncio.wait_for(synced, timeout)
+
     ### PUBLIC PROPERTIES ###
 
     @property
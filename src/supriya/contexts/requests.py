@@ -18,7 +18,7 @@ from typing import (
 from uqbar.objects import new
 
 from ..enums import AddAction, HeaderFormat, RequestName, SampleFormat
-from ..osc import OscArgument, OscBundle, OscMessage
+from ..osc import BUNDLE_PREFIX, OscArgument, OscBundle, OscMessage, OscTemplate
 from ..typing import AddActionLike, HeaderFormatLike, SampleFormatLike, SupportsOsc
 from ..ugens import SynthDef, compile_synthdefs
 from .responses import Response
@@ -459,6 +459,27 @@ class DumpTree(Request):
         return OscMessage(RequestName.GROUP_DUMP_TREE, *contents)
 
 
+@dataclasses.dataclass
+class EncodedRequest(Request):
+    """
+    A request stored as an already-encoded OSC datagram.
+
+    ::
+
+        >>> from supriya.contexts.requests import EncodedRequest, FreeNode
+        >>> request = EncodedRequest(FreeNode(node_ids=[1000]).to_osc().to_datagram())
+        >>> request.to_osc()
+        OscMessage('/n_free', 1000)
+    """
+
+    datagram: bytes
+
+    def to_osc(self) -> OscBundle | OscMessage:
+        if self.datagram.startswith(BUNDLE_PREFIX):
+            return OscBundle.from_datagram(self.datagram)
+        return OscMessage.from_datagram(self.datagram)
+
+
 @dataclasses.dataclass
 class FillBuffer(Request):
     """
@@ -777,7 +798,7 @@ class GetBuffer(Request):
     def _get_response_patterns(
         self,
     ) -> tuple[Sequence[float | str] | None, Sequence[float | str] | None]:
-        return ["/b_set", int(self.buffer_id)], None
+        return ["/b_set", int(self.buffer_id), int(self.indices[0])], None
 
     def to_osc(self) -> OscMessage:
         return OscMessage(
@@ -809,7 +830,7 @@ class GetBufferRange(Request):
     def _get_response_patterns(
         self,
     ) -> tuple[Sequence[float | str] | None, Sequence[float | str] | None]:
-        return ["/b_setn", int(self.buffer_id)], None
+        return ["/b_setn", int(self.buffer_id), int(self.items[0][0])], None
 
     def to_osc(self) -> OscMessage:
         contents: list[OscArgument] = [int(self.buffer_id)]
@@ -893,7 +914,12 @@ class GetSynthControl(Request):
     def _get_response_patterns(
         self,
     ) -> tuple[Sequence[float | str] | None, Sequence[float | str] | None]:
-        return ["/n_set", int(self.synth_id)], None
+        control = self.controls[0]
+        return [
+            "/n_set",
+            int(self.synth_id),
+            control if isinstance(control, str) else int(control),
+        ], None
 
     def to_osc(self) -> OscMessage:
         contents: list[OscArgument] = [int(self.synth_id)]
@@ -1814,9 +1840,7 @@ class SetBufferRange(Request):
     def to_osc(self) -> OscMessage:
         contents: list[OscArgument] = [int(self.buffer_id)]
         for index, values in self.items:
-            contents.extend(
-                [int(index), len(values), *(float(value) for value in values)]
-            )
+            contents.extend([int(index), len(values), *map(float, values)])
         return OscMessage(RequestName.BUFFER_SET_CONTIGUOUS, *contents)
 
 
@@ -1880,9 +1904,7 @@ class SetControlBusRange(Request):
     def to_osc(self) -> OscMessage:
         contents: list[OscArgument] = []
         for index, values in self.items:
-            contents.extend(
-                [int(index), len(values), *(float(value) for value in values)]
-            )
+            contents.extend([int(index), len(values), *map(float, values)])
         return OscMessage(RequestName.CONTROL_BUS_SET_CONTIGUOUS, *contents)
 
 
@@ -1981,6 +2003,28 @@ class Sync(Request):
         return OscMessage(RequestName.SYNC, int(self.sync_id))
 
 
+@dataclasses.dataclass
+class TemplatedRequest(Request):
+    """
+    A request filling in an :py:class:`~supriya.osc.OscTemplate`.
+
+    ::
+
+        >>> from supriya.contexts.requests import TemplatedRequest
+        >>> from supriya.osc import OscTemplate
+        >>> template = OscTemplate("/n_set", 1000, "frequency", float)
+        >>> request = TemplatedRequest(template=template, values=[443.0])
+        >>> request.to_osc()
+        OscTemplateMessage('/n_set', 1000, 'frequency', 443.0)
+    """
+
+    template: OscTemplate
+    values: Sequence[float]
+
+    def to_osc(self) -> OscMessage:
+        return self.template(*self.values)
+
+
 @dataclasses.dataclass
 class ToggleErrorReporting(Request):
     """
@@ -2,6 +2,7 @@
 Classes for modeling responses from :term:`scsynth`.
 """
 
+import bisect
 import dataclasses
 import re
 from collections import deque
@@ -384,6 +385,23 @@ class QueryTreeSynth(QueryTreeNode):
         return result
 
 
+@dataclasses.dataclass
+class QueryTreeDiff:
+    """
+    The changes between two node tree snapshots.
+    """
+
+    added_ids: list[int] = dataclasses.field(default_factory=list)
+    changed_ids: list[int] = dataclasses.field(default_factory=list)
+    moved_ids: list[int] = dataclasses.field(default_factory=list)
+    removed_ids: list[int] = dataclasses.field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.added_ids or self.changed_ids or self.moved_ids or self.removed_ids
+        )
+
+
 @dataclasses.dataclass
 class QueryTreeGroup(QueryTreeNode):
     node_id: int
@@ -431,6 +449,85 @@ class QueryTreeGroup(QueryTreeNode):
                     )
         return root
 
+    def diff(self, other: "QueryTreeGroup") -> QueryTreeDiff:
+        """
+        Compare this tree against a later snapshot.
+
+        Nodes are moved when their parent changes, or when their order changes
+        relative to the siblings present in both trees. Synths are changed when their
+        synthdef names or control values change, and nodes are changed when they
+        switch between groups and synths.
+
+        :param other: The later snapshot.
+        """
+
+        def index(
+            root: QueryTreeGroup,
+        ) -> tuple[dict[int, QueryTreeNode], dict[int, int]]:
+            nodes: dict[int, QueryTreeNode] = {root.node_id: root}
+            parents: dict[int, int] = {}
+            for group in root.walk():
+                for child in group.children:
+                    nodes[child.node_id] = child
+                    parents[child.node_id] = group.node_id
+            return nodes, parents
+
+        old_nodes, old_parents = index(self)
+        new_nodes, new_parents = index(other)
+        diff = QueryTreeDiff(
+            added_ids=sorted(new_nodes.keys() - old_nodes.keys()),
+            removed_ids=sorted(old_nodes.keys() - new_nodes.keys()),
+        )
+        moved_ids: set[int] = set()
+        for node_id, new_node in new_nodes.items():
+            if (old_node := old_nodes.get(node_id)) is None:
+                continue
+            if old_parents.get(node_id) != new_parents.get(node_id):
+                moved_ids.add(node_id)
+            if type(old_node) is not type(new_node) or (
+                isinstance(old_node, QueryTreeSynth)
+                and isinstance(new_node, QueryTreeSynth)
+                and (
+                    old_node.synthdef_name != new_node.synthdef_name
+                    or old_node.controls != new_node.controls
+                )
+            ):
+                diff.changed_ids.append(node_id)
+            if not isinstance(new_node, QueryTreeGroup) or not isinstance(
+                old_node, QueryTreeGroup
+            ):
+                continue
+            # Siblings outside the longest subsequence kept in order have moved
+            old_positions = {
+                child.node_id: i for i, child in enumerate(old_node.children)
+            }
+            siblings = [
+                child.node_id
+                for child in new_node.children
+                if child.node_id in old_positions
+            ]
+            tails: list[int] = []
+            tail_indices: list[int] = []
+            previous_indices: list[int | None] = []
+            for i, sibling_id in enumerate(siblings):
+                j = bisect.bisect_left(tails, position := old_positions[sibling_id])
+                previous_indices.append(tail_indices[j - 1] if j else None)
+                if j == len(tails):
+                    tails.append(position)
+                    tail_indices.append(i)
+                else:
+                    tails[j] = position
+                    tail_indices[j] = i
+            kept: set[int] = set()
+            k = tail_indices[-1] if tail_indices else None
+            while k is not None:
+                kept.add(siblings[k])
+                k = previous_indices[k]
+            moved_ids.update(set(siblings) - kept)
+        diff.changed_ids.sort()
+        diff.moved_ids = sorted(moved_ids)
+        return diff
+
     @classmethod
     def from_query_tree_info(cls, response: QueryTreeInfo) -> "QueryTreeGroup":
         def recurse(
@@ -1,5 +1,7 @@
+import asyncio
+import time
 from threading import Lock
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Literal, cast
 
 from ..enums import AddAction, CalculationRate, ServerLifecycleEvent
 from ..exceptions import ServerOffline
@@ -9,7 +11,91 @@ from ..ugens.system import AMPLITUDE_SCOPE_SYNTHDEFS, FREQUENCY_SCOPE_SYNTHDEFS
 from .entities import Bus, BusGroup, Node, ScopeBuffer, Synth
 
 if TYPE_CHECKING:
+    import numpy
+
     from .realtime import BaseServer, ServerLifecycleCallback
+    from .shm import ServerSHM
+
+
+class ScopeReader:
+    """
+    A streaming reader over a scope buffer in server shared memory.
+
+    Channel and frame metadata are read once. Each poll copies only the frames
+    the writer pushed since the previous poll into a reusable NumPy buffer.
+
+    :param shared_memory: The server's shared memory interface.
+    :param index: The scope buffer index.
+    :param interval: The polling interval in seconds used when iterating.
+    """
+
+    def __init__(
+        self, shared_memory: "ServerSHM", index: int, interval: float = 1 / 60
+    ) -> None:
+        import numpy
+
+        self.channel_count, self.max_frames = shared_memory.describe_scope_buffer(index)
+        self.closed = False
+        self.frame_count = 0
+        self.index = index
+        self.interval = interval
+        self.shared_memory = shared_memory
+        self._buffer = numpy.zeros(
+            self.channel_count * self.max_frames, dtype=numpy.float32
+        )
+
+    def __aiter__(self) -> AsyncIterator["numpy.ndarray"]:
+        return self._iterate_async()
+
+    def __iter__(self) -> Iterator["numpy.ndarray"]:
+        while not self.closed:
+            if (frames := self.poll()) is not None:
+                yield frames
+            else:
+                time.sleep(self.interval)
+
+    async def _iterate_async(self) -> AsyncIterator["numpy.ndarray"]:
+        while not self.closed:
+            if (frames := self.poll()) is not None:
+                yield frames
+            else:
+                await asyncio.sleep(self.interval)
+
+    def close(self) -> None:
+        """
+        Close the reader, terminating any iteration.
+        """
+        self.closed = True
+
+    def poll(self) -> "numpy.ndarray | None":
+        """
+        Copy new frames if the writer has advanced, otherwise return ``None``.
+
+        The returned array is a view into the reader's reusable buffer, and is
+        overwritten by the next successful poll.
+        """
+        if self.closed:
+            return None
+        try:
+            changed, frame_count = self.shared_memory.pull_scope_buffer(
+                self.index, self._buffer
+            )
+        except RuntimeError:  # the scope buffer was freed
+            self.closed = True
+            return None
+        if not changed:
+            return None
+        self.frame_count = frame_count
+        return self.frames
+
+    @property
+    def frames(self) -> "numpy.ndarray":
+        """
+        Get the most recently pulled frames, shaped ``(frames, channels)``.
+        """
+        return self._buffer[: self.frame_count * self.channel_count].reshape(
+            self.frame_count, self.channel_count
+        )
 
 
 class BaseScope:
@@ -36,6 +122,7 @@ class BaseScope:
         self.lifecycle_callback: ServerLifecycleCallback | None = None
         self.lock = Lock()
         self.max_frames = 0
+        self.reader: ScopeReader | None = None
         self.scope_buffer: ScopeBuffer | None = None
         self.status: Literal["online", "offline"] = "offline"
         self.synth: Synth | None = None
@@ -86,11 +173,39 @@ class BaseScope:
             raise ValueError
         elif self.scope_buffer is None:
             raise ValueError
-        self.channel_count, self.max_frames = (
-            self.context._shared_memory.describe_scope_buffer(int(self.scope_buffer))
-        )
+        if not self.channel_count:
+            self.channel_count, self.max_frames = (
+                self.context._shared_memory.describe_scope_buffer(
+                    int(self.scope_buffer)
+                )
+            )
         return self.context._shared_memory.read_scope_buffer(int(self.scope_buffer))
 
+    def stream(self, interval: float = 1 / 60) -> ScopeReader:
+        """
+        Get a streaming reader over an online scope.
+
+        The reader yields new frames only when the scope has written them, and
+        closes when the scope stops.
+
+        :param interval: The polling interval in seconds used when iterating.
+        """
+        if not self.status == "online":
+            raise ValueError
+        elif self.context._shared_memory is None:
+            raise ValueError
+        elif self.scope_buffer is None:
+            raise ValueError
+        with self.lock:
+            if self.reader is None:
+                self.reader = ScopeReader(
+                    self.context._shared_memory, int(self.scope_buffer)
+                )
+                self.channel_count = self.reader.channel_count
+                self.max_frames = self.reader.max_frames
+            self.reader.interval = interval
+            return self.reader
+
     def stop(self) -> None:
         """
         Stop the scope.
@@ -98,6 +213,9 @@ class BaseScope:
         with self.lock:
             if self.status == "offline":
                 return
+            if self.reader:
+                self.reader.close()
+                self.reader = None
             if self.synth:
                 try:
                     self.synth.free()
@@ -7,11 +7,13 @@ the Bus/BusGroup dispatch logic from the original Cython implementation.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, Sequence, overload
 
 from supriya._shm import ServerSHM as _ServerSHM
 
 if TYPE_CHECKING:
+    import numpy
+
     from .entities import Bus, BusGroup
 
 
@@ -45,7 +47,7 @@ class ServerSHM:
     def __setitem__(self, item: Bus | int, value: float) -> None: ...
 
     @overload
-    def __setitem__(self, item: BusGroup | slice, value: list[float]) -> None: ...
+    def __setitem__(self, item: BusGroup | slice, value: Sequence[float]) -> None: ...
 
     def __setitem__(self, item, value):
         from .entities import Bus, BusGroup
@@ -66,5 +68,8 @@ class ServerSHM:
     def describe_scope_buffer(self, index: int) -> tuple[int, int]:
         return self._impl.describe_scope_buffer(index)
 
+    def pull_scope_buffer(self, index: int, out: "numpy.ndarray") -> tuple[bool, int]:
+        return self._impl.pull_scope_buffer(index, out)
+
     def read_scope_buffer(self, index: int) -> tuple[int, list[float]]:
         return self._impl.read_scope_buffer(index)
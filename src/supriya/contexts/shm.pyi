@@ -1,4 +1,6 @@
-from typing import overload
+from typing import Sequence, overload
+
+import numpy
 
 from supriya.contexts.entities import Bus as Bus
 from supriya.contexts.entities import BusGroup as BusGroup
@@ -6,6 +8,7 @@ from supriya.contexts.entities import BusGroup as BusGroup
 class ServerSHM:
     def __init__(self, port_number: int, bus_count: int) -> None: ...
     def describe_scope_buffer(self, index: int) -> tuple[int, int]: ...
+    def pull_scope_buffer(self, index: int, out: numpy.ndarray) -> tuple[bool, int]: ...
     def read_scope_buffer(self, index: int) -> tuple[int, list[float]]: ...
     @overload
     def __getitem__(self, item: Bus | int) -> float: ...
@@ -14,4 +17,4 @@ class ServerSHM:
     @overload
     def __setitem__(self, item: Bus | int, value: float) -> None: ...
     @overload
-    def __setitem__(self, item: BusGroup | slice, value: list[float]) -> None: ...
+    def __setitem__(self, item: BusGroup | slice, value: Sequence[float]) -> None: ...
@@ -0,0 +1,235 @@
+"""
+Tools for streaming continuous control updates to execution contexts.
+"""
+
+import collections
+import dataclasses
+import threading
+from typing import TYPE_CHECKING, Literal, Sequence, SupportsFloat
+
+from ..exceptions import ServerOffline
+from .entities import Node
+
+if TYPE_CHECKING:
+    from .core import Context
+
+_Batch = dict[Node, dict[int | str, SupportsFloat | Sequence[SupportsFloat]]]
+
+
+@dataclasses.dataclass
+class ParameterStreamStatistics:
+    """
+    Counters describing a :py:class:`ParameterStream`'s activity.
+    """
+
+    coalesced_count: int = 0
+    dropped_count: int = 0
+    merged_count: int = 0
+    peak_queue_depth: int = 0
+    sent_count: int = 0
+
+
+class ParameterStream:
+    """
+    A rate-limited stream of node control updates.
+
+    Updates overwrite any pending update to the same node control, and are only
+    sent when flushed, bundled together. Once started, a background thread flushes
+    pending updates and sends at most one bundle per tick, ``rate`` times per second,
+    while explicit flushes wait in a bounded outbound queue. Otherwise each flush
+    sends immediately. When the queue is full, a newly-flushed bundle is merged into
+    the newest queued bundle, or the oldest queued bundle is dropped.
+
+    ::
+
+        >>> from supriya import Score, default
+        >>> score = Score()
+        >>> with score.at(0):
+        ...     synth = score.add_synth(default)
+        ...
+        >>> stream = score.stream_parameters()
+        >>> for frequency in [440, 441, 442, 443]:
+        ...     stream.set(synth, frequency=frequency)
+        ...
+        >>> stream.flush(seconds=1)
+        >>> stream.statistics
+        ParameterStreamStatistics(coalesced_count=3, dropped_count=0, merged_count=0, peak_queue_depth=1, sent_count=1)
+
+    :param context: The context to send updates to.
+    :param rate: The background thread's ticks per second.
+    :param maximum_queue_depth: The number of flushed bundles the outbound queue
+        holds before applying the overflow policy.
+    :param overflow_policy: ``"merge"`` to merge new bundles into the newest queued
+        bundle, or ``"drop-oldest"`` to drop the oldest queued bundle.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        context: "Context",
+        rate: float = 60.0,
+        maximum_queue_depth: int = 8,
+        overflow_policy: Literal["drop-oldest", "merge"] = "merge",
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        if maximum_queue_depth < 1:
+            raise ValueError(
+                f"Maximum queue depth must be positive, got {maximum_queue_depth}"
+            )
+        if overflow_policy not in ("drop-oldest", "merge"):
+            raise ValueError(overflow_policy)
+        self.context = context
+        self.maximum_queue_depth = maximum_queue_depth
+        self.overflow_policy = overflow_policy
+        self.rate = rate
+        self.statistics = ParameterStreamStatistics()
+        self._lock = threading.Lock()
+        self._pending: _Batch = {}
+        self._queue: collections.deque[tuple[float | None, _Batch]] = (
+            collections.deque()
+        )
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "ParameterStream":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ### PRIVATE METHODS ###
+
+    def _enqueue(self, seconds: float | None) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            if len(self._queue) < self.maximum_queue_depth:
+                self._queue.append((seconds, batch))
+            elif self.overflow_policy == "merge":
+                _, newest = self._queue[-1]
+                for node, settings in batch.items():
+                    newest.setdefault(node, {}).update(settings)
+                self._queue[-1] = (seconds, newest)
+                self.statistics.merged_count += 1
+            else:
+                self._queue.popleft()
+                self._queue.append((seconds, batch))
+                self.statistics.dropped_count += 1
+            self.statistics.peak_queue_depth = max(
+                self.statistics.peak_queue_depth, len(self._queue)
+            )
+
+    def _run(self) -> None:
+        while not self._stopped.wait(1 / self.rate):
+            self._enqueue(None)
+            self._send_next()
+
+    def _send_next(self) -> bool:
+        with self._lock:
+            if not self._queue:
+                return False
+            seconds, batch = self._queue.popleft()
+        try:
+            with self.context.at(seconds):
+                for node, settings in batch.items():
+                    self.context.set_node(
+                        node,
+                        *((k, v) for k, v in settings.items() if isinstance(k, int)),
+                        **{k: v for k, v in settings.items() if isinstance(k, str)},
+                    )
+        except ServerOffline:
+            with self._lock:
+                self.statistics.dropped_count += 1 + len(self._queue)
+                self._queue.clear()
+            return False
+        with self._lock:
+            self.statistics.sent_count += 1
+        return True
+
+    ### PUBLIC METHODS ###
+
+    def flush(self, seconds: float | None = None) -> None:
+        """
+        Move pending updates into the outbound queue as one bundle.
+
+        Once started, queued bundles are left for the background thread to send.
+        Otherwise every queued bundle is sent immediately. Call from a clock callback
+        to flush on clock ticks.
+
+        :param seconds: The bundle's timestamp.
+        """
+        self._enqueue(seconds)
+        if self._thread is not None:
+            return
+        while self._send_next():
+            pass
+
+    def set(
+        self,
+        node: Node,
+        *indexed_settings: tuple[int, SupportsFloat | Sequence[SupportsFloat]],
+        **settings: SupportsFloat | Sequence[SupportsFloat],
+    ) -> None:
+        """
+        Set a node's controls on the next flush.
+
+        Safe to call from any thread.
+
+        :param node: The node whose controls will be set.
+        :param indexed_settings: A sequence of control indices to values.
+        :param settings: A mapping of control names to values.
+        """
+        items: list[tuple[int | str, SupportsFloat | Sequence[SupportsFloat]]] = [
+            *indexed_settings,
+            *settings.items(),
+        ]
+        with self._lock:
+            pending = self._pending.setdefault(node, {})
+            for control, value in items:
+                if control in pending:
+                    self.statistics.coalesced_count += 1
+                pending[control] = value
+
+    def start(self) -> None:
+        """
+        Start flushing and sending from a background thread.
+        """
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread, then flush and send everything outstanding.
+        """
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def pending_count(self) -> int:
+        """
+        Get the number of node controls awaiting a flush.
+        """
+        with self._lock:
+            return sum(len(settings) for settings in self._pending.values())
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get the number of flushed bundles awaiting sending.
+        """
+        with self._lock:
+            return len(self._queue)
@@ -0,0 +1,346 @@
+"""
+Storage engines for non-realtime score timelines.
+"""
+
+import bisect
+import struct
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterator, Sequence
+
+from ..osc import BUNDLE_PREFIX
+from .requests import EncodedRequest, Requestable
+
+
+def _encode_request(request: Requestable) -> bytes:
+    if isinstance(request, EncodedRequest):
+        return request.datagram
+    return request.to_osc().to_datagram()
+
+
+def _get_padded_length(length: int) -> int:
+    return (length // 4 + 1) * 4
+
+
+def _iterate_bundle_datagrams(datagram: bytes) -> Iterator[bytes]:
+    """
+    Iterate the element datagrams of a bundle datagram, without decoding them.
+    """
+    offset = len(BUNDLE_PREFIX) + 8
+    while offset < len(datagram):
+        (length,) = struct.unpack_from(">i", datagram, offset)
+        yield datagram[offset + 4 : offset + 4 + length]
+        offset += 4 + length
+
+
+def _join_completion(datagram: bytes, completion: bytes) -> bytes:
+    """
+    Append an "on completion" blob to a message datagram, without re-encoding it.
+    """
+    address_length = datagram.index(b"\x00")
+    type_tags_offset = _get_padded_length(address_length)
+    type_tags_length = datagram.index(b"\x00", type_tags_offset) - type_tags_offset
+    type_tags = datagram[type_tags_offset : type_tags_offset + type_tags_length]
+    body_offset = type_tags_offset + _get_padded_length(type_tags_length)
+    return b"".join(
+        [
+            datagram[:type_tags_offset],
+            (type_tags + b"b").ljust(_get_padded_length(type_tags_length + 1), b"\x00"),
+            datagram[body_offset:],
+            struct.pack(">I", len(completion)),
+            completion.ljust(len(completion) + (-len(completion) % 4), b"\x00"),
+        ]
+    )
+
+
+def _split_completion(datagram: bytes) -> tuple[bytes, bytes | None]:
+    """
+    Split a message datagram from its trailing "on completion" blob, if any.
+
+    Works on the raw datagram, so blobs such as compiled SynthDefs survive intact.
+    """
+    address_length = datagram.index(b"\x00")
+    type_tags_offset = _get_padded_length(address_length)
+    type_tags_length = datagram.index(b"\x00", type_tags_offset) - type_tags_offset
+    type_tags = datagram[type_tags_offset + 1 : type_tags_offset + type_tags_length]
+    # /d_recv's first blob is SynthDef data, not a completion message
+    minimum_count = 2 if datagram[:address_length] == b"/d_recv" else 1
+    if len(type_tags) < minimum_count or not type_tags.endswith(b"b"):
+        return datagram, None
+    offset = type_tags_offset + _get_padded_length(type_tags_length)
+    for type_tag in type_tags[:-1]:
+        if type_tag in b"if":
+            offset += 4
+        elif type_tag == ord("d"):
+            offset += 8
+        elif type_tag == ord("s"):
+            offset = datagram.index(b"\x00", offset)
+            offset += 4 - offset % 4
+        elif type_tag == ord("b"):
+            (length,) = struct.unpack_from(">I", datagram, offset)
+            offset += 4 + length + (-length % 4)
+        elif type_tag not in b"TFN[]":
+            raise ValueError(f"Unable to parse type {chr(type_tag)!r}")
+    (length,) = struct.unpack_from(">I", datagram, offset)
+    completion = datagram[offset + 4 : offset + 4 + length]
+    prefix = datagram[:type_tags_offset] + b"," + type_tags[:-1] + b"\x00"
+    prefix = prefix.ljust(_get_padded_length(len(prefix) - 1), b"\x00")
+    body_offset = type_tags_offset + _get_padded_length(type_tags_length)
+    return prefix + datagram[body_offset:offset], completion
+
+
+class BaseTimeline(ABC):
+    """
+    Abstract base for timelines of timestamped requests.
+    """
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    ### PUBLIC METHODS ###
+
+    @abstractmethod
+    def add(self, timestamp: float, requests: Sequence[Requestable]) -> None:
+        """
+        Add requests at a timestamp, after any already there.
+
+        Adding no requests still records the timestamp.
+
+        :param timestamp: The timestamp to add at.
+        :param requests: The requests to add.
+        """
+        raise NotImplementedError
+
+    def get(self, timestamp: float) -> list[Requestable]:
+        """
+        Get the requests at a timestamp.
+
+        :param timestamp: The timestamp to look up.
+        """
+        for _, requests in self.iterate(timestamp, timestamp, inclusive=True):
+            return requests
+        return []
+
+    @abstractmethod
+    def iterate(
+        self,
+        start: float | None = None,
+        stop: float | None = None,
+        inclusive: bool = False,
+    ) -> Iterator[tuple[float, list[Requestable]]]:
+        """
+        Iterate timestamps and their requests, in timestamp order.
+
+        :param start: The timestamp to start at, inclusive.
+        :param stop: The timestamp to stop at, exclusive unless ``inclusive``.
+        :param inclusive: Flag for including the stop timestamp.
+        """
+        raise NotImplementedError
+
+    def iterate_encoded(
+        self,
+        start: float | None = None,
+        stop: float | None = None,
+        inclusive: bool = False,
+    ) -> Iterator[tuple[float, list[bytes]]]:
+        """
+        Iterate timestamps and their requests' OSC datagrams, in timestamp order.
+
+        :param start: The timestamp to start at, inclusive.
+        :param stop: The timestamp to stop at, exclusive unless ``inclusive``.
+        :param inclusive: Flag for including the stop timestamp.
+        """
+        for timestamp, requests in self.iterate(start, stop, inclusive):
+            yield timestamp, [_encode_request(request) for request in requests]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    @abstractmethod
+    def timestamps(self) -> Sequence[float]:
+        """
+        Get the timeline's timestamps, in order.
+        """
+        raise NotImplementedError
+
+
+class Timeline(BaseTimeline):
+    """
+    A timeline storing request objects, keyed by timestamp.
+
+    Timestamps are kept sorted as they're added, so iteration never re-sorts.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._requests: dict[float, list[Requestable]] = {}
+        self._timestamps: list[float] = []
+        self._timestamps_tuple: tuple[float, ...] | None = ()
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    ### PUBLIC METHODS ###
+
+    def add(self, timestamp: float, requests: Sequence[Requestable]) -> None:
+        if timestamp not in self._requests:
+            self._requests[timestamp] = []
+            self._timestamps_tuple = None
+            if not self._timestamps or timestamp > self._timestamps[-1]:
+                self._timestamps.append(timestamp)
+            else:
+                bisect.insort(self._timestamps, timestamp)
+        self._requests[timestamp].extend(requests)
+
+    def iterate(
+        self,
+        start: float | None = None,
+        stop: float | None = None,
+        inclusive: bool = False,
+    ) -> Iterator[tuple[float, list[Requestable]]]:
+        start_index = (
+            0 if start is None else bisect.bisect_left(self._timestamps, start)
+        )
+        if stop is None:
+            stop_index = len(self._timestamps)
+        elif inclusive:
+            stop_index = bisect.bisect_right(self._timestamps, stop)
+        else:
+            stop_index = bisect.bisect_left(self._timestamps, stop)
+        for timestamp in self._timestamps[start_index:stop_index]:
+            yield timestamp, self._requests[timestamp]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def timestamps(self) -> Sequence[float]:
+        if self._timestamps_tuple is None:
+            self._timestamps_tuple = tuple(self._timestamps)
+        return self._timestamps_tuple
+
+
+class EncodedTimeline(BaseTimeline):
+    """
+    A compact timeline storing requests as encoded OSC datagrams.
+
+    Datagrams are appended to a single buffer, delimited by an array of offsets, with
+    their timestamps in a parallel array. Adding requests in timestamp order keeps
+    the sort index valid by appending to it. Adding out of order invalidates it, and
+    it is rebuilt once, on the next query. The distinct timestamp count and tuple are
+    cached alongside it.
+
+    Iterating requests decodes them lazily into
+    :py:class:`~supriya.contexts.requests.EncodedRequest` instances, while
+    :py:meth:`iterate_encoded` yields the stored datagrams directly.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+        self._offsets = array("Q", [0])
+        self._order: array | None = array("Q")
+        self._sorted_timestamps = array("d")
+        self._timestamp_count = 0
+        self._timestamps = array("d")
+        self._unique_timestamps: tuple[float, ...] | None = ()
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self) -> int:
+        self._get_index()
+        return self._timestamp_count
+
+    ### PRIVATE METHODS ###
+
+    def _get_index(self) -> tuple[array, array]:
+        if self._order is None:
+            self._order = array(
+                "Q",
+                sorted(range(len(self._timestamps)), key=self._timestamps.__getitem__),
+            )
+            self._sorted_timestamps = array(
+                "d", (self._timestamps[index] for index in self._order)
+            )
+            self._unique_timestamps = tuple(dict.fromkeys(self._sorted_timestamps))
+            self._timestamp_count = len(self._unique_timestamps)
+        return self._order, self._sorted_timestamps
+
+    ### PUBLIC METHODS ###
+
+    def add(self, timestamp: float, requests: Sequence[Requestable]) -> None:
+        # an empty datagram records the timestamp without any request
+        for datagram in [_encode_request(request) for request in requests] or [b""]:
+            self._data += datagram
+            self._offsets.append(len(self._data))
+            self._timestamps.append(timestamp)
+            if self._order is None:
+                continue
+            if self._sorted_timestamps and timestamp < self._sorted_timestamps[-1]:
+                self._order = None
+                self._unique_timestamps = None
+                continue
+            if not self._sorted_timestamps or timestamp != self._sorted_timestamps[-1]:
+                self._timestamp_count += 1
+                self._unique_timestamps = None
+            self._order.append(len(self._timestamps) - 1)
+            self._sorted_timestamps.append(timestamp)
+
+    def iterate(
+        self,
+        start: float | None = None,
+        stop: float | None = None,
+        inclusive: bool = False,
+    ) -> Iterator[tuple[float, list[Requestable]]]:
+        for timestamp, datagrams in self.iterate_encoded(start, stop, inclusive):
+            yield timestamp, [EncodedRequest(datagram) for datagram in datagrams]
+
+    def iterate_encoded(
+        self,
+        start: float | None = None,
+        stop: float | None = None,
+        inclusive: bool = False,
+    ) -> Iterator[tuple[float, list[bytes]]]:
+        order, timestamps = self._get_index()
+        index = 0 if start is None else bisect.bisect_left(timestamps, start)
+        if stop is None:
+            stop_index = len(timestamps)
+        elif inclusive:
+            stop_index = bisect.bisect_right(timestamps, stop)
+        else:
+            stop_index = bisect.bisect_left(timestamps, stop)
+        while index < stop_index:
+            timestamp, datagrams = timestamps[index], []
+            while index < stop_index and timestamps[index] == timestamp:
+                start_offset = self._offsets[order[index]]
+                stop_offset = self._offsets[order[index] + 1]
+                if stop_offset > start_offset:
+                    datagrams.append(bytes(self._data[start_offset:stop_offset]))
+                index += 1
+            yield timestamp, datagrams
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def size(self) -> int:
+        """
+        Get the approximate size in bytes of the timeline's storage.
+        """
+        return (
+            len(self._data)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._timestamps.itemsize * len(self._timestamps) * 2
+            + self._offsets.itemsize * len(self._order or ())
+        )
+
+    @property
+    def timestamps(self) -> Sequence[float]:
+        _, timestamps = self._get_index()
+        if self._unique_timestamps is None:
+            self._unique_timestamps = tuple(dict.fromkeys(timestamps))
+        return self._unique_timestamps
@@ -5,6 +5,8 @@ import contextlib
 import dataclasses
 import datetime
 import logging
+import math
+import operator
 import pprint
 import socket
 import socketserver
@@ -19,10 +21,13 @@ from typing import (
     Awaitable,
     Callable,
     Generator,
+    Iterable,
     Iterator,
     Literal,
     NamedTuple,
     Sequence,
+    SupportsFloat,
+    SupportsIndex,
     TypeAlias,
     Union,
     cast,
@@ -38,6 +43,11 @@ try:
 except ImportError:
     _osc_native = None  # type: ignore[assignment]
 
+# Older builds of the native module may not provide template filling
+_fill_template = getattr(_osc_native, "fill_template", None)
+# Older native builds decode every blob as a nested message, even SCgf files
+_native_lossless_blobs = getattr(_osc_native, "LOSSLESS_BLOBS", False)
+
 osc_protocol_logger = logging.getLogger(__name__)
 osc_in_logger = logging.getLogger("supriya.osc.in")
 osc_out_logger = logging.getLogger("supriya.osc.out")
@@ -219,6 +229,22 @@ class OscMessage:
             padded_length = (actual_length // 4 + 1) * 4
         return remainder[:padded_length][:actual_length], remainder[padded_length:]
 
+    @staticmethod
+    def _decode_packet(data: bytes) -> "bytes | OscBundle | OscMessage":
+        # Only blobs holding OSC packets which re-encode exactly are decoded, so
+        # others, like SCgf files in /d_recv, are kept as raw bytes
+        try:
+            packet: OscBundle | OscMessage
+            if data.startswith(BUNDLE_PREFIX):
+                packet = OscBundle.from_datagram(data)
+            elif data.startswith(b"/"):
+                packet = OscMessage.from_datagram(data)
+            else:
+                return data
+        except Exception:
+            return data
+        return packet if packet.to_datagram() == data else data
+
     @staticmethod
     def _decode_string(data: bytes) -> tuple[str, bytes]:
         actual_length = data.index(b"\x00")
@@ -289,7 +315,9 @@ class OscMessage:
             if isinstance(self.address, str):
                 return bytes(_osc_native.encode_message(self.address, *self.contents))
             else:
-                return bytes(_osc_native.encode_message_int(self.address, *self.contents))
+                return bytes(
+                    _osc_native.encode_message_int(self.address, *self.contents)
+                )
         # Fallback: pure Python
         if isinstance(self.address, str):
             encoded_address = self._encode_string(self.address)
@@ -309,7 +337,10 @@ class OscMessage:
     def from_datagram(cls, datagram: bytes) -> "OscMessage":
         if _osc_native is not None:
             address, contents = _osc_native.decode_message(datagram)
-            return cls(address, *contents)
+            if _native_lossless_blobs or not any(
+                isinstance(value, (OscBundle, OscMessage)) for value in contents
+            ):
+                return cls(address, *contents)
         # Fallback: pure Python
         remainder = datagram
         address, remainder = cls._decode_string(remainder)
@@ -331,13 +362,7 @@ class OscMessage:
                 array_stack[-1].append(value)
             elif type_tag == "b":
                 value, remainder = cls._decode_blob(remainder)
-                for class_ in (OscBundle, OscMessage):
-                    try:
-                        value = class_.from_datagram(value)
-                        break
-                    except Exception:
-                        pass
-                array_stack[-1].append(value)
+                array_stack[-1].append(cls._decode_packet(value))
             elif type_tag == "T":
                 array_stack[-1].append(True)
             elif type_tag == "F":
@@ -565,6 +590,169 @@ class OscBundle:
         return self
 
 
+class OscTemplate:
+    """
+    A pre-encoded OSC message with variable ``int`` or ``float`` arguments.
+
+    Pass the ``int`` or ``float`` types in place of arguments to be filled in later.
+    The address, type tags and fixed arguments are encoded once, and filling in the
+    template only patches the variable arguments' bytes.
+
+    ::
+
+        >>> from supriya.osc import OscMessage, OscTemplate
+        >>> template = OscTemplate("/n_set", 1000, "frequency", float, "gate", int)
+        >>> template
+        OscTemplate('/n_set', 1000, 'frequency', float, 'gate', int)
+
+    ::
+
+        >>> osc_message = template(443.0, 1)
+        >>> osc_message
+        OscTemplateMessage('/n_set', 1000, 'frequency', 443.0, 'gate', 1)
+
+    ::
+
+        >>> osc_message == OscMessage("/n_set", 1000, "frequency", 443.0, "gate", 1)
+        True
+
+    ::
+
+        >>> template.to_datagram(443.0, 1) == OscMessage(
+        ...     "/n_set", 1000, "frequency", 443.0, "gate", 1
+        ... ).to_datagram()
+        True
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self, address: OscAddress, *contents: OscArgument | type[float] | type[int]
+    ) -> None:
+        message = OscMessage(address)
+        if isinstance(message.address, str):
+            encoded_address = message._encode_string(message.address)
+        else:
+            encoded_address = struct.pack(">i", message.address)
+        encoded_type_tags = ","
+        encoded_contents = b""
+        indices: list[int] = []
+        offsets: list[int] = []
+        slot_type_tags = ""
+        for index, value in enumerate(contents):
+            if value is float or value is int:
+                type_tag = "f" if value is float else "i"
+                indices.append(index)
+                offsets.append(len(encoded_contents))
+                slot_type_tags += type_tag
+                encoded_type_tags += type_tag
+                encoded_contents += bytes(4)
+            else:
+                type_tags, encoded_value = message._encode_value(
+                    cast(OscArgument, value)
+                )
+                encoded_type_tags += type_tags
+                encoded_contents += encoded_value
+        header = encoded_address + message._encode_string(encoded_type_tags)
+        self.address = message.address
+        self.contents = tuple(contents)
+        self._datagram = header + encoded_contents
+        self._indices = tuple(indices)
+        self._offsets = tuple(len(header) + offset for offset in offsets)
+        self._slot_type_tags = slot_type_tags.encode()
+        self._structs = tuple(
+            struct.Struct(">f" if type_tag == "f" else ">i")
+            for type_tag in slot_type_tags
+        )
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, *values: float) -> "OscTemplateMessage":
+        return OscTemplateMessage(self, *values)
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                _.__name__ if _ is float or _ is int else repr(_)
+                for _ in [self.address, *self.contents]
+            ),
+        )
+
+    ### PUBLIC METHODS ###
+
+    def to_datagram(self, *values: float) -> bytes:
+        if len(values) != len(self._offsets):
+            raise ValueError(
+                f"Expected {len(self._offsets)} template values, got {len(values)}"
+            )
+        if _fill_template is not None:
+            return bytes(
+                _fill_template(
+                    self._datagram, self._offsets, self._slot_type_tags, *values
+                )
+            )
+        # Fallback: pure Python
+        datagram = bytearray(self._datagram)
+        try:
+            for struct_, offset, value in zip(self._structs, self._offsets, values):
+                try:
+                    struct_.pack_into(datagram, offset, value)
+                except OverflowError:
+                    # Match the native path, which narrows out-of-range floats to inf
+                    struct_.pack_into(datagram, offset, math.copysign(math.inf, value))
+        except struct.error as exception:
+            raise TypeError(str(exception)) from exception
+        return bytes(datagram)
+
+
+class OscTemplateMessage(OscMessage):
+    """
+    An OSC message filled in from an :py:class:`OscTemplate`.
+
+    Compares equal to any :py:class:`OscMessage` with the same address and contents,
+    but encodes via its template.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, template: OscTemplate, *values: float) -> None:
+        if len(values) != len(template._indices):
+            raise ValueError(
+                f"Expected {len(template._indices)} template values, got {len(values)}"
+            )
+        contents = list(template.contents)
+        coerced_values: list[float] = []
+        for index, value in zip(template._indices, values):
+            # Report what the datagram encodes, e.g. 440.0 rather than 440
+            if template.contents[index] is float and isinstance(value, SupportsFloat):
+                value = float(value)
+            elif template.contents[index] is int and isinstance(value, SupportsIndex):
+                value = operator.index(value)
+            contents[index] = value
+            coerced_values.append(value)
+        self.address = template.address
+        self.contents = tuple(cast(list[OscArgument], contents))
+        self.template = template
+        self.values = tuple(coerced_values)
+
+    ### SPECIAL METHODS ###
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, OscMessage):
+            return False
+        if self.address != other.address:
+            return False
+        if self.contents != other.contents:
+            return False
+        return True
+
+    ### PUBLIC METHODS ###
+
+    def to_datagram(self) -> bytes:
+        return self.template.to_datagram(*self.values)
+
+
 def format_messages(messages: Sequence[OscBundle | OscMessage]) -> str:
     """
     Format a sequence of OSC messages as a string.
@@ -706,6 +894,44 @@ class Capture:
         return entries
 
 
+class EmbeddedTransport:
+    """
+    An in-process datagram transport to an embedded scsynth World.
+
+    Packets are handed straight to the World, and replies are drained from the
+    World's in-process reply channel, bypassing the kernel's network stack and
+    UDP packet size limits.
+
+    :param send_packet: A callable passing a datagram to the World.
+    :param receive_packets: A callable waiting up to a timeout for reply
+        datagrams.
+    """
+
+    def __init__(
+        self,
+        send_packet: Callable[[bytes], bool],
+        receive_packets: Callable[[float], list[bytes]],
+    ) -> None:
+        self.closed = False
+        self.receive_packets = receive_packets
+        self.send_packet = send_packet
+
+    def close(self) -> None:
+        self.closed = True
+
+    def is_closing(self) -> bool:
+        return self.closed
+
+    def receive(self, timeout: float) -> list[bytes]:
+        if self.closed:
+            return []
+        return self.receive_packets(timeout)
+
+    def sendto(self, data: bytes, address: Any = None) -> None:
+        if self.closed or not self.send_packet(data):
+            raise OSError("Embedded World rejected packet")
+
+
 class OscProtocol:
     ### INITIALIZER ###
 
@@ -717,7 +943,9 @@ class OscProtocol:
         on_disconnect_callback: Callable | None = None,
         on_panic_callback: Callable | None = None,
     ) -> None:
-        self.callbacks: dict[Any, Any] = {}
+        # A trie of pattern items, whose nodes key callbacks by identity so they can
+        # be removed without scanning.
+        self.callbacks: dict[Any, tuple[dict[int, OscCallback], dict]] = {}
         self.captures: set[Capture] = set()
         self.healthcheck: HealthCheck | None = None
         self.healthcheck_osc_callback: OscCallback | None = None
@@ -750,8 +978,8 @@ class OscProtocol:
         for pattern in patterns:
             callback_map = self.callbacks
             for item in pattern:
-                callbacks, callback_map = callback_map.setdefault(item, ([], {}))
-            callbacks.append(callback)
+                callbacks, callback_map = callback_map.setdefault(item, ({}, {}))
+            callbacks[id(callback)] = callback
 
     def _disconnect(self, panicked: bool = False) -> Awaitable[None] | None:
         if panicked:
@@ -771,16 +999,21 @@ class OscProtocol:
 
     def _match_callbacks(self, message) -> list[OscCallback]:
         items = (message.address,) + message.contents
-        matching_callbacks = []
+        matching_callbacks: list[OscCallback] = []
         callback_map = self.callbacks
         for item in items:
-            if item not in callback_map:
+            try:
+                node = callback_map.get(item)
+            except TypeError:  # Arrays are unhashable, and never match
+                break
+            if node is None:
                 break
-            callbacks, callback_map = callback_map[item]
-            matching_callbacks.extend(callbacks)
+            callbacks, callback_map = node
+            matching_callbacks.extend(callbacks.values())
         for callback in matching_callbacks:
+            # Matching runs wherever the registry is mutated, so remove immediately
             if callback.once:
-                self.unregister(callback)
+                self._remove_callback(callback)
         return matching_callbacks
 
     def _on_connect(self, *, boot_future: FutureLike[bool]) -> Awaitable[None] | None:
@@ -819,23 +1052,26 @@ class OscProtocol:
         return None
 
     def _remove_callback(self, callback: OscCallback) -> None:
-        def delete(pattern, original_callback_map) -> None:
-            key = pattern.pop(0)
-            if key not in original_callback_map:
-                return
-            callbacks, callback_map = original_callback_map[key]
-            if pattern:
-                delete(pattern, callback_map)
-            if callback in callbacks:
-                callbacks.remove(callback)
-            if not callbacks and not callback_map:
-                original_callback_map.pop(key)
-
         patterns = [callback.pattern]
         if callback.failure_pattern:
             patterns.append(callback.failure_pattern)
         for pattern in patterns:
-            delete(list(pattern), self.callbacks)
+            path: list[tuple[dict, Any]] = []
+            callback_map = self.callbacks
+            for item in pattern:
+                if item not in callback_map:
+                    break
+                path.append((callback_map, item))
+                callbacks, callback_map = callback_map[item]
+            else:
+                if callbacks.pop(id(callback), None) is None:
+                    continue
+                # Prune the emptied branch, from the leaf upward
+                for parent_map, item in reversed(path):
+                    callbacks, callback_map = parent_map[item]
+                    if callbacks or callback_map:
+                        break
+                    del parent_map[item]
 
     def _register(
         self,
@@ -853,10 +1089,11 @@ class OscProtocol:
             failure_pattern = [failure_pattern]
         if not callable(procedure):
             raise ValueError(procedure)
-        osc_protocol_logger.info(
-            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
-            f"registering pattern: {pattern!r}"
-        )
+        if osc_protocol_logger.isEnabledFor(logging.INFO):
+            osc_protocol_logger.info(
+                f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+                f"registering pattern: {pattern!r}"
+            )
         return OscCallback(
             protocol=self,
             pattern=tuple(pattern),
@@ -870,29 +1107,40 @@ class OscProtocol:
     def _send(self, raw_message: SequenceABC | SupportsOsc | str) -> bytes:
         if self.status not in (BootStatus.BOOTING, BootStatus.ONLINE):
             raise OscProtocolOffline
-        if not isinstance(raw_message, (str, SequenceABC, SupportsOsc)):
-            raise ValueError(raw_message)
         message: OscBundle | OscMessage
-        if isinstance(raw_message, str):
+        # Check concrete types first, as runtime protocol checks are slow
+        if isinstance(raw_message, (OscBundle, OscMessage)):
+            message = raw_message
+        elif isinstance(raw_message, str):
             message = OscMessage(raw_message)
         elif isinstance(raw_message, SequenceABC):
             message = OscMessage(*raw_message)
-        else:
+        elif isinstance(raw_message, SupportsOsc):
             message = raw_message.to_osc()
-        osc_out_logger.debug(
-            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] {message!r}"
-        )
-        for capture in self.captures:
-            capture.add_entry(
-                timestamp=time.time(),
-                label="S",
-                message=message,
-                raw_message=raw_message,
+        else:
+            raise ValueError(raw_message)
+        # Loggers cache their enabled levels until reconfigured, so these checks are
+        # cheap, and skip formatting reprs nobody will read
+        if osc_out_logger.isEnabledFor(logging.DEBUG):
+            osc_out_logger.debug(
+                f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+                f"{message!r}"
             )
+        if self.captures:
+            timestamp = time.time()
+            for capture in self.captures:
+                capture.add_entry(
+                    timestamp=timestamp,
+                    label="S",
+                    message=message,
+                    raw_message=raw_message,
+                )
         datagram = message.to_datagram()
-        udp_out_logger.debug(
-            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] {datagram!r}"
-        )
+        if udp_out_logger.isEnabledFor(logging.DEBUG):
+            udp_out_logger.debug(
+                f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+                f"{datagram!r}"
+            )
         return datagram
 
     def _setup(
@@ -911,18 +1159,24 @@ class OscProtocol:
     def _validate_receive(
         self, datagram
     ) -> Generator[tuple[OscCallback, OscMessage], None, None]:
-        udp_in_logger.debug(
-            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] {datagram}"
-        )
+        if udp_in_logger.isEnabledFor(logging.DEBUG):
+            udp_in_logger.debug(
+                f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+                f"{datagram}"
+            )
         try:
             message = OscMessage.from_datagram(datagram)
         except Exception:
             raise
-        osc_in_logger.debug(
-            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] {message!r}"
-        )
-        for capture in self.captures:
-            capture.add_entry(timestamp=time.time(), label="R", message=message)
+        if osc_in_logger.isEnabledFor(logging.DEBUG):
+            osc_in_logger.debug(
+                f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+                f"{message!r}"
+            )
+        if self.captures:
+            timestamp = time.time()
+            for capture in self.captures:
+                capture.add_entry(timestamp=timestamp, label="R", message=message)
         for callback in self._match_callbacks(message):
             yield callback, message
 
@@ -949,12 +1203,29 @@ class OscProtocol:
     ) -> OscCallback:
         raise NotImplementedError
 
+    def register_many(
+        self,
+        registrations: Iterable[
+            tuple[
+                Sequence[float | str],
+                Callable[[OscMessage], Awaitable[None] | None],
+                Sequence[float | str] | None,
+            ]
+        ],
+        *,
+        once: bool = False,
+    ) -> list[OscCallback]:
+        raise NotImplementedError
+
     def send(self, message: SequenceABC | SupportsOsc | str) -> None:
         raise NotImplementedError
 
     def unregister(self, callback: OscCallback) -> None:
         raise NotImplementedError
 
+    def unregister_many(self, callbacks: Iterable[OscCallback]) -> None:
+        raise NotImplementedError
+
 
 class ThreadedOscProtocol(OscProtocol):
     class Server(socketserver.UDPServer):
@@ -997,9 +1268,9 @@ class ThreadedOscProtocol(OscProtocol):
         )
         self.boot_future: concurrent.futures.Future[bool] = concurrent.futures.Future()
         self.exit_future: concurrent.futures.Future[bool] = concurrent.futures.Future()
-        self.command_queue: Queue[tuple[Literal["add", "remove"], OscCallback]] = (
-            Queue()
-        )
+        self.command_queue: Queue[
+            tuple[Literal["add", "remove"], Sequence[OscCallback]]
+        ] = Queue()
         self.healthcheck_deadline = 0.0
         self.lock = threading.RLock()
 
@@ -1049,13 +1320,14 @@ class ThreadedOscProtocol(OscProtocol):
     def _process_command_queue(self) -> None:
         while self.command_queue.qsize():
             try:
-                action, callback = self.command_queue.get()
+                action, callbacks = self.command_queue.get()
             except Empty:
                 continue
-            if action == "add":
-                self._add_callback(callback)
-            elif action == "remove":
-                self._remove_callback(callback)
+            for callback in callbacks:
+                if action == "add":
+                    self._add_callback(callback)
+                elif action == "remove":
+                    self._remove_callback(callback)
 
     def _run_healthcheck(self) -> None:
         if self.healthcheck is None:
@@ -1146,18 +1418,48 @@ class ThreadedOscProtocol(OscProtocol):
         self.command_queue.put(
             (
                 "add",
-                callback := self._register(
-                    pattern,
-                    procedure,
-                    failure_pattern=failure_pattern,
-                    once=once,
-                    args=args,
-                    kwargs=kwargs,
-                ),
+                [
+                    callback := self._register(
+                        pattern,
+                        procedure,
+                        failure_pattern=failure_pattern,
+                        once=once,
+                        args=args,
+                        kwargs=kwargs,
+                    )
+                ],
             )
         )
         return callback
 
+    def register_many(
+        self,
+        registrations: Iterable[
+            tuple[
+                Sequence[float | str],
+                Callable[[OscMessage], Awaitable[None] | None],
+                Sequence[float | str] | None,
+            ]
+        ],
+        *,
+        once: bool = False,
+    ) -> list[OscCallback]:
+        """
+        Register many callbacks at once.
+
+        :param registrations: Triples of pattern, procedure and failure pattern.
+        :param once: Flag for unregistering each callback after its first match.
+        """
+        callbacks = [
+            self._register(
+                pattern, procedure, failure_pattern=failure_pattern, once=once
+            )
+            for pattern, procedure, failure_pattern in registrations
+        ]
+        # One command registers the whole batch before any of its replies dispatch.
+        self.command_queue.put(("add", callbacks))
+        return callbacks
+
     def send(self, message: SequenceABC | SupportsOsc | str) -> None:
         try:
             self.osc_server.socket.sendto(
@@ -1173,7 +1475,13 @@ class ThreadedOscProtocol(OscProtocol):
         Unregister a callback.
         """
         # Command queue prevents lock contention.
-        self.command_queue.put(("remove", callback))
+        self.command_queue.put(("remove", [callback]))
+
+    def unregister_many(self, callbacks: Iterable[OscCallback]) -> None:
+        """
+        Unregister many callbacks at once.
+        """
+        self.command_queue.put(("remove", list(callbacks)))
 
 
 class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
@@ -1202,6 +1510,11 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
 
     ### PRIVATE METHODS ###
 
+    async def _create_endpoint(self, ip_address: str, port: int) -> None:
+        await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: self, remote_addr=(ip_address, port)
+        )
+
     async def _disconnect(self, panicked: bool = False) -> None:
         super()._disconnect(panicked=panicked)
         self.transport.close()
@@ -1315,9 +1628,7 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         loop = asyncio.get_running_loop()
         self.boot_future = loop.create_future()
         self.exit_future = loop.create_future()
-        _, protocol = await loop.create_datagram_endpoint(
-            lambda: self, remote_addr=(ip_address, port)
-        )
+        await self._create_endpoint(ip_address, port)
         if self.healthcheck and self.healthcheck.active:
             self.healthcheck_task = loop.create_task(self._run_healthcheck())
         elif not self.healthcheck:
@@ -1357,8 +1668,167 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         )
         return callback
 
+    def register_many(
+        self,
+        registrations: Iterable[
+            tuple[
+                Sequence[float | str],
+                Callable[[OscMessage], Awaitable[None] | None],
+                Sequence[float | str] | None,
+            ]
+        ],
+        *,
+        once: bool = False,
+    ) -> list[OscCallback]:
+        """
+        Register many callbacks at once.
+
+        :param registrations: Triples of pattern, procedure and failure pattern.
+        :param once: Flag for unregistering each callback after its first match.
+        """
+        callbacks = [
+            self._register(
+                pattern, procedure, failure_pattern=failure_pattern, once=once
+            )
+            for pattern, procedure, failure_pattern in registrations
+        ]
+        for callback in callbacks:
+            self._add_callback(callback)
+        return callbacks
+
     def send(self, message: SequenceABC | SupportsOsc | str) -> None:
         self.transport.sendto(self._send(message))
 
     def unregister(self, callback: OscCallback) -> None:
         self._remove_callback(callback)
+
+    def unregister_many(self, callbacks: Iterable[OscCallback]) -> None:
+        """
+        Unregister many callbacks at once.
+        """
+        for callback in callbacks:
+            self._remove_callback(callback)
+
+
+class ThreadedEmbeddedOscProtocol(ThreadedOscProtocol):
+    """
+    A threaded OSC protocol talking to an embedded scsynth World in-process.
+
+    :param send_packet: A callable passing a datagram to the World.
+    :param receive_packets: A callable waiting up to a timeout for reply
+        datagrams.
+    """
+
+    class Server:  # type: ignore[no-redef]
+        """
+        Mimics the parts of :py:class:`socketserver.UDPServer` used by
+        :py:class:`ThreadedOscProtocol`, pumping the World's reply channel.
+        """
+
+        def __init__(
+            self, osc_protocol: "ThreadedEmbeddedOscProtocol", socket: EmbeddedTransport
+        ) -> None:
+            self._BaseServer__shutdown_request = False
+            self.osc_protocol = osc_protocol
+            self.socket = socket
+
+        def serve_forever(self, poll_interval: float = 0.5) -> None:
+            osc_protocol = self.osc_protocol
+            while not self._BaseServer__shutdown_request:
+                datagrams = self.socket.receive(poll_interval)
+                # Register pending callbacks before dispatching their replies
+                osc_protocol._process_command_queue()
+                for datagram in datagrams:
+                    for callback, message in osc_protocol._validate_receive(datagram):
+                        callback.procedure(
+                            message, *(callback.args or ()), **(callback.kwargs or {})
+                        )
+                if cast(HealthCheck, osc_protocol.healthcheck).active:
+                    osc_protocol._run_healthcheck()
+            self.socket.close()
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        *,
+        send_packet: Callable[[bytes], bool],
+        receive_packets: Callable[[float], list[bytes]],
+        name: str | None = None,
+        on_connect_callback: Callable | None = None,
+        on_disconnect_callback: Callable | None = None,
+        on_panic_callback: Callable | None = None,
+    ):
+        ThreadedOscProtocol.__init__(
+            self,
+            name=name,
+            on_connect_callback=on_connect_callback,
+            on_disconnect_callback=on_disconnect_callback,
+            on_panic_callback=on_panic_callback,
+        )
+        self.receive_packets = receive_packets
+        self.send_packet = send_packet
+
+    ### PRIVATE METHODS ###
+
+    def _server_factory(self, ip_address, port) -> "Server":  # type: ignore[override]
+        return self.Server(
+            self, EmbeddedTransport(self.send_packet, self.receive_packets)
+        )
+
+
+class AsyncEmbeddedOscProtocol(AsyncOscProtocol):
+    """
+    An :py:mod:`asyncio`-based OSC protocol talking to an embedded scsynth World
+    in-process.
+
+    Replies are drained from the World's reply channel on a helper thread and
+    handed to the event loop.
+
+    :param send_packet: A callable passing a datagram to the World.
+    :param receive_packets: A callable waiting up to a timeout for reply
+        datagrams.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        *,
+        send_packet: Callable[[bytes], bool],
+        receive_packets: Callable[[float], list[bytes]],
+        name: str | None = None,
+        on_connect_callback: Callable | None = None,
+        on_disconnect_callback: Callable | None = None,
+        on_panic_callback: Callable | None = None,
+    ) -> None:
+        AsyncOscProtocol.__init__(
+            self,
+            name=name,
+            on_connect_callback=on_connect_callback,
+            on_disconnect_callback=on_disconnect_callback,
+            on_panic_callback=on_panic_callback,
+        )
+        self.receive_packets = receive_packets
+        self.send_packet = send_packet
+
+    ### PRIVATE METHODS ###
+
+    async def _create_endpoint(self, ip_address: str, port: int) -> None:
+        loop = asyncio.get_running_loop()
+        transport = EmbeddedTransport(self.send_packet, self.receive_packets)
+        self.connection_made(transport)
+        threading.Thread(
+            args=(loop, transport), daemon=True, target=self._pump_replies
+        ).start()
+
+    def _pump_replies(
+        self, loop: asyncio.AbstractEventLoop, transport: EmbeddedTransport
+    ) -> None:
+        while not transport.is_closing():
+            for datagram in transport.receive(0.1):
+                try:
+                    loop.call_soon_threadsafe(self.datagram_received, datagram, None)
+                except RuntimeError:  # event loop closed
+                    transport.close()
+                    break
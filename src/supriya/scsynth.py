@@ -1,8 +1,10 @@
 import asyncio
 import atexit
 import concurrent.futures
+import concurrent.futures.process
 import enum
 import logging
+import multiprocessing
 import os
 import platform
 import re
@@ -16,6 +18,7 @@ from typing import (
     Callable,
     Iterator,
     Literal,
+    Sequence,
     cast,
 )
 
@@ -743,7 +746,13 @@ def _options_to_world_kwargs(options: Options) -> dict:
 
 
 class EmbeddedProcessProtocol(ProcessProtocol):
-    """Process protocol that runs scsynth in-process via libscsynth."""
+    """
+    Process protocol that runs scsynth in-process via libscsynth.
+
+    :param open_udp: Whether the World should listen on a UDP port. When false,
+        OSC is exchanged in-process via :py:meth:`send_packet` and
+        :py:meth:`receive_packets`.
+    """
 
     _active_world: bool = False
 
@@ -754,6 +763,7 @@ class EmbeddedProcessProtocol(ProcessProtocol):
         on_boot_callback: Callable | None = None,
         on_panic_callback: Callable | None = None,
         on_quit_callback: Callable | None = None,
+        open_udp: bool = True,
     ) -> None:
         super().__init__(
             name=name,
@@ -765,6 +775,7 @@ class EmbeddedProcessProtocol(ProcessProtocol):
         self.boot_future: concurrent.futures.Future[bool] = concurrent.futures.Future()
         self.exit_future: concurrent.futures.Future[int] = concurrent.futures.Future()
         self._world = None
+        self.open_udp = open_udp
         self.thread: threading.Thread | None = None
 
     def _boot(self, options: Options) -> bool:
@@ -789,7 +800,12 @@ class EmbeddedProcessProtocol(ProcessProtocol):
     def boot(self, options: Options) -> None:
         if not self._boot(options):
             return
-        from supriya._scsynth import set_print_func, world_new, world_open_udp
+        from supriya._scsynth import (
+            set_print_func,
+            set_reply_channel,
+            world_new,
+            world_open_udp,
+        )
 
         self.boot_future = concurrent.futures.Future()
         self.exit_future = concurrent.futures.Future()
@@ -812,8 +828,10 @@ class EmbeddedProcessProtocol(ProcessProtocol):
             self.status = BootStatus.OFFLINE
             raise ServerCannotBoot(str(exc)) from exc
 
-        # Open UDP
-        if not world_open_udp(self._world, options.ip_address, options.port):
+        # Open UDP, or route replies to the in-process reply channel
+        if not self.open_udp:
+            set_reply_channel(True)
+        elif not world_open_udp(self._world, options.ip_address, options.port):
             from supriya._scsynth import world_cleanup
 
             world_cleanup(self._world)
@@ -855,10 +873,16 @@ class EmbeddedProcessProtocol(ProcessProtocol):
         self.thread.start()
 
     def _wait_for_quit(self) -> None:
-        from supriya._scsynth import set_print_func, world_wait_for_quit
+        from supriya._scsynth import (
+            set_print_func,
+            set_reply_channel,
+            world_wait_for_quit,
+        )
 
         world_wait_for_quit(self._world, False)  # blocks until /quit
         set_print_func(None)  # prevent callback into dead Python objects
+        if not self.open_udp:
+            set_reply_channel(False)  # wakes any pending receive_packets()
         was_quitting = self.status == BootStatus.QUITTING
         self.status = BootStatus.OFFLINE
         self._world = None
@@ -892,6 +916,26 @@ class EmbeddedProcessProtocol(ProcessProtocol):
             "... quit!"
         )
 
+    def receive_packets(self, timeout: float) -> list[bytes]:
+        """
+        Wait up to ``timeout`` seconds for replies from the World.
+
+        Only meaningful when the World was booted with ``open_udp=False``.
+        """
+        from supriya._scsynth import receive_replies
+
+        return receive_replies(timeout)
+
+    def send_packet(self, datagram: bytes) -> bool:
+        """
+        Pass an OSC datagram directly to the World.
+        """
+        if (world := self._world) is None:
+            return False
+        from supriya._scsynth import world_send_packet
+
+        return world_send_packet(world, datagram)
+
 
 class AsyncNonrealtimeProcessProtocol(asyncio.SubprocessProtocol, ProcessProtocol):
     def __init__(self) -> None:
@@ -938,3 +982,133 @@ class AsyncNonrealtimeProcessProtocol(asyncio.SubprocessProtocol, ProcessProtoco
                 self.boot_future.set_result(False)
         except asyncio.exceptions.InvalidStateError:
             pass
+
+
+_embedded_nonrealtime_executor: concurrent.futures.ProcessPoolExecutor | None = None
+
+
+def _discard_embedded_nonrealtime_executor(
+    executor: concurrent.futures.ProcessPoolExecutor,
+) -> None:
+    global _embedded_nonrealtime_executor
+    if _embedded_nonrealtime_executor is executor:
+        _embedded_nonrealtime_executor = None
+    executor.shutdown(wait=False)
+
+
+def _get_embedded_nonrealtime_executor() -> concurrent.futures.ProcessPoolExecutor:
+    global _embedded_nonrealtime_executor
+    if _embedded_nonrealtime_executor is None:
+        # Spawn rather than fork: the parent is typically multithreaded, and
+        # libscsynth's global state must not be inherited mid-flight.
+        _embedded_nonrealtime_executor = concurrent.futures.ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _embedded_nonrealtime_executor
+
+
+def _render_nonrealtime_embedded(
+    world_kwargs: dict, arguments: Sequence[str]
+) -> tuple[int, str]:
+    """Run one non-realtime render inside a worker process."""
+    from ._scsynth import set_print_func, world_new, world_nonrealtime_synthesis
+
+    (
+        command_file_path,
+        input_file_path,
+        output_file_path,
+        sample_rate,
+        header_format,
+        sample_format,
+    ) = arguments
+    output: list[str] = []
+    set_print_func(output.append)
+    try:
+        world = world_new(**world_kwargs)
+        world_nonrealtime_synthesis(
+            world,
+            command_file_path,
+            None if input_file_path == "_" else input_file_path,
+            output_file_path,
+            int(float(sample_rate)),
+            header_format,
+            sample_format,
+            num_input_bus_channels=world_kwargs["num_input_bus_channels"],
+            num_output_bus_channels=world_kwargs["num_output_bus_channels"],
+            block_size=world_kwargs["block_size"],
+        )
+        exit_code = 0
+    except RuntimeError as exc:
+        output.append(f"ERROR: {exc}\n")
+        exit_code = 1
+    finally:
+        set_print_func(None)
+    return exit_code, "".join(output)
+
+
+class AsyncEmbeddedNonrealtimeProcessProtocol(ProcessProtocol):
+    """
+    Non-realtime process protocol that renders via libscsynth instead of spawning
+    ``scsynth -N``.
+
+    Only one World can exist per process, so renders are dispatched to a shared pool
+    of worker processes. Workers outlive individual renders, so interpreter startup
+    and library initialization are paid once per worker rather than once per score.
+    """
+
+    def __init__(self) -> None:
+        ProcessProtocol.__init__(self)
+        self.boot_future: asyncio.Future[bool] = asyncio.Future()
+        self.exit_future: asyncio.Future[int] = asyncio.Future()
+
+    async def run(
+        self, options: Options, arguments: Sequence[str], render_directory_path: Path
+    ) -> None:
+        """
+        Render a command file.
+
+        :param options: The options to create the World with.
+        :param arguments: The arguments ``scsynth`` would receive after ``-N``.
+        :param render_directory_path: The directory relative paths resolve against.
+        """
+        from . import _scsynth  # noqa: F401
+
+        loop = asyncio.get_running_loop()
+        self.boot_future = loop.create_future()
+        self.exit_future = loop.create_future()
+        command_file_path, input_file_path, output_file_path, *rest = arguments
+        arguments_ = [
+            str(render_directory_path / command_file_path),
+            input_file_path,
+            str(render_directory_path / output_file_path),
+            *rest,
+        ]
+        world_kwargs = _options_to_world_kwargs(options)
+        world_kwargs.update(
+            preferred_sample_rate=int(float(rest[0])),
+            realtime=False,
+            rendezvous=False,
+            shared_memory_id=0,
+        )
+        logger.info(f"running (embedded): -N {shlex.join(arguments_)}")
+        executor = _get_embedded_nonrealtime_executor()
+        try:
+            exit_code, text = await loop.run_in_executor(
+                executor,
+                _render_nonrealtime_embedded,
+                world_kwargs,
+                arguments_,
+            )
+        except concurrent.futures.process.BrokenProcessPool as exception:
+            # A worker died mid-render, and a broken pool rejects all further work,
+            # so discard it and let the next render spawn a fresh one
+            _discard_embedded_nonrealtime_executor(executor)
+            logger.warning(f"render failed: {exception!r}")
+            self.boot_future.set_result(False)
+            self.exit_future.set_exception(exception)
+            return
+        self._handle_data_received(boot_future=self.boot_future, text=text)
+        logger.info(f"render exited with {exit_code}.")
+        self.exit_future.set_result(exit_code)
+        if not self.boot_future.done():
+            self.boot_future.set_result(exit_code == 0)
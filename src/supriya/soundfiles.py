@@ -6,14 +6,22 @@ import asyncio
 import dataclasses
 import hashlib
 import shlex
+import struct
 from os import PathLike
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from uqbar.io import find_executable
 from uqbar.strings import to_dash_case
 
 from . import output_path
 
+if TYPE_CHECKING:
+    import numpy
+
+WAVE_FORMAT_IEEE_FLOAT = 3
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
 
 @dataclasses.dataclass(frozen=True)
 class Say:
@@ -139,3 +147,82 @@ class Say:
             render_directory_path = Path(output_path).resolve()
             output_file_path = render_directory_path / self._build_file_path()
         return output_file_path
+
+
+def read_float_wave(file_path: PathLike) -> "numpy.ndarray":
+    """
+    Read a 32-bit float WAVE file, e.g. as written by ``/b_write``.
+
+    Returns a ``(frame_count, channel_count)`` float32 array.
+
+    :param file_path: The file path to read from.
+    """
+    import numpy
+
+    data = Path(file_path).read_bytes()
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise ValueError(f"Not a WAVE file: {file_path}")
+    channel_count: int | None = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset : offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+        offset += 8
+        if chunk_id == b"fmt ":
+            format_tag, channel_count, _, _, _, bits_per_sample = struct.unpack_from(
+                "<HHIIHH", data, offset
+            )
+            if bits_per_sample != 32 or format_tag not in (
+                WAVE_FORMAT_IEEE_FLOAT,
+                WAVE_FORMAT_EXTENSIBLE,
+            ):
+                raise ValueError(f"Not a 32-bit float WAVE file: {file_path}")
+        elif chunk_id == b"data":
+            if channel_count is None:
+                raise ValueError(f"Missing format chunk: {file_path}")
+            # Unfinalized files may claim more data than they hold
+            frame_count = min(chunk_size, len(data) - offset) // (4 * channel_count)
+            return (
+                numpy.frombuffer(
+                    data, dtype="<f4", count=frame_count * channel_count, offset=offset
+                )
+                .astype(numpy.float32)
+                .reshape(frame_count, channel_count)
+            )
+        offset += chunk_size + chunk_size % 2
+    raise ValueError(f"Missing data chunk: {file_path}")
+
+
+def write_float_wave(
+    file_path: PathLike, array: "numpy.ndarray", sample_rate: int = 44100
+) -> None:
+    """
+    Write a ``(frame_count, channel_count)`` array as a 32-bit float WAVE file.
+
+    :param file_path: The file path to write to.
+    :param array: The samples to write.
+    :param sample_rate: The sample rate to record in the file header.
+    """
+    import numpy
+
+    frame_count, channel_count = array.shape
+    samples = numpy.ascontiguousarray(array, dtype="<f4").tobytes()
+    format_chunk = struct.pack(
+        "<HHIIHHH",
+        WAVE_FORMAT_IEEE_FLOAT,
+        channel_count,
+        sample_rate,
+        sample_rate * channel_count * 4,
+        channel_count * 4,
+        32,
+        0,
+    )
+    with open(file_path, "wb") as file_pointer:
+        file_pointer.write(b"RIFF")
+        file_pointer.write(struct.pack("<I", 4 + 26 + 12 + 8 + len(samples)))
+        file_pointer.write(b"WAVE")
+        file_pointer.write(b"fmt " + struct.pack("<I", len(format_chunk)))
+        file_pointer.write(format_chunk)
+        file_pointer.write(b"fact" + struct.pack("<II", 4, frame_count))
+        file_pointer.write(b"data" + struct.pack("<I", len(samples)))
+        file_pointer.write(samples)
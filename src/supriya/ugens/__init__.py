@@ -21,8 +21,10 @@ from .core import (  # isort:skip
     UGenSerializable,
     UGenVector,
     UnaryOpUGen,
+    _write_generated_code,
     compile_synthdefs,
     decompile_synthdef,
+    decompile_synthdef_directory,
     decompile_synthdefs,
     param,
     synthdef,
@@ -359,6 +361,9 @@ from .triggers import (
     ZeroCrossing,
 )
 
+# cache the code generated by @ugen above, so later imports skip compiling it
+_write_generated_code()
+
 __all__ = [
     "A2K",
     "APF",
@@ -726,6 +731,7 @@ __all__ = [
     "ZeroCrossing",
     "compile_synthdefs",
     "decompile_synthdef",
+    "decompile_synthdef_directory",
     "decompile_synthdefs",
     "default",
     "param",
@@ -1,19 +1,25 @@
 import abc
+import concurrent.futures
 import copy
 import enum
 import hashlib
+import importlib.util
 import inspect
+import marshal
 import math
+import multiprocessing
 import operator
+import os
 import struct
 import subprocess
+import sys
 import tempfile
 import threading
 import uuid
 from enum import Enum
 from itertools import zip_longest
 from pathlib import Path
-from types import MappingProxyType
+from types import CodeType, MappingProxyType
 from typing import (
     Callable,
     Iterable,
@@ -48,6 +54,15 @@ from ..enums import (
 from ..typing import MISSING, CalculationRateLike, Default, Missing, ParameterRateLike
 from ..utils import flatten, iterate_nwise
 
+try:
+    from .. import _synthdef as _synthdef_native
+except ImportError:
+    _synthdef_native = None  # type: ignore[assignment]
+
+_generated_code: dict[str, CodeType] | None = None
+_generated_code_misses = 0
+_generated_code_used: dict[str, CodeType] = {}
+
 
 class Check(Enum):
     """
@@ -177,6 +192,34 @@ def _add_rate_fn(
     )
 
 
+def _add_slots(cls: Type["UGen"]) -> Type["UGen"]:
+    """
+    Recreate a UGen class with empty ``__slots__``, akin to dataclass(slots=True).
+
+    UGen declares all instance attributes as slots, so instances of decorated
+    classes carry no ``__dict__``.
+    """
+    if "__slots__" in cls.__dict__:
+        return cls
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = ()
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    metaclass: type = type(cls)
+    new_cls = metaclass(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    # Rebind the __class__ cells used by zero-argument super()
+    for value in namespace.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            value = value.__func__
+        elif isinstance(value, property):
+            value = value.fget
+        for cell in getattr(value, "__closure__", None) or ():
+            if cell.cell_contents is cls:
+                cell.cell_contents = new_cls
+    return new_cls
+
+
 def _create_fn(
     *,
     cls,
@@ -198,7 +241,7 @@ def _create_fn(
     local_vars = ", ".join(locals_.keys())
     text = f"def __create_fn__({local_vars}):\n{text}\n    return {name}"
     namespace: dict[str, Callable] = {}
-    exec(text, globals_, namespace)
+    exec(_get_generated_code(text), globals_, namespace)
     value = namespace["__create_fn__"](**locals_)
     value.__qualname__ = f"{cls.__qualname__}.{value.__name__}"
     if decorator:
@@ -206,6 +249,71 @@ def _create_fn(
     setattr(cls, name, value)
 
 
+def _get_generated_code(text: str) -> CodeType:
+    """
+    Get generated source text's code object, compiling it only on a cache miss.
+
+    Code objects are cached on disk beside the module's bytecode, keyed by a hash
+    of their source text, so imports after the first skip compilation entirely.
+    """
+    global _generated_code, _generated_code_misses
+    if _generated_code is None:
+        _generated_code = _read_generated_code()
+    key = hashlib.sha256(text.encode()).hexdigest()
+    if (code := _generated_code.get(key)) is None:
+        code = _generated_code[key] = compile(text, "<string>", "exec")
+        _generated_code_misses += 1
+    _generated_code_used[key] = code
+    return code
+
+
+def _get_generated_code_path() -> Path | None:
+    try:
+        path = Path(importlib.util.cache_from_source(__file__))
+    except NotImplementedError:
+        return None
+    return path.with_name(f"ugens.{sys.implementation.cache_tag}.marshal")
+
+
+def _read_generated_code() -> dict[str, CodeType]:
+    if (path := _get_generated_code_path()) is None:
+        return {}
+    try:
+        data = path.read_bytes()
+        if not data.startswith(importlib.util.MAGIC_NUMBER):
+            return {}
+        return marshal.loads(data[len(importlib.util.MAGIC_NUMBER) :])
+    except (EOFError, OSError, TypeError, ValueError):
+        return {}
+
+
+def _write_generated_code() -> None:
+    """
+    Write the code objects generated so far to the on-disk cache, if changed.
+
+    Only code used since startup is kept, so stale entries are pruned.
+    """
+    if (
+        sys.dont_write_bytecode
+        or _generated_code is None
+        or (
+            not _generated_code_misses
+            and len(_generated_code_used) == len(_generated_code)
+        )
+        or (path := _get_generated_code_path()) is None
+    ):
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(file_descriptor, "wb") as file_pointer:
+            file_pointer.write(importlib.util.MAGIC_NUMBER)
+            marshal.dump(_generated_code_used, file_pointer)
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
+
+
 def _format_value(value) -> str:
     if value == float("inf"):
         value_repr = 'float("inf")'
@@ -293,7 +401,7 @@ def _process_class(
     cls._valid_calculation_rates = tuple(valid_calculation_rates)
     if signal_range is not None:
         cls._signal_range = SignalRange.from_expr(signal_range)
-    return cls
+    return _add_slots(cls)
 
 
 def param(
@@ -377,25 +485,31 @@ def _compute_binary_op(
     special_index: BinaryOperator,
     float_operator: Callable | None = None,
 ) -> "UGenOperable":
+    if (
+        float_operator is not None
+        and isinstance(left, SupportsFloat)
+        and isinstance(right, SupportsFloat)
+    ):
+        return ConstantProxy(float_operator(float(left), float(right)))
+    calculation_rate: CalculationRate | None = None
+
     def recurse(
         all_expanded_params: UGenRecursiveParams,
     ) -> "UGenOperable":
+        nonlocal calculation_rate
         if not isinstance(all_expanded_params, dict) and len(all_expanded_params) == 1:
             all_expanded_params = all_expanded_params[0]
         if isinstance(all_expanded_params, dict):
-            if (
-                isinstance(left, SupportsFloat)
-                and isinstance(right, SupportsFloat)
-                and float_operator is not None
-            ):
-                return ConstantProxy(float_operator(float(left), float(right)))
-            return BinaryOpUGen._new_single(
-                calculation_rate=max(
+            # The rate spans both operands in full, so compute it only once
+            if calculation_rate is None:
+                calculation_rate = max(
                     [
                         CalculationRate.from_expr(left),
                         CalculationRate.from_expr(right),
                     ]
-                ),
+                )
+            return BinaryOpUGen._new_single(
+                calculation_rate=calculation_rate,
                 special_index=special_index,
                 **all_expanded_params,
             )
@@ -411,20 +525,21 @@ def _compute_unary_op(
     special_index: UnaryOperator,
     float_operator: Callable | None = None,
 ) -> "UGenOperable":
+    if float_operator is not None and isinstance(source, SupportsFloat):
+        return ConstantProxy(float_operator(float(source)))
+    calculation_rate: CalculationRate | None = None
+
     def recurse(
         all_expanded_params: UGenRecursiveParams,
     ) -> "UGenOperable":
+        nonlocal calculation_rate
         if not isinstance(all_expanded_params, dict) and len(all_expanded_params) == 1:
             all_expanded_params = all_expanded_params[0]
         if isinstance(all_expanded_params, dict):
-            if isinstance(source, SupportsFloat) and float_operator is not None:
-                return ConstantProxy(float_operator(float(source)))
+            if calculation_rate is None:
+                calculation_rate = CalculationRate.from_expr(source)
             return UnaryOpUGen._new_single(
-                calculation_rate=max(
-                    [
-                        CalculationRate.from_expr(source),
-                    ]
-                ),
+                calculation_rate=calculation_rate,
                 special_index=special_index,
                 **all_expanded_params,
             )
@@ -457,6 +572,8 @@ class UGenOperable:
     Mixin for UGen arithmetic operations.
     """
 
+    __slots__ = ()
+
     def __abs__(self) -> "UGenOperable":
         """
         Compute absolute value of UGen graph.
@@ -4533,6 +4650,8 @@ class UGenScalar(UGenOperable):
     A UGen scalar.
     """
 
+    __slots__ = ()
+
     def __iter__(self) -> Iterator["UGenOperable"]:
         yield self
 
@@ -4542,21 +4661,36 @@ class OutputProxy(UGenScalar):
     A UGen output proxy.
 
     Encodes a reference to a specific output of a UGen, as a scalar.
+
+    UGens create one proxy per output, so proxies are usually compared by identity,
+    and their hash is computed once.
     """
 
+    __slots__ = ("_hash", "index", "ugen")
+
     def __init__(self, ugen: "UGen", index: int) -> None:
         self.ugen = ugen
         self.index = index
+        self._hash = hash((type(self), id(ugen), index))
 
     def __eq__(self, expr) -> bool:
-        return (
+        return self is expr or (
             isinstance(expr, type(self))
             and self.ugen is expr.ugen
             and self.index == expr.index
         )
 
+    def __getstate__(self) -> tuple[None, dict]:
+        return None, {"index": self.index, "ugen": self.ugen}
+
     def __hash__(self) -> int:
-        return hash((type(self), self.ugen, self.index))
+        return self._hash
+
+    def __setstate__(self, state: tuple[None, dict]) -> None:
+        _, slots = state
+        self.ugen = slots["ugen"]
+        self.index = slots["index"]
+        self._hash = hash((type(self), id(self.ugen), self.index))
 
     def __repr__(self) -> str:
         return repr(self.ugen).replace(">", f"[{self.index}]>")
@@ -4576,6 +4710,8 @@ class ConstantProxy(UGenScalar):
     Wraps a float and exposes all UGenOperable methods against it.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: SupportsFloat) -> None:
         self.value = float(value)
 
@@ -4599,6 +4735,8 @@ class UGenVector(UGenOperable, Sequence[UGenOperable]):
     A sequence of UGenOperables.
     """
 
+    __slots__ = ("_values",)
+
     def __init__(self, *values: SupportsFloat | UGenOperable) -> None:
         values_: list[UGen | UGenScalar | UGenVector] = []
         for x in values:
@@ -4872,7 +5010,16 @@ class UGen(UGenOperable, Sequence):
     A UGen: a "unit generator".
     """
 
-    _channel_count = 1
+    __slots__ = (
+        "_calculation_rate",
+        "_channel_count",
+        "_input_keys",
+        "_inputs",
+        "_special_index",
+        "_uuid",
+        "_values",
+    )
+
     _has_done_flag = False
     _has_settable_channel_count = False
     _is_input = False
@@ -4908,6 +5055,15 @@ class UGen(UGenOperable, Sequence):
         for key in self._ordered_keys:
             if (value := kwargs.pop(key)) is None:
                 raise ValueError(key)
+            # Most inputs are plain numbers or output proxies
+            if isinstance(value, (float, int)):
+                inputs.append(float(value))
+                input_keys.append(key)
+                continue
+            elif isinstance(value, OutputProxy):
+                inputs.append(value)
+                input_keys.append(key)
+                continue
             if isinstance(value, UGenSerializable):
                 serialized = value.serialize()
                 if any(isinstance(x, UGenVector) for x in serialized):
@@ -4923,12 +5079,12 @@ class UGen(UGenOperable, Sequence):
                 iterator = ((None, v) for v in [value])
             i: int | None
             for i, x in iterator:
-                if isinstance(x, SupportsFloat):
-                    inputs.append(float(x))
+                if isinstance(x, OutputProxy):
+                    inputs.append(x)
                 elif isinstance(x, ConstantProxy):
                     inputs.append(float(x.value))
-                elif isinstance(x, OutputProxy):
-                    inputs.append(x)
+                elif isinstance(x, SupportsFloat):
+                    inputs.append(float(x))
                 else:
                     raise ValueError(key, x)
                 input_keys.append((key, i) if i is not None else key)
@@ -4944,9 +5100,9 @@ class UGen(UGenOperable, Sequence):
         for input_ in self._inputs:
             if isinstance(input_, OutputProxy) and input_.ugen._uuid != self._uuid:
                 raise SynthDefError("UGen input in different scope")
+        self._channel_count = getattr(self, "_channel_count", 1)
         self._values = tuple(
-            OutputProxy(ugen=self, index=i)
-            for i in range(getattr(self, "_channel_count", 1))
+            OutputProxy(ugen=self, index=i) for i in range(self._channel_count)
         )
 
     @overload
@@ -4989,6 +5145,10 @@ class UGen(UGenOperable, Sequence):
         params: dict[str, "UGenRecursiveInput"],
         unexpanded_keys: Iterable[str] | None = None,
     ) -> "UGenRecursiveParams":
+        if (
+            flat_expanded_params := cls._expand_flat_params(params, unexpanded_keys)
+        ) is not None:
+            return flat_expanded_params
         unexpanded_keys_ = set(unexpanded_keys or ())
         size = 0
         for key, value in params.items():
@@ -5040,6 +5200,48 @@ class UGen(UGenOperable, Sequence):
             )
         return results
 
+    @staticmethod
+    def _expand_flat_params(
+        params: dict[str, "UGenRecursiveInput"],
+        unexpanded_keys: Iterable[str] | None = None,
+    ) -> Union["UGenRecursiveParams", None]:
+        """
+        Expand params in a single pass, if they're all scalars or flat sequences.
+
+        Returns ``None`` for anything else, e.g. nested sequences or serializables,
+        which take the recursive path.
+        """
+        unexpanded_keys_ = frozenset(unexpanded_keys or ())
+        expanded_params: list[tuple[str, Sequence]] = []
+        size = 0
+        for key, value in params.items():
+            if isinstance(value, _SCALAR_TYPES):
+                continue
+            if not (
+                type(value) in (list, tuple) or isinstance(value, (UGen, UGenVector))
+            ):
+                return None
+            sequence = cast(Sequence[UGenRecursiveInput], value)
+            for x in sequence:
+                if not isinstance(x, _SCALAR_TYPES):
+                    return None
+            if key in unexpanded_keys_:
+                continue
+            if not sequence:
+                return None
+            expanded_params.append((key, sequence))
+            size = max(size, len(sequence))
+        if not size:
+            return cast(UGenParams, params)
+        # Keys which don't expand are copied along, not rebuilt per channel
+        results: list[UGenRecursiveParams] = []
+        for i in range(size):
+            new_params = params.copy()
+            for key, value in expanded_params:
+                new_params[key] = value[i % len(value)]
+            results.append(cast(UGenParams, new_params))
+        return results
+
     @classmethod
     def _new_expanded(
         cls,
@@ -5107,6 +5309,50 @@ class UGen(UGenOperable, Sequence):
             return ugen[0]
         return ugen
 
+    @classmethod
+    def _new_unchecked(
+        cls,
+        *,
+        calculation_rate: CalculationRate,
+        channel_count: int,
+        inputs: Sequence[OutputProxy | float],
+        special_index: int,
+    ) -> "UGen":
+        """
+        Construct a UGen from already-flattened inputs, e.g. when decompiling.
+
+        Skips input validation, keyword postprocessing and SynthDefBuilder
+        registration, so inputs must already be exactly what would be compiled.
+        """
+        ugen = cls.__new__(cls)
+        input_keys: list[str | tuple[str, int]] = []
+        keyed_inputs: dict[str, OutputProxy | float] = {}
+        for i, key in enumerate(cls._ordered_keys):
+            if (index := len(input_keys)) >= len(inputs):
+                break
+            if key not in cls._unexpanded_keys:
+                input_keys.append(key)
+                keyed_inputs[key] = inputs[index]
+                continue
+            # Unexpanded inputs run to the end, unless sized by an earlier input
+            count = len(inputs) - index
+            if i < len(cls._ordered_keys) - 1:
+                for size_key in (f"{key}_count", f"{key}_size"):
+                    if isinstance(size := keyed_inputs.get(size_key), float):
+                        count = min(int(size), count)
+                        break
+            input_keys.extend((key, j) for j in range(count))
+        ugen._calculation_rate = calculation_rate
+        ugen._channel_count = channel_count
+        ugen._input_keys = tuple(input_keys)
+        ugen._inputs = tuple(inputs)
+        ugen._special_index = special_index
+        ugen._uuid = None
+        ugen._values = tuple(
+            OutputProxy(ugen=ugen, index=i) for i in range(channel_count)
+        )
+        return ugen
+
     def _optimize(
         self, sort_bundles: dict["UGen", "SynthDefBuilder.SortBundle"]
     ) -> None:
@@ -5161,6 +5407,9 @@ UGenRecursiveInput: TypeAlias = (
 UGenParams: TypeAlias = dict[str, UGenScalarInput | UGenVectorInput]
 UGenRecursiveParams: TypeAlias = UGenParams | list["UGenRecursiveParams"]
 
+# Concrete scalar input types, cheaper to check than the SupportsFloat protocol
+_SCALAR_TYPES = (float, int, UGenScalar)
+
 
 @ugen(is_pure=True)
 class UnaryOpUGen(UGen):
@@ -5262,16 +5511,16 @@ class BinaryOpUGen(UGen):
 
         left = kwargs["left"]
         right = kwargs["right"]
-        if not isinstance(left, (SupportsFloat, UGenScalar)):
+        if not isinstance(left, (UGenScalar, SupportsFloat)):
             raise ValueError(left)
-        if not isinstance(right, (SupportsFloat, UGenScalar)):
+        if not isinstance(right, (UGenScalar, SupportsFloat)):
             raise ValueError(right)
         if isinstance(
             result := process(
-                float(left) if isinstance(left, SupportsFloat) else left,
-                float(right) if isinstance(right, SupportsFloat) else right,
+                left if isinstance(left, OutputProxy) else float(cast(float, left)),
+                right if isinstance(right, OutputProxy) else float(cast(float, right)),
             ),
-            SupportsFloat,
+            (float, ConstantProxy),
         ):
             return ConstantProxy(result)
         return result
@@ -5288,6 +5537,8 @@ class PseudoUGen:
 
 
 class Parameter(UGen):
+    __slots__ = ("lag", "name", "rate", "value")
+
     def __init__(
         self,
         *,
@@ -5323,6 +5574,8 @@ class Parameter(UGen):
 
 
 class Control(UGen):
+    __slots__ = ("_parameters",)
+
     def __init__(
         self,
         *,
@@ -5343,10 +5596,12 @@ class Control(UGen):
 
 
 class AudioControl(Control):
-    pass
+    __slots__ = ()
 
 
 class LagControl(Control):
+    __slots__ = ()
+
     _ordered_keys = ("lags",)
     _unexpanded_keys = frozenset(["lags"])
 
@@ -5371,7 +5626,7 @@ class LagControl(Control):
 
 
 class TrigControl(Control):
-    pass
+    __slots__ = ()
 
 
 class SynthDefError(Exception):
@@ -6243,12 +6498,14 @@ def _compile_synthdef(synthdef: SynthDef, name: str) -> bytes:
     return b"".join(
         [
             _encode_string(name),
-            _compile_ugen_graph(synthdef),
+            synthdef._compiled_graph,
         ]
     )
 
 
-def _compile_ugen(ugen: UGen, synthdef: SynthDef) -> bytes:
+def _compile_ugen(
+    ugen: UGen, constant_indices: dict[float, int], ugen_indices: dict[int, int]
+) -> bytes:
     return b"".join(
         [
             _encode_string(type(ugen).__name__),
@@ -6256,7 +6513,10 @@ def _compile_ugen(ugen: UGen, synthdef: SynthDef) -> bytes:
             _encode_unsigned_int_32bit(len(ugen.inputs)),
             _encode_unsigned_int_32bit(len(ugen)),
             _encode_unsigned_int_16bit(int(ugen.special_index)),
-            *(_compile_ugen_input_spec(input_, synthdef) for input_ in ugen.inputs),
+            *(
+                _compile_ugen_input_spec(input_, constant_indices, ugen_indices)
+                for input_ in ugen.inputs
+            ),
             *(
                 _encode_unsigned_int_8bit(ugen.calculation_rate)
                 for _ in range(len(ugen))
@@ -6266,10 +6526,18 @@ def _compile_ugen(ugen: UGen, synthdef: SynthDef) -> bytes:
 
 
 def _compile_ugens(synthdef: SynthDef) -> bytes:
+    # Index constants and UGens up front, rather than searching per input
+    constant_indices: dict[float, int] = {}
+    for i, constant in enumerate(synthdef._constants):
+        constant_indices.setdefault(constant, i)
+    ugen_indices = {id(ugen): i for i, ugen in enumerate(synthdef._ugens)}
     return b"".join(
         [
             _encode_unsigned_int_32bit(len(synthdef.ugens)),
-            *(_compile_ugen(ugen, synthdef) for ugen in synthdef.ugens),
+            *(
+                _compile_ugen(ugen, constant_indices, ugen_indices)
+                for ugen in synthdef.ugens
+            ),
         ]
     )
 
@@ -6285,14 +6553,18 @@ def _compile_ugen_graph(synthdef):
     )
 
 
-def _compile_ugen_input_spec(input_: OutputProxy | float, synthdef: SynthDef) -> bytes:
+def _compile_ugen_input_spec(
+    input_: OutputProxy | float,
+    constant_indices: dict[float, int],
+    ugen_indices: dict[int, int],
+) -> bytes:
     if isinstance(input_, float):
         return _encode_unsigned_int_32bit(0xFFFFFFFF) + _encode_unsigned_int_32bit(
-            synthdef._constants.index(input_)
+            constant_indices[input_]
         )
     else:
         return _encode_unsigned_int_32bit(
-            synthdef._ugens.index(input_.ugen)
+            ugen_indices[id(input_.ugen)]
         ) + _encode_unsigned_int_32bit(input_.index)
 
 
@@ -6340,55 +6612,103 @@ def compile_synthdefs(
     )
 
 
-def _decode_string(value: bytes, index: int) -> tuple[str, int]:
-    length, index = struct.unpack(">B", value[index : index + 1])[0], index + 1
-    return value[index : index + length].decode("ascii"), index + length
+_UGenSpec: TypeAlias = tuple[str, int, int, int, list[tuple[int, int]]]
 
+_SynthDefSpec: TypeAlias = tuple[
+    str, list[float], list[float], list[tuple[str, int]], list[_UGenSpec]
+]
 
-def _decode_float(value: bytes, index: int) -> tuple[float, int]:
-    return struct.unpack(">f", value[index : index + 4])[0], index + 4
+_calculation_rates = {int(rate): rate for rate in CalculationRate}
 
+_ugen_classes: dict[str, Type[UGen]] = {}
 
-def _decode_int_8bit(value: bytes, index: int) -> tuple[int, int]:
-    return struct.unpack(">B", value[index : index + 1])[0], index + 1
 
-
-def _decode_int_16bit(value: bytes, index: int) -> tuple[int, int]:
-    return struct.unpack(">H", value[index : index + 2])[0], index + 2
-
-
-def _decode_int_32bit(value: bytes, index: int) -> tuple[int, int]:
-    return struct.unpack(">I", value[index : index + 4])[0], index + 4
-
-
-def _decode_constants(value: bytes, index: int) -> tuple[Sequence[float], int]:
-    constants = []
-    constants_count, index = _decode_int_32bit(value, index)
-    for _ in range(constants_count):
-        constant, index = _decode_float(value, index)
-        constants.append(constant)
-    return constants, index
+def _decode_synthdef_specs(value: bytes) -> list[_SynthDefSpec]:
+    """
+    Decode a SynthDef file in a single pass, without constructing any UGens.
+    """
+    view = memoryview(value)
+    if view[:4] != b"SCgf":
+        raise ValueError(value)
+    file_version, synthdef_count = struct.unpack_from(">IH", view, 4)
+    if file_version not in (1, 2):
+        raise ValueError(file_version)
+    count_format = ">I" if file_version == 2 else ">H"
+    count_size = struct.calcsize(count_format)
+    constant_index = 0xFFFFFFFF if file_version == 2 else 0xFFFF
+    ugen_format = struct.Struct(">BIIH" if file_version == 2 else ">BHHH")
+    index = 10
+
+    def decode_count() -> int:
+        nonlocal index
+        (count,) = struct.unpack_from(count_format, view, index)
+        index += count_size
+        return count
+
+    def decode_floats(count: int) -> list[float]:
+        nonlocal index
+        floats = list(struct.unpack_from(f">{count}f", view, index))
+        index += 4 * count
+        return floats
+
+    def decode_string() -> str:
+        nonlocal index
+        length = view[index]
+        index += 1 + length
+        return str(view[index - length : index], "ascii")
+
+    synthdef_specs: list[_SynthDefSpec] = []
+    for _ in range(synthdef_count):
+        name = decode_string()
+        constants = decode_floats(decode_count())
+        parameter_values = decode_floats(decode_count())
+        parameter_names: list[tuple[str, int]] = []
+        for _ in range(decode_count()):
+            parameter_name = decode_string()
+            parameter_names.append((parameter_name, decode_count()))
+        ugen_specs: list[_UGenSpec] = []
+        for i in range(decode_count()):
+            ugen_name = decode_string()
+            calculation_rate, input_count, output_count, special_index = (
+                ugen_format.unpack_from(view, index)
+            )
+            index += ugen_format.size
+            input_values = struct.unpack_from(
+                f">{input_count * 2}{count_format[1]}", view, index
+            )
+            index += input_count * 2 * count_size + output_count
+            inputs: list[tuple[int, int]] = []
+            for ugen_index, output_index in zip(input_values[::2], input_values[1::2]):
+                if ugen_index == constant_index:
+                    if output_index >= len(constants):
+                        raise ValueError(output_index)
+                    ugen_index = -1
+                elif ugen_index >= i:
+                    raise ValueError(ugen_index)
+                inputs.append((ugen_index, output_index))
+            ugen_specs.append(
+                (ugen_name, calculation_rate, special_index, output_count, inputs)
+            )
+        (variant_count,) = struct.unpack_from(">H", view, index)
+        index += 2
+        for _ in range(variant_count):
+            index += 1 + view[index] + 4 * len(parameter_values)
+        synthdef_specs.append(
+            (name, constants, parameter_values, parameter_names, ugen_specs)
+        )
+    if index > len(view):
+        raise ValueError(value)
+    return synthdef_specs
 
 
-def _decode_parameters(value: bytes, index: int) -> tuple[dict[int, Parameter], int]:
-    parameter_values = []
-    parameter_count, index = _decode_int_32bit(value, index)
-    for _ in range(parameter_count):
-        parameter_value, index = _decode_float(value, index)
-        parameter_values.append(parameter_value)
-    parameter_count, index = _decode_int_32bit(value, index)
-    parameter_names = []
-    parameter_indices = []
-    for _ in range(parameter_count):
-        parameter_name, index = _decode_string(value, index)
-        parameter_index, index = _decode_int_32bit(value, index)
-        parameter_names.append(parameter_name)
-        parameter_indices.append(parameter_index)
+def _index_parameters(
+    parameter_values: Sequence[float], parameter_names: Sequence[tuple[str, int]]
+) -> dict[int, Parameter]:
     indexed_parameters = []
-    if parameter_count:
+    if parameter_names:
         for (index_one, name_one), (index_two, name_two) in iterate_nwise(
             sorted(
-                zip(parameter_indices, parameter_names),
+                ((index, name) for name, index in parameter_names),
                 key=lambda x: x[0],
             )
             + [(len(parameter_values), "")]
@@ -6401,8 +6721,9 @@ def _decode_parameters(value: bytes, index: int) -> tuple[dict[int, Parameter],
                     ),
                 )
             )
-        indexed_parameters.sort(key=lambda x: parameter_names.index(x[1].name or ""))
-    return dict(indexed_parameters), index
+        names = [name for name, _ in parameter_names]
+        indexed_parameters.sort(key=lambda x: names.index(x[1].name or ""))
+    return dict(indexed_parameters)
 
 
 def _decompile_control_parameters(
@@ -6435,37 +6756,24 @@ def _decompile_control_parameters(
     return parameters
 
 
-def _decompile_synthdef(value: bytes, index: int) -> tuple[SynthDef, int]:
-    from supriya import ugens
-
-    name, index = _decode_string(value, index)
-    constants, index = _decode_constants(value, index)
-    indexed_parameters, index = _decode_parameters(value, index)
+def _decompile_synthdef(synthdef_spec: _SynthDefSpec) -> SynthDef:
+    name, constants, parameter_values, parameter_names, ugen_specs = synthdef_spec
+    indexed_parameters = _index_parameters(parameter_values, parameter_names)
     decompiled_ugens: list[UGen] = []
-    ugen_count, index = _decode_int_32bit(value, index)
-    for i in range(ugen_count):
-        ugen_name, index = _decode_string(value, index)
-        calculation_rate, index = _decode_int_8bit(value, index)
-        calculation_rate = CalculationRate(calculation_rate)
-        input_count, index = _decode_int_32bit(value, index)
-        output_count, index = _decode_int_32bit(value, index)
-        special_index, index = _decode_int_16bit(value, index)
-        inputs: list[OutputProxy | float] = []
-        for _ in range(input_count):
-            ugen_index, index = _decode_int_32bit(value, index)
-            if ugen_index == 0xFFFFFFFF:
-                constant_index, index = _decode_int_32bit(value, index)
-                inputs.append(constants[constant_index])
-            else:
-                ugen = decompiled_ugens[ugen_index]
-                ugen_output_index, index = _decode_int_32bit(value, index)
-                output_proxy = ugen[ugen_output_index]
-                inputs.append(output_proxy)
-        for _ in range(output_count):
-            output_rate, index = _decode_int_8bit(value, index)
-        ugen_class = cast(Type[UGen], getattr(ugens, ugen_name, None))
-        ugen = UGen.__new__(ugen_class)
+    for ugen_name, rate, special_index, output_count, input_specs in ugen_specs:
+        calculation_rate = _calculation_rates[rate]
+        inputs: list[OutputProxy | float] = [
+            (
+                constants[output_index]
+                if ugen_index < 0
+                else decompiled_ugens[ugen_index]._values[output_index]
+            )
+            for ugen_index, output_index in input_specs
+        ]
+        ugen_class = _get_ugen_class(ugen_name)
+        ugen: UGen
         if issubclass(ugen_class, Control):
+            ugen = UGen.__new__(ugen_class)
             parameters = _decompile_control_parameters(
                 calculation_rate,
                 indexed_parameters,
@@ -6481,29 +6789,32 @@ def _decompile_synthdef(value: bytes, index: int) -> tuple[SynthDef, int]:
                 calculation_rate=calculation_rate,
             )
         else:
-            kwargs: UGenParams = {}
-            if not ugen._unexpanded_keys:
-                for i, input_name in enumerate(ugen._ordered_keys):
-                    kwargs[input_name] = inputs[i]
-            else:
-                for i, input_name in enumerate(ugen._ordered_keys):
-                    if input_name not in ugen._unexpanded_keys:
-                        kwargs[input_name] = inputs[i]
-                    else:
-                        kwargs[input_name] = tuple(inputs[i:])
-            ugen._channel_count = output_count
-            UGen.__init__(
-                ugen,
+            ugen = ugen_class._new_unchecked(
                 calculation_rate=calculation_rate,
+                channel_count=output_count,
+                inputs=inputs,
                 special_index=special_index,
-                **kwargs,
             )
         decompiled_ugens.append(ugen)
-    variants_count, index = _decode_int_16bit(value, index)
     synthdef = SynthDef(ugens=decompiled_ugens, name=name)
     if synthdef.name == synthdef.anonymous_name:
         synthdef._name = None
-    return synthdef, index
+    return synthdef
+
+
+def _decompile_synthdef_file(path: Path) -> list[SynthDef]:
+    return decompile_synthdefs(path.read_bytes())
+
+
+def _get_ugen_class(name: str) -> Type[UGen]:
+    if (ugen_class := _ugen_classes.get(name)) is None:
+        from supriya import ugens
+
+        ugen_class = getattr(ugens, name, None)
+        if not (isinstance(ugen_class, type) and issubclass(ugen_class, UGen)):
+            raise ValueError(f"Unknown UGen: {name}")
+        _ugen_classes[name] = ugen_class
+    return ugen_class
 
 
 def decompile_synthdef(value: bytes) -> SynthDef:
@@ -6512,17 +6823,52 @@ def decompile_synthdef(value: bytes) -> SynthDef:
     return synthdefs[0]
 
 
+def decompile_synthdef_directory(
+    directory_path: Path | str,
+    pattern: str = "*.scsyndef",
+    max_workers: int | None = None,
+) -> dict[Path, list[SynthDef]]:
+    """
+    Decompile every SynthDef file in a directory.
+
+    Files are decompiled across a pool of worker processes when ``max_workers``
+    is greater than one, or in the current process otherwise.
+
+    :param directory_path: The directory to search.
+    :param pattern: The glob pattern matching SynthDef files.
+    :param max_workers: The number of worker processes, defaulting to the number of
+        CPUs.
+    """
+    paths = sorted(Path(directory_path).glob(pattern))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 2 or len(paths) < 2:
+        return {path: _decompile_synthdef_file(path) for path in paths}
+    max_workers = min(max_workers, len(paths))
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return dict(
+            zip(
+                paths,
+                executor.map(
+                    _decompile_synthdef_file,
+                    paths,
+                    chunksize=max(len(paths) // (max_workers * 4), 1),
+                ),
+            )
+        )
+
+
 def decompile_synthdefs(value: bytes) -> list[SynthDef]:
-    synthdefs: list[SynthDef] = []
-    index = 4
-    if value[:index] != b"SCgf":
-        raise ValueError(value)
-    file_version, index = _decode_int_32bit(value, index)
-    synthdef_count, index = _decode_int_16bit(value, index)
-    for _ in range(synthdef_count):
-        synthdef, index = _decompile_synthdef(value, index)
-        synthdefs.append(synthdef)
-    return synthdefs
+    if _synthdef_native is not None:
+        synthdef_specs = _synthdef_native.decode_synthdefs(bytes(value))
+    else:
+        try:
+            synthdef_specs = _decode_synthdef_specs(value)
+        except (IndexError, struct.error) as exception:
+            raise ValueError(value) from exception
+    return [_decompile_synthdef(synthdef_spec) for synthdef_spec in synthdef_specs]
 
 
 class SuperColliderSynthDef:
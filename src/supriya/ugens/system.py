@@ -1,3 +1,6 @@
+import functools
+import threading
+from collections.abc import Callable, Iterator, Mapping
 from typing import Literal
 
 from ..enums import CalculationRate, DoneAction, EnvelopeShape, ParameterRate
@@ -238,221 +241,146 @@ def _build_frequency_scope_synthdef(
                 source=scope_source,
                 max_frames=builder["fft_buffer_size"] / builder["rate"],
             )
+    return builder.build(
+        name=_get_frequency_scope_name(channel_mode, frequency_mode, use_shared_memory)
+    )
+
+
+def _get_frequency_scope_name(
+    channel_mode: Literal["mono", "stereo"],
+    frequency_mode: Literal["linear", "logarithmic"],
+    use_shared_memory: bool,
+) -> str:
     name = "supriya:freq-scope"
     name += "-lin" if frequency_mode == "linear" else "-log"
     name += "-shm" if use_shared_memory else ""
     name += ":2" if channel_mode == "stereo" else ":1"
-    return builder.build(name=name)
+    return name
+
+
+class _LazySynthDefMapping(Mapping[str, SynthDef]):
+    """
+    A mapping of SynthDefs by name, building each the first time it is accessed.
+    """
+
+    def __init__(self, builders: dict[str, Callable[[], SynthDef]]) -> None:
+        self._builders = builders
+        self._lock = threading.Lock()
+        self._synthdefs: dict[str, SynthDef] = {}
+
+    def __getitem__(self, name: str) -> SynthDef:
+        if (synthdef := self._synthdefs.get(name)) is None:
+            builder = self._builders[name]
+            with self._lock:
+                if (synthdef := self._synthdefs.get(name)) is None:
+                    synthdef = self._synthdefs[name] = builder()
+        return synthdef
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} ({len(self._synthdefs)}/{len(self)} built)>"
 
 
 # default synthdef
 default = _build_default_synthdef()
 
-# audio-rate link synthdefs
-system_link_audio_1 = _build_link_audio_synthdef(1)
-system_link_audio_2 = _build_link_audio_synthdef(2)
-system_link_audio_3 = _build_link_audio_synthdef(3)
-system_link_audio_4 = _build_link_audio_synthdef(4)
-system_link_audio_5 = _build_link_audio_synthdef(5)
-system_link_audio_6 = _build_link_audio_synthdef(6)
-system_link_audio_7 = _build_link_audio_synthdef(7)
-system_link_audio_8 = _build_link_audio_synthdef(8)
-system_link_audio_9 = _build_link_audio_synthdef(9)
-system_link_audio_10 = _build_link_audio_synthdef(10)
-system_link_audio_11 = _build_link_audio_synthdef(11)
-system_link_audio_12 = _build_link_audio_synthdef(12)
-system_link_audio_13 = _build_link_audio_synthdef(13)
-system_link_audio_14 = _build_link_audio_synthdef(14)
-system_link_audio_15 = _build_link_audio_synthdef(15)
-system_link_audio_16 = _build_link_audio_synthdef(16)
-
-# control-rate link synthdefs
-system_link_control_1 = _build_link_control_synthdef(1)
-system_link_control_2 = _build_link_control_synthdef(2)
-system_link_control_3 = _build_link_control_synthdef(3)
-system_link_control_4 = _build_link_control_synthdef(4)
-system_link_control_5 = _build_link_control_synthdef(5)
-system_link_control_6 = _build_link_control_synthdef(6)
-system_link_control_7 = _build_link_control_synthdef(7)
-system_link_control_8 = _build_link_control_synthdef(8)
-system_link_control_9 = _build_link_control_synthdef(9)
-system_link_control_10 = _build_link_control_synthdef(10)
-system_link_control_11 = _build_link_control_synthdef(11)
-system_link_control_12 = _build_link_control_synthdef(12)
-system_link_control_13 = _build_link_control_synthdef(13)
-system_link_control_14 = _build_link_control_synthdef(14)
-system_link_control_15 = _build_link_control_synthdef(15)
-system_link_control_16 = _build_link_control_synthdef(16)
-
-# audio-rate stethoscope synthdefs
-amplitude_scope_audio_1 = _build_amplitude_scope_synthdef(1, CalculationRate.AUDIO)
-amplitude_scope_audio_2 = _build_amplitude_scope_synthdef(2, CalculationRate.AUDIO)
-amplitude_scope_audio_3 = _build_amplitude_scope_synthdef(3, CalculationRate.AUDIO)
-amplitude_scope_audio_4 = _build_amplitude_scope_synthdef(4, CalculationRate.AUDIO)
-amplitude_scope_audio_5 = _build_amplitude_scope_synthdef(5, CalculationRate.AUDIO)
-amplitude_scope_audio_6 = _build_amplitude_scope_synthdef(6, CalculationRate.AUDIO)
-amplitude_scope_audio_7 = _build_amplitude_scope_synthdef(7, CalculationRate.AUDIO)
-amplitude_scope_audio_8 = _build_amplitude_scope_synthdef(8, CalculationRate.AUDIO)
-amplitude_scope_audio_9 = _build_amplitude_scope_synthdef(9, CalculationRate.AUDIO)
-amplitude_scope_audio_10 = _build_amplitude_scope_synthdef(10, CalculationRate.AUDIO)
-amplitude_scope_audio_11 = _build_amplitude_scope_synthdef(11, CalculationRate.AUDIO)
-amplitude_scope_audio_12 = _build_amplitude_scope_synthdef(12, CalculationRate.AUDIO)
-amplitude_scope_audio_13 = _build_amplitude_scope_synthdef(13, CalculationRate.AUDIO)
-amplitude_scope_audio_14 = _build_amplitude_scope_synthdef(14, CalculationRate.AUDIO)
-amplitude_scope_audio_15 = _build_amplitude_scope_synthdef(15, CalculationRate.AUDIO)
-amplitude_scope_audio_15 = _build_amplitude_scope_synthdef(16, CalculationRate.AUDIO)
-
-# control-rate amplitude_scope synthdefs
-amplitude_scope_control_1 = _build_amplitude_scope_synthdef(1, CalculationRate.CONTROL)
-amplitude_scope_control_2 = _build_amplitude_scope_synthdef(2, CalculationRate.CONTROL)
-amplitude_scope_control_3 = _build_amplitude_scope_synthdef(3, CalculationRate.CONTROL)
-amplitude_scope_control_4 = _build_amplitude_scope_synthdef(4, CalculationRate.CONTROL)
-amplitude_scope_control_5 = _build_amplitude_scope_synthdef(5, CalculationRate.CONTROL)
-amplitude_scope_control_6 = _build_amplitude_scope_synthdef(6, CalculationRate.CONTROL)
-amplitude_scope_control_7 = _build_amplitude_scope_synthdef(7, CalculationRate.CONTROL)
-amplitude_scope_control_8 = _build_amplitude_scope_synthdef(8, CalculationRate.CONTROL)
-amplitude_scope_control_9 = _build_amplitude_scope_synthdef(9, CalculationRate.CONTROL)
-amplitude_scope_control_10 = _build_amplitude_scope_synthdef(
-    10, CalculationRate.CONTROL
-)
-amplitude_scope_control_11 = _build_amplitude_scope_synthdef(
-    11, CalculationRate.CONTROL
-)
-amplitude_scope_control_12 = _build_amplitude_scope_synthdef(
-    12, CalculationRate.CONTROL
-)
-amplitude_scope_control_13 = _build_amplitude_scope_synthdef(
-    13, CalculationRate.CONTROL
-)
-amplitude_scope_control_14 = _build_amplitude_scope_synthdef(
-    14, CalculationRate.CONTROL
-)
-amplitude_scope_control_15 = _build_amplitude_scope_synthdef(
-    15, CalculationRate.CONTROL
-)
-amplitude_scope_control_15 = _build_amplitude_scope_synthdef(
-    16, CalculationRate.CONTROL
+AMPLITUDE_SCOPE_SYNTHDEFS: Mapping[str, SynthDef] = _LazySynthDefMapping(
+    {
+        f"supriya:amp-scope-{rate.token}:{channel_count}": functools.partial(
+            _build_amplitude_scope_synthdef, channel_count, rate
+        )
+        for rate in (CalculationRate.AUDIO, CalculationRate.CONTROL)
+        for channel_count in range(1, 17)
+    }
 )
 
-# frequency scope synthdefs
-frequency_scope_lin_1 = _build_frequency_scope_synthdef(
-    channel_mode="mono", frequency_mode="linear", use_shared_memory=False
-)
-frequency_scope_lin_2 = _build_frequency_scope_synthdef(
-    channel_mode="stereo", frequency_mode="linear", use_shared_memory=False
-)
-frequency_scope_lin_shm_1 = _build_frequency_scope_synthdef(
-    channel_mode="mono", frequency_mode="linear", use_shared_memory=True
-)
-frequency_scope_lin_shm_2 = _build_frequency_scope_synthdef(
-    channel_mode="stereo", frequency_mode="linear", use_shared_memory=True
-)
-frequency_scope_log_1 = _build_frequency_scope_synthdef(
-    channel_mode="mono", frequency_mode="logarithmic", use_shared_memory=False
-)
-frequency_scope_log_2 = _build_frequency_scope_synthdef(
-    channel_mode="stereo", frequency_mode="logarithmic", use_shared_memory=False
-)
-frequency_scope_log_shm_1 = _build_frequency_scope_synthdef(
-    channel_mode="mono", frequency_mode="logarithmic", use_shared_memory=True
+FREQUENCY_SCOPE_SYNTHDEFS: Mapping[str, SynthDef] = _LazySynthDefMapping(
+    {
+        _get_frequency_scope_name(
+            channel_mode, frequency_mode, use_shared_memory
+        ): functools.partial(
+            _build_frequency_scope_synthdef,
+            channel_mode=channel_mode,
+            frequency_mode=frequency_mode,
+            use_shared_memory=use_shared_memory,
+        )
+        for use_shared_memory in (False, True)
+        for frequency_mode in ("linear", "logarithmic")
+        for channel_mode in ("mono", "stereo")
+    }
 )
-frequency_scope_log_shm_2 = _build_frequency_scope_synthdef(
-    channel_mode="stereo", frequency_mode="logarithmic", use_shared_memory=True
+
+SYSTEM_SYNTHDEFS: Mapping[str, SynthDef] = _LazySynthDefMapping(
+    {
+        **{
+            f"supriya:link-ar:{channel_count}": functools.partial(
+                _build_link_audio_synthdef, channel_count
+            )
+            for channel_count in range(1, 17)
+        },
+        **{
+            f"supriya:link-kr:{channel_count}": functools.partial(
+                _build_link_control_synthdef, channel_count
+            )
+            for channel_count in range(1, 17)
+        },
+    }
 )
 
-AMPLITUDE_SCOPE_SYNTHDEFS: dict[str, SynthDef] = {
-    synthdef.effective_name: synthdef
-    for synthdef in [
-        amplitude_scope_audio_1,
-        amplitude_scope_audio_2,
-        amplitude_scope_audio_3,
-        amplitude_scope_audio_4,
-        amplitude_scope_audio_5,
-        amplitude_scope_audio_6,
-        amplitude_scope_audio_7,
-        amplitude_scope_audio_8,
-        amplitude_scope_audio_9,
-        amplitude_scope_audio_10,
-        amplitude_scope_audio_11,
-        amplitude_scope_audio_12,
-        amplitude_scope_audio_13,
-        amplitude_scope_audio_14,
-        amplitude_scope_audio_15,
-        amplitude_scope_audio_15,
-        amplitude_scope_control_1,
-        amplitude_scope_control_2,
-        amplitude_scope_control_3,
-        amplitude_scope_control_4,
-        amplitude_scope_control_5,
-        amplitude_scope_control_6,
-        amplitude_scope_control_7,
-        amplitude_scope_control_8,
-        amplitude_scope_control_9,
-        amplitude_scope_control_10,
-        amplitude_scope_control_11,
-        amplitude_scope_control_12,
-        amplitude_scope_control_13,
-        amplitude_scope_control_14,
-        amplitude_scope_control_15,
-        amplitude_scope_control_15,
-    ]
+# module attributes (e.g. ``system_link_audio_2``) resolving lazily into the above
+_SYNTHDEF_ATTRIBUTES: dict[str, tuple[Mapping[str, SynthDef], str]] = {
+    **{
+        f"amplitude_scope_{rate.name.lower()}_{channel_count}": (
+            AMPLITUDE_SCOPE_SYNTHDEFS,
+            f"supriya:amp-scope-{rate.token}:{channel_count}",
+        )
+        for rate in (CalculationRate.AUDIO, CalculationRate.CONTROL)
+        for channel_count in range(1, 17)
+    },
+    **{
+        "frequency_scope_{}{}_{}".format(
+            frequency_mode[:3],
+            "_shm" if use_shared_memory else "",
+            channel_count,
+        ): (
+            FREQUENCY_SCOPE_SYNTHDEFS,
+            _get_frequency_scope_name(
+                "stereo" if channel_count == 2 else "mono",
+                frequency_mode,
+                use_shared_memory,
+            ),
+        )
+        for use_shared_memory in (False, True)
+        for frequency_mode in ("linear", "logarithmic")
+        for channel_count in (1, 2)
+    },
+    **{
+        f"system_link_{rate.name.lower()}_{channel_count}": (
+            SYSTEM_SYNTHDEFS,
+            f"supriya:link-{rate.token}:{channel_count}",
+        )
+        for rate in (CalculationRate.AUDIO, CalculationRate.CONTROL)
+        for channel_count in range(1, 17)
+    },
 }
 
-FREQUENCY_SCOPE_SYNTHDEFS: dict[str, SynthDef] = {
-    synthdef.effective_name: synthdef
-    for synthdef in [
-        frequency_scope_lin_1,
-        frequency_scope_lin_2,
-        frequency_scope_log_1,
-        frequency_scope_log_2,
-        frequency_scope_lin_shm_1,
-        frequency_scope_lin_shm_2,
-        frequency_scope_log_shm_1,
-        frequency_scope_log_shm_2,
-    ]
-}
 
-SYSTEM_SYNTHDEFS: dict[str, SynthDef] = {
-    synthdef.effective_name: synthdef
-    for synthdef in [
-        system_link_audio_1,
-        system_link_audio_2,
-        system_link_audio_3,
-        system_link_audio_4,
-        system_link_audio_5,
-        system_link_audio_6,
-        system_link_audio_7,
-        system_link_audio_8,
-        system_link_audio_9,
-        system_link_audio_10,
-        system_link_audio_11,
-        system_link_audio_12,
-        system_link_audio_13,
-        system_link_audio_14,
-        system_link_audio_15,
-        system_link_audio_16,
-        system_link_control_1,
-        system_link_control_2,
-        system_link_control_3,
-        system_link_control_4,
-        system_link_control_5,
-        system_link_control_6,
-        system_link_control_7,
-        system_link_control_8,
-        system_link_control_9,
-        system_link_control_10,
-        system_link_control_11,
-        system_link_control_12,
-        system_link_control_13,
-        system_link_control_14,
-        system_link_control_15,
-        system_link_control_16,
-    ]
-}
+def __getattr__(name: str) -> SynthDef:
+    try:
+        synthdefs, key = _SYNTHDEF_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return synthdefs[key]
+
 
 __all__ = [
-    "SPECTROSCOPE_SYNTHDEFS",
-    "STETHOSCOPE_SYNTHDEFS",
+    "AMPLITUDE_SCOPE_SYNTHDEFS",
+    "FREQUENCY_SCOPE_SYNTHDEFS",
     "SYSTEM_SYNTHDEFS",
     "default",
 ]
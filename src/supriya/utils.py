@@ -31,25 +31,28 @@ class Expander(Generic[T]):
     ) -> list[dict[str, Union[T, Sequence[T]]]]:
         only_ = set(only or ())
         unexpanded_ = set(unexpanded or ())
-        expanded_mappings = []
         maximum_length = 1
-        massaged: dict[str, Sequence[T]] = {}
+        # Values which don't vary per mapping are filled in once, in a template
+        template: dict[str, Union[T, Sequence[T]]] = {}
+        expanded: list[tuple[str, Sequence[T]]] = []
         for key, value in mapping.items():
             if only_ and key not in only_:
                 continue
-            if isinstance(value, Sequence):
-                if key not in unexpanded_:
-                    maximum_length = max(len(value), maximum_length)
+            if not isinstance(value, Sequence):
+                template[key] = [value] if key in unexpanded_ else value
+            elif key in unexpanded_:
+                template[key] = value
+            elif len(value) == 1:
+                template[key] = value[0]
             else:
-                value = [value]
-            massaged[key] = value
+                maximum_length = max(len(value), maximum_length)
+                template[key] = value
+                expanded.append((key, value))
+        expanded_mappings = []
         for i in range(maximum_length):
-            expanded_mapping: dict[str, Union[T, Sequence[T]]] = {}
-            for key, value in massaged.items():
-                if key in unexpanded_:
-                    expanded_mapping[key] = value
-                else:
-                    expanded_mapping[key] = value[i % len(value)]
+            expanded_mapping = template.copy()
+            for key, value in expanded:
+                expanded_mapping[key] = value[i % len(value)]
             expanded_mappings.append(expanded_mapping)
         return expanded_mappings
 
@@ -0,0 +1,67 @@
+import hashlib
+import struct
+
+import pytest
+
+from supriya import Score, default
+from supriya.contexts import CommandFile
+from supriya.osc import OscBundle
+
+
+@pytest.fixture
+def context() -> Score:
+    context = Score()
+    with context.at(0):
+        with context.add_synthdefs(default):
+            context.add_synth(default, frequency=440.0)
+    with context.at(1.5):
+        context.add_synth(default, frequency=550.0)
+    with context.at(3):
+        context.do_nothing()
+    return context
+
+
+def test_write(context: Score, tmp_path) -> None:
+    datagram = b"".join(
+        struct.pack(">i", len(x)) + x for x in context.iterate_datagrams()
+    )
+    digest = context.write(tmp_path / "score.osc")
+    assert (tmp_path / "score.osc").read_bytes() == datagram
+    assert digest == hashlib.sha256(datagram).hexdigest()
+
+
+def test_read(context: Score, tmp_path) -> None:
+    context.write(tmp_path / "score.osc")
+    with CommandFile(tmp_path / "score.osc") as command_file:
+        assert len(command_file) == 3
+        assert command_file.timestamps == [0.0, 1.5, 3.0]
+        assert list(command_file.iterate_datagrams()) == list(
+            context.iterate_datagrams()
+        )
+        assert command_file[1] == list(context.iterate_osc_bundles())[1]
+        assert [x.timestamp for x in command_file] == [0.0, 1.5, 3.0]
+        assert all(isinstance(x, OscBundle) for x in command_file)
+    with pytest.raises(ValueError):
+        len(command_file)
+
+
+def test_read_empty(tmp_path) -> None:
+    (tmp_path / "score.osc").write_bytes(b"")
+    with CommandFile(tmp_path / "score.osc") as command_file:
+        assert len(command_file) == 0
+        assert list(command_file) == []
+
+
+def test_read_truncated(context: Score, tmp_path) -> None:
+    context.write(tmp_path / "score.osc")
+    data = (tmp_path / "score.osc").read_bytes()
+    (tmp_path / "score.osc").write_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        CommandFile(tmp_path / "score.osc").open()
+
+
+@pytest.mark.parametrize("length", [-4, -1, 0, 15])
+def test_read_invalid_length(length: int, tmp_path) -> None:
+    (tmp_path / "score.osc").write_bytes(struct.pack(">i", length))
+    with pytest.raises(ValueError):
+        CommandFile(tmp_path / "score.osc").open()
@@ -0,0 +1,136 @@
+import time
+
+import pytest
+
+from supriya import OscMessage, Score, default
+from supriya.contexts import ParameterStream
+
+
+@pytest.fixture
+def context() -> Score:
+    return Score()
+
+
+def get_messages(score: Score) -> list[tuple[float | None, list]]:
+    return [
+        (bundle.timestamp, list(bundle.contents))
+        for bundle in score.iterate_osc_bundles()
+    ][1:]
+
+
+def test_flush(context: Score) -> None:
+    with context.at(0):
+        group = context.add_group()
+        synth = context.add_synth(default)
+    stream = context.stream_parameters()
+    stream.flush(seconds=1)
+    assert get_messages(context) == []
+    for frequency in [440, 441, 442]:
+        stream.set(synth, frequency=frequency)
+    stream.set(synth, (3, 0.5), amplitude=0.25)
+    stream.set(group, gate=0)
+    assert stream.pending_count == 4
+    stream.flush(seconds=2)
+    assert stream.pending_count == 0
+    assert stream.queue_depth == 0
+    assert stream.statistics.coalesced_count == 2
+    assert stream.statistics.sent_count == 1
+    assert get_messages(context) == [
+        (
+            2.0,
+            [
+                OscMessage(
+                    "/n_set", 1001, 3, 0.5, "amplitude", 0.25, "frequency", 442.0
+                ),
+                OscMessage("/n_set", 1000, "gate", 0.0),
+            ],
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "overflow_policy, expected_messages, expected_statistics",
+    [
+        (
+            "drop-oldest",
+            [
+                (3.0, [OscMessage("/n_set", 1000, "amplitude", 0.3)]),
+                (4.0, [OscMessage("/n_set", 1000, "frequency", 4.0)]),
+            ],
+            {"dropped_count": 2, "merged_count": 0, "sent_count": 2},
+        ),
+        (
+            "merge",
+            [
+                (1.0, [OscMessage("/n_set", 1000, "amplitude", 0.1)]),
+                (
+                    4.0,
+                    [OscMessage("/n_set", 1000, "amplitude", 0.3, "frequency", 4.0)],
+                ),
+            ],
+            {"dropped_count": 0, "merged_count": 2, "sent_count": 2},
+        ),
+    ],
+)
+def test_overflow(
+    context: Score,
+    overflow_policy: str,
+    expected_messages: list,
+    expected_statistics: dict,
+) -> None:
+    with context.at(0):
+        synth = context.add_synth(default)
+    stream = ParameterStream(
+        context,
+        maximum_queue_depth=2,
+        overflow_policy=overflow_policy,  # type: ignore
+        rate=1e-6,
+    )
+    # The background thread never ticks, so flushed bundles only queue up
+    with stream:
+        for i, (control, value) in enumerate(
+            [
+                ("amplitude", 0.1),
+                ("frequency", 2.0),
+                ("amplitude", 0.3),
+                ("frequency", 4.0),
+            ],
+            1,
+        ):
+            stream.set(synth, **{control: value})
+            stream.flush(seconds=i)
+        assert stream.queue_depth == 2
+    assert stream.queue_depth == 0
+    assert stream.statistics.peak_queue_depth == 2
+    for key, value in expected_statistics.items():
+        assert getattr(stream.statistics, key) == value
+    assert get_messages(context) == expected_messages
+
+
+def test_threaded(context: Score) -> None:
+    class Stream(ParameterStream):
+        # Scores require timestamps
+        def _enqueue(self, seconds: float | None) -> None:
+            super()._enqueue(1.0 if seconds is None else seconds)
+
+    with context.at(0):
+        synth = context.add_synth(default)
+    with Stream(context, rate=1000) as stream:
+        stream.set(synth, frequency=443)
+        for _ in range(100):
+            if stream.statistics.sent_count:
+                break
+            time.sleep(0.01)
+        assert stream.statistics.sent_count == 1
+    assert get_messages(context) == [
+        (1.0, [OscMessage("/n_set", 1000, "frequency", 443.0)])
+    ]
+
+
+def test_validation(context: Score) -> None:
+    with pytest.raises(ValueError):
+        context.stream_parameters(rate=0)
+    with pytest.raises(ValueError):
+        context.stream_parameters(maximum_queue_depth=0)
+    with pytest.raises(ValueError):
+        context.stream_parameters(overflow_policy="drop-newest")  # type: ignore
@@ -0,0 +1,67 @@
+import os
+
+from supriya import Options
+from supriya.contexts.nonrealtime import (
+    RenderCache,
+    RenderCacheStatistics,
+    _get_render_environment,
+)
+
+
+def test_get_and_put(tmp_path) -> None:
+    cache = RenderCache(tmp_path / "cache")
+    source_path = tmp_path / "source.aiff"
+    source_path.write_bytes(b"audio")
+    key = cache.get_key("digest", "aiff", "int24")
+    assert key != cache.get_key("digest", "aiff", "float")
+    assert cache.get(key, "aiff") is None
+    cached_path = cache.put(key, "aiff", source_path)
+    assert cached_path.read_bytes() == b"audio"
+    assert cache.get(key, "aiff") == cached_path
+    assert cache.statistics == RenderCacheStatistics(hits=1, misses=1)
+    # no temporary files left behind
+    assert sorted(path.name for path in cache.directory_path.iterdir()) == [
+        cached_path.name
+    ]
+
+
+def test_eviction(tmp_path) -> None:
+    cache = RenderCache(tmp_path / "cache", maximum_size=10)
+    source_path = tmp_path / "source.aiff"
+    source_path.write_bytes(b"12345")
+    path_a = cache.put("a", "aiff", source_path)
+    path_b = cache.put("b", "aiff", source_path)
+    # mark a as older than b, then use a so b becomes least-recently-used
+    os.utime(path_a, (0, 0))
+    os.utime(path_b, (1, 1))
+    assert cache.get("a", "aiff") == path_a
+    path_c = cache.put("c", "aiff", source_path)
+    assert path_a.exists()
+    assert not path_b.exists()
+    assert path_c.exists()
+    assert cache.size == 10
+    assert cache.statistics.evictions == 1
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_render_environment(tmp_path) -> None:
+    plugins_path = tmp_path / "plugins"
+    (plugins_path / "nested").mkdir(parents=True)
+    (plugins_path / "a.so").write_bytes(b"a")
+    (plugins_path / "nested" / "b.so").write_bytes(b"b")
+    options = Options(ugen_plugins_path=str(plugins_path))
+    environment = _get_render_environment(options, embedded=True)
+    assert "a.so:1:" in environment
+    assert _get_render_environment(options, embedded=True) == environment
+    # rewriting a nested plugin in place changes the fingerprint, even though no
+    # directory's mtime does
+    directory_times = [
+        (path, path.stat().st_mtime_ns)
+        for path in (plugins_path, plugins_path / "nested")
+    ]
+    (plugins_path / "nested" / "b.so").write_bytes(b"bb")
+    assert [(path, path.stat().st_mtime_ns) for path, _ in directory_times] == (
+        directory_times
+    )
+    assert "b.so:2:" in _get_render_environment(options, embedded=True)
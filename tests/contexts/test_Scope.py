@@ -161,3 +161,31 @@ def test_frequency_scope(
     assert any([entry[0] for entry in results])
     assert all([any(entry[1]) for entry in results if entry[0]])
     scope.stop()
+
+
+def test_amplitude_scope_stream(context: Server) -> None:
+    pytest.importorskip("numpy")
+    bus_group = context.audio_output_bus_group
+    scope = context.add_amplitude_scope(
+        bus=BusGroup(
+            calculation_rate=bus_group.calculation_rate,
+            context=bus_group.context,
+            count=2,
+            id_=0,
+        )
+    )
+    context.sync()
+    time.sleep(0.1)
+    reader = scope.stream(interval=0.01)
+    assert (reader.channel_count, reader.max_frames) == (2, 4096)
+    frames = []
+    for i, chunk in enumerate(reader):
+        assert chunk.shape == (reader.frame_count, 2)
+        assert chunk.shape[0] <= reader.max_frames
+        frames.append(chunk.copy())
+        if i == 4:
+            break
+    assert all(chunk.any() for chunk in frames)
+    scope.stop()
+    assert reader.closed
+    assert list(reader) == []
@@ -119,6 +119,28 @@ def test_set_bus(context: Score) -> None:
     ]
 
 
+def test_set_bus_coalescing(context: Score) -> None:
+    with context.at(0):
+        bus_group = context.add_bus_group("CONTROL", count=4)
+    with context.at(1) as moment:
+        bus_group[0].set(0.1)
+        bus_group[1].set(0.2)
+        bus_group[0].set_range((0.3, 0.4, 0.5))
+        bus_group[0].set(0.6)
+        bus_group[3].set(0.7)
+        bus_group[3].set(0.8)
+    assert moment.coalesced_count == 3
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/c_setn", 0, 3, 0.3, 0.4, 0.5),
+                OscMessage("/c_set", 0, 0.6, 3, 0.8),
+            ),
+            timestamp=1.0,
+        )
+    ]
+
+
 @pytest.mark.asyncio
 async def test_set_bus_range(context: Score) -> None:
     with context.at(0):
@@ -0,0 +1,159 @@
+import pytest
+
+from supriya import Score, default
+from supriya.contexts import EncodedTimeline, Timeline
+from supriya.enums import CalculationRate
+from supriya.osc import OscMessage
+from supriya.ugens import compile_synthdefs
+
+
+def build_stem(timeline_class: type) -> Score:
+    score = Score(timeline=timeline_class())
+    with score.at(0):
+        bus = score.add_bus(calculation_rate=CalculationRate.CONTROL)
+        buffer_ = score.add_buffer(channel_count=1, frame_count=512)
+        with score.add_synthdefs(default):
+            group = score.add_group()
+            synth = score.add_synth(
+                default,
+                target_node=group,
+                amplitude=bus.map_symbol(),
+                frequency=float(buffer_),
+            )
+        bus.set(0.5)
+    with score.at(1):
+        synth.free()
+        buffer_.free()
+    return score
+
+
+@pytest.fixture(params=[Timeline, EncodedTimeline])
+def timeline_class(request) -> type:
+    return request.param
+
+
+def get_messages(score: Score) -> list[tuple[float | None, list]]:
+    return [
+        (bundle.timestamp, list(bundle.contents))
+        for bundle in score.iterate_osc_bundles()
+    ]
+
+
+def test_merge(timeline_class: type) -> None:
+    mix = Score(timeline=timeline_class())
+    with mix.at(0):
+        mix.add_group()
+        mix.add_buffer(channel_count=2, frame_count=1024)
+    mix.merge(build_stem(timeline_class), offset=2.5)
+    mix.merge(build_stem(timeline_class), offset=2.5, buffer_controls=["frequency"])
+    messages = get_messages(mix)
+    assert [timestamp for timestamp, _ in messages] == [0.0, 2.5, 3.5]
+    (_, at_zero), (_, at_start), (_, at_stop) = messages
+    assert at_zero == [
+        OscMessage("/g_new", 1000, 0, 0),
+        OscMessage("/b_alloc", 0, 1024, 2),
+    ]
+    # /d_recv's SynthDef blob survives remapping byte-for-byte
+    assert [x.address for x in at_start] == [
+        "/b_alloc",
+        "/d_recv",
+        "/c_set",
+        "/b_alloc",
+        "/d_recv",
+        "/c_set",
+    ]
+    assert at_start[0] == OscMessage("/b_alloc", 1, 512, 1)
+    assert at_start[1].contents[-1].contents[0] == OscMessage("/g_new", 1001, 0, 0)
+    assert at_start[2] == OscMessage("/c_set", 0, 0.5)
+    assert at_start[3] == OscMessage("/b_alloc", 2, 512, 1)
+    assert at_start[4].contents[-1].contents[0] == OscMessage("/g_new", 1003, 0, 0)
+    assert at_start[5] == OscMessage("/c_set", 1, 0.5)
+    assert at_start[1].contents[0] == compile_synthdefs(default)
+    assert at_start[4].contents[0] == compile_synthdefs(default)
+    assert at_stop == [
+        OscMessage("/n_set", 1002, "gate", 0.0),
+        OscMessage("/b_free", 1),
+        OscMessage("/n_set", 1004, "gate", 0.0),
+        OscMessage("/b_free", 2),
+    ]
+    # new requests don't collide with merged IDs
+    with mix.at(4):
+        assert mix.add_group().id_ == 1005
+        assert mix.add_buffer(channel_count=1, frame_count=1).id_ == 3
+
+
+def test_merge_synth_controls(timeline_class: type) -> None:
+    mix = Score(timeline=timeline_class())
+    mix.merge(build_stem(timeline_class))
+    mix.merge(build_stem(timeline_class), buffer_controls=["frequency"])
+    synths = [
+        message.contents[-1].contents[-1]
+        for _, contents in get_messages(mix)
+        for message in contents
+        if message.address == "/d_recv"
+    ]
+    assert synths == [
+        OscMessage(
+            "/s_new",
+            "supriya:default",
+            1001,
+            0,
+            1000,
+            "amplitude",
+            "c0",
+            "frequency",
+            0.0,
+        ),
+        OscMessage(
+            "/s_new",
+            "supriya:default",
+            1003,
+            0,
+            1002,
+            "amplitude",
+            "c1",
+            "frequency",
+            1.0,
+        ),
+    ]
+
+
+def test_merge_osc_bundles(timeline_class: type) -> None:
+    mix = Score(timeline=timeline_class())
+    mix.merge(build_stem(timeline_class), offset=2.5)
+    mix.merge(build_stem(timeline_class), buffer_controls=["frequency"])
+    for score in (mix, mix.shift(1.0), mix.slice(0.5, 3.0)):
+        assert [
+            bundle.to_datagram(realtime=False) for bundle in score.iterate_osc_bundles()
+        ] == list(score.iterate_datagrams())
+
+
+def test_merge_negative_offset() -> None:
+    with pytest.raises(ValueError):
+        Score().merge(Score(), offset=-1)
+
+
+def test_shift(timeline_class: type) -> None:
+    score = build_stem(timeline_class)
+    shifted = score.shift(1.5)
+    assert [t for t, _ in get_messages(shifted)] == [1.5, 2.5]
+    assert [x for _, x in get_messages(shifted)] == [x for _, x in get_messages(score)]
+    assert isinstance(shifted._timeline, timeline_class)
+    with pytest.raises(ValueError):
+        score.shift(-1)
+    # allocators carry over, so new IDs don't collide
+    with shifted.at(3):
+        assert shifted.add_group().id_ == 1002
+
+
+def test_slice(timeline_class: type) -> None:
+    score = build_stem(timeline_class)
+    with score.at(2):
+        score.do_nothing()
+    assert [t for t, _ in get_messages(score.slice(0.5))] == [1.0, 2.0]
+    assert [t for t, _ in get_messages(score.slice(stop=1.0))] == [0.0]
+    assert [t for t, _ in get_messages(score.slice(1.0, 2.0))] == [1.0]
+    assert score.slice(1.0, 2.0)._timeline.get(1.0)[0].to_osc() == OscMessage(
+        "/n_set", 1001, "gate", 0.0
+    )
+    assert score.slice(2.0)._timeline.timestamps == (2.0,)
@@ -1,6 +1,7 @@
 import pytest
 
 from supriya import OscBundle, OscMessage, Score, SynthDef, default
+from supriya.osc import OscTemplate
 from supriya.ugens import compile_synthdefs
 
 
@@ -234,6 +235,28 @@ def test_pause_node(context: Score) -> None:
     ]
 
 
+def test_send_template(context: Score) -> None:
+    template = OscTemplate("/n_set", 1000, "frequency", float, "gate", int)
+    with context.at(0):
+        context.add_group()
+        context.send_template(template, 443.0, 1)
+    with context.at(1):
+        context.send_template(template, 220.0, 0)
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/g_new", 1000, 0, 0),
+                OscMessage("/n_set", 1000, "frequency", 443.0, "gate", 1),
+            ),
+            timestamp=0.0,
+        ),
+        OscBundle(
+            contents=(OscMessage("/n_set", 1000, "frequency", 220.0, "gate", 0),),
+            timestamp=1.0,
+        ),
+    ]
+
+
 def test_set_node(context: Score) -> None:
     with context.at(0):
         group = context.add_group()
@@ -262,6 +285,32 @@ def test_set_node(context: Score) -> None:
     ]
 
 
+def test_set_node_coalescing(context: Score) -> None:
+    with context.at(0) as moment:
+        group = context.add_group()
+        group.set(foo=1.0, bar=2.0)
+        group.set(foo=3.0)
+        group.set(foo=[4.0, 5.0])
+        group.free()
+        group.set(bar=6.0)
+        group.set(bar=7.0, baz=[8.0, 9.0])
+        group.set(baz=10.0)
+    assert moment.coalesced_count == 3
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/g_new", 1000, 0, 0),
+                OscMessage("/n_set", 1000, "bar", 2.0),
+                OscMessage("/n_set", 1000, "foo", [4.0, 5.0]),
+                OscMessage("/n_free", 1000),
+                OscMessage("/n_set", 1000, "bar", 7.0, "baz", [8.0, 9.0]),
+                OscMessage("/n_set", 1000, "baz", 10.0),
+            ),
+            timestamp=0.0,
+        )
+    ]
+
+
 def test_set_node_range(context: Score) -> None:
     with context.at(0):
         group = context.add_group()
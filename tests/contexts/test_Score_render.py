@@ -1,14 +1,16 @@
 import aifc
+import concurrent.futures
+import concurrent.futures.process
 import logging
 import platform
 
 import pytest
 
-from supriya import Score, default, output_path, render
+from supriya import Score, default, output_path, render, scsynth
+from supriya.contexts.nonrealtime import RenderCache, RenderCacheStatistics
 
 from ..conftest import _skip_no_scsynth_exe
-
-pytestmark = _skip_no_scsynth_exe
+from .conftest import _skip_no_scsynth
 
 # 3.13 would exit with 0
 # develop as of 2025/02/11 exits with -11 (why??)
@@ -49,6 +51,7 @@ HASHES = [
 ]
 
 
+@_skip_no_scsynth_exe
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ", ".join(
@@ -154,6 +157,7 @@ async def test_render(
         assert round(actual_frame_count / actual_sample_rate, 2) == expected_duration
 
 
+@_skip_no_scsynth_exe
 def test___render__(context: Score) -> None:
     expected_path = output_path / f"score-{HASHES[7]}.aiff"
     if expected_path.exists():
@@ -178,3 +182,57 @@ def test___render__(context: Score) -> None:
         assert actual_channel_count == 8
         assert actual_sample_rate == 44100
         assert round(actual_frame_count / actual_sample_rate, 2) == 3.0
+
+
+@_skip_no_scsynth
+@pytest.mark.asyncio
+async def test_render_embedded(context: Score, tmp_path) -> None:
+    actual_path, actual_exit_code = await context.render(
+        tmp_path / "embedded.aiff", embedded=True, output_bus_channel_count=2
+    )
+    assert actual_exit_code == 0
+    assert actual_path == tmp_path / "embedded.aiff"
+    assert actual_path is not None
+    with actual_path.open("rb") as file_pointer:
+        aifc_file = aifc.open(file_pointer)
+        (
+            actual_channel_count,
+            _,
+            actual_sample_rate,
+            actual_frame_count,
+            _,
+            _,
+        ) = aifc_file.getparams()
+        assert actual_channel_count == 2
+        assert actual_sample_rate == 44100
+        assert round(actual_frame_count / actual_sample_rate, 2) == 3.0
+
+
+@_skip_no_scsynth
+@pytest.mark.asyncio
+async def test_render_embedded_broken_pool(
+    context: Score, monkeypatch, tmp_path
+) -> None:
+    class BrokenExecutor(concurrent.futures.ProcessPoolExecutor):
+        def submit(self, *args, **kwargs):
+            raise concurrent.futures.process.BrokenProcessPool("worker died")
+
+    executor = BrokenExecutor(max_workers=1)
+    monkeypatch.setattr(scsynth, "_embedded_nonrealtime_executor", executor)
+    with pytest.raises(concurrent.futures.process.BrokenProcessPool):
+        await context.render(tmp_path / "embedded.aiff", embedded=True)
+    # the broken pool is discarded, so the next render spawns a fresh one
+    assert scsynth._embedded_nonrealtime_executor is None
+
+
+@_skip_no_scsynth_exe
+@pytest.mark.asyncio
+async def test_render_cache(context: Score, tmp_path) -> None:
+    cache = RenderCache(tmp_path / "cache")
+    path_a, _ = await context.render(tmp_path / "a.aiff", cache=cache)
+    assert cache.statistics == RenderCacheStatistics(misses=1)
+    path_b, exit_code = await context.render(tmp_path / "b.aiff", cache=cache)
+    assert exit_code == 0
+    assert cache.statistics == RenderCacheStatistics(hits=1, misses=1)
+    assert path_a is not None and path_b is not None
+    assert path_a.read_bytes() == path_b.read_bytes()
@@ -0,0 +1,131 @@
+import aifc
+import logging
+from typing import cast
+
+import pytest
+
+import supriya
+from supriya import Score, default
+from supriya.contexts.nonrealtime import RenderCache, RenderCacheStatistics
+from supriya.contexts.requests import EncodedRequest, NewGroup, ReceiveSynthDefs
+from supriya.osc import OscMessage
+
+from ..conftest import _skip_no_scsynth_exe
+
+
+@pytest.fixture(autouse=True)
+def use_caplog(caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+
+
+@pytest.fixture
+def context() -> Score:
+    context = Score()
+    with context.at(0):
+        context.add_synthdefs(default)
+        group = context.add_group()
+        buffer_ = context.add_buffer(channel_count=1, frame_count=1024)
+        synth_a = context.add_synth(default, target_node=group)
+    with context.at(1):
+        synth_a.free()
+        buffer_.free()
+    with context.at(2):
+        synth_b = context.add_synth(default, target_node=group, frequency=550)
+    with context.at(3):
+        synth_b.free()
+    with context.at(4):
+        synth_c = context.add_synth(default, target_node=group, frequency=660)
+    with context.at(5):
+        synth_c.free()
+    with context.at(6):
+        context.do_nothing()
+    return context
+
+
+@pytest.mark.parametrize(
+    "count, tail, expected_offsets",
+    [
+        (1, 0.0, [0.0]),
+        # gated releases don't end nodes without a tail
+        (3, 0.0, [0.0]),
+        (3, 1.0, [0.0, 1.9998185941043085, 3.999637188208617]),
+        (2, 1.0, [0.0, 1.9998185941043085]),
+    ],
+)
+def test_split(
+    context: Score, count: int, tail: float, expected_offsets: list[float]
+) -> None:
+    segments = context._split(
+        count=count, duration=6.0, sample_rate=44100, block_size=64, tail=tail
+    )
+    assert [offset for offset, _, _ in segments] == expected_offsets
+    for i, (offset, duration, segment) in enumerate(segments):
+        if i == len(segments) - 1:
+            assert offset + duration == pytest.approx(6.0)
+        else:
+            assert segments[i + 1][0] + tail <= offset + duration
+        if i:
+            # synthdefs and groups replay at the cut, payloads intact
+            replay = segment._timeline.get(0.0)
+            assert [cast(OscMessage, x.to_osc()).address for x in replay[:2]] == [
+                "/d_recv",
+                "/g_new",
+            ]
+            assert isinstance(replay[0], EncodedRequest)
+            assert replay[0].datagram == (
+                ReceiveSynthDefs(synthdefs=[default]).to_osc().to_datagram()
+            )
+            assert replay[1].to_osc() == (
+                NewGroup(items=[(1000, "ADD_TO_TAIL", 0)]).to_osc()
+            )
+
+
+def test_split_without_quiescence() -> None:
+    context = Score()
+    with context.at(0):
+        context.add_synthdefs(default)
+        context.add_synth(default)
+    with context.at(10):
+        context.do_nothing()
+    segments = context._split(
+        count=4, duration=10.0, sample_rate=44100, block_size=64, tail=1.0
+    )
+    assert len(segments) == 1
+
+
+@_skip_no_scsynth_exe
+@pytest.mark.asyncio
+async def test_render_segmented(context: Score, tmp_path) -> None:
+    path, _ = await context.render_segmented(
+        tmp_path / "output.aiff", cache=False, segment_count=3, tail=1.0
+    )
+    assert path == tmp_path / "output.aiff"
+    assert path is not None
+    with path.open("rb") as file_pointer:
+        aifc_file = aifc.open(file_pointer)
+        assert aifc_file.getnchannels() == 8
+        assert round(aifc_file.getnframes() / aifc_file.getframerate(), 2) == 6.0
+
+
+@_skip_no_scsynth_exe
+@pytest.mark.asyncio
+async def test_render_segmented_cache(context: Score, monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(supriya, "output_path", tmp_path / "output")
+    (tmp_path / "output").mkdir()
+    cache = RenderCache(tmp_path / "cache")
+    path_a, exit_code = await context.render_segmented(
+        cache=cache, segment_count=3, tail=1.0
+    )
+    assert exit_code == 0
+    assert path_a is not None
+    # only the joined output is cached, and no segments are left behind
+    assert cache.statistics == RenderCacheStatistics(misses=1)
+    assert len(list(cache.directory_path.iterdir())) == 1
+    assert list((tmp_path / "output").iterdir()) == [path_a]
+    path_b, exit_code = await context.render_segmented(
+        tmp_path / "b.aiff", cache=cache, segment_count=3, tail=1.0
+    )
+    assert exit_code == 0
+    assert path_b is not None
+    assert cache.statistics == RenderCacheStatistics(hits=1, misses=1)
+    assert path_a.read_bytes() == path_b.read_bytes()
@@ -0,0 +1,54 @@
+import pytest
+
+from supriya import AsyncServer, Server, ServerPool
+from supriya.enums import BootStatus
+from supriya.exceptions import ServerOffline, ServerOnline
+
+from .conftest import _skip_no_scsynth
+
+
+def test_acquire_before_start() -> None:
+    pool = ServerPool(size=1)
+    with pytest.raises(ServerOffline):
+        pool.acquire()
+
+
+def test_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        ServerPool(size=0)
+
+
+@_skip_no_scsynth
+def test_acquire_and_release() -> None:
+    with ServerPool(size=2) as pool:
+        assert len(pool) == 2
+        assert len(pool.statistics.boot_durations) == 2
+        server_a = pool.acquire()
+        server_b = pool.acquire()
+        assert isinstance(server_a, Server)
+        assert server_a is not server_b
+        assert server_a.options.port != server_b.options.port
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.1)
+        server_a.add_group()
+        pool.release(server_a)
+        assert pool.acquire() is server_a
+        assert pool.statistics.acquire_count == 3
+        assert pool.statistics.reset_count == 1
+        assert pool.statistics.reuse_count == 1
+
+
+@_skip_no_scsynth
+@pytest.mark.asyncio
+async def test_acquire_and_release_async() -> None:
+    async with ServerPool(size=1) as pool:
+        server = await pool.acquire_async()
+        assert isinstance(server, AsyncServer)
+        await pool.release_async(server)
+        assert (await pool.acquire_async()) is server
+        assert pool.statistics.reuse_count == 1
+        # async servers must be disconnected from their event loop
+        with pytest.raises(ServerOnline):
+            pool.stop()
+    assert len(pool) == 0
+    assert server.boot_status == BootStatus.OFFLINE
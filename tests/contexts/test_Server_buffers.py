@@ -11,6 +11,7 @@ import pytest_asyncio
 
 import supriya
 from supriya import AsyncServer, Buffer, OscBundle, OscMessage, Server, default
+from supriya.contexts.requests import GetBufferRange
 from supriya.contexts.responses import BufferInfo
 from supriya.exceptions import MomentClosed
 
@@ -467,6 +468,45 @@ async def test_set_buffer_range(context: AsyncServer | Server) -> None:
     ]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_file", [False, True])
+async def test_upload_and_download_buffer(
+    context: AsyncServer | Server, use_file: bool
+) -> None:
+    numpy = pytest.importorskip("numpy")
+    mono_buffer = context.add_buffer(channel_count=1, frame_count=1000)
+    stereo_buffer = context.add_buffer(channel_count=2, frame_count=1000)
+    await get(context.sync())
+    mono_array = numpy.linspace(-1, 1, 1000, dtype=numpy.float32)
+    stereo_array = numpy.stack([mono_array, mono_array[::-1]], axis=1)
+    # full transfers
+    await get(mono_buffer.upload(mono_array, use_file=use_file))
+    await get(stereo_buffer.upload(stereo_array, use_file=use_file))
+    assert numpy.array_equal(
+        await get(mono_buffer.download(use_file=use_file)), mono_array
+    )
+    assert numpy.array_equal(
+        await get(stereo_buffer.download(use_file=use_file)), stereo_array
+    )
+    # partial transfers
+    await get(stereo_buffer.upload(stereo_array[:10] * 0, starting_frame=990))
+    # a stray reply for the same buffer, before the downloaded range, is ignored
+    context.send(GetBufferRange(buffer_id=stereo_buffer, items=[(0, 4)]))
+    downloaded = await get(
+        stereo_buffer.download(frame_count=20, starting_frame=980, use_file=use_file)
+    )
+    assert downloaded.shape == (20, 2)
+    assert numpy.array_equal(downloaded[:10], stereo_array[980:990])
+    assert not downloaded[10:].any()
+    # out of range transfers
+    with pytest.raises(ValueError):
+        await get(mono_buffer.upload(mono_array, starting_frame=1))
+    with pytest.raises(ValueError):
+        await get(stereo_buffer.upload(mono_array))
+    with pytest.raises(ValueError):
+        await get(mono_buffer.download(frame_count=1001))
+
+
 @pytest.mark.asyncio
 async def test_write_buffer(context: AsyncServer | Server, tmp_path: Path) -> None:
     buffer_a = context.add_buffer(channel_count=1, frame_count=23)
@@ -272,3 +272,33 @@ async def test_set_bus_range(context: AsyncServer | Server) -> None:
             1.0,
             1.0,
         ]
+
+
+@pytest.mark.asyncio
+async def test_prefer_shared_memory(context: AsyncServer | Server) -> None:
+    if context._shared_memory is None:
+        pytest.skip("shared memory unavailable")
+    control_bus_group = context.add_bus_group("CONTROL", count=4)
+    context.set_prefer_shared_memory(True)
+    assert context.prefer_shared_memory
+    counts = context.bus_access_counts
+    shm_reads, shm_writes = counts.shm_reads, counts.shm_writes
+    osc_writes = counts.osc_writes
+    with context.osc_protocol.capture() as transcript:
+        control_bus_group[0].set(0.5)
+        control_bus_group[1:][0].set_range((0.25, 0.125))
+        assert await get(control_bus_group[0].get()) == 0.5
+        assert await get(control_bus_group.get()) == [0.5, 0.25, 0.125, 0.0]
+        # writes inside an open moment keep their OSC timing
+        with context.at():
+            control_bus_group[3].set(1.0)
+    assert [entry.message for entry in transcript.filtered(received=False)] == [
+        OscMessage("/c_set", 3, 1.0),
+    ]
+    assert counts.shm_reads - shm_reads == 2
+    assert counts.shm_writes - shm_writes == 2
+    assert counts.osc_writes - osc_writes == 1
+    # without the policy reads go back over OSC
+    context.set_prefer_shared_memory(False)
+    await get(context.sync())
+    assert await get(control_bus_group.get()) == (0.5, 0.25, 0.125, 1.0)
@@ -61,7 +61,9 @@ def setup_context(
     kwargs: dict = {}
     if port is not None:
         kwargs["port"] = port
-    context: AsyncServer | Server = context_class(name=name, embedded=embedded, **kwargs)
+    context: AsyncServer | Server = context_class(
+        name=name, embedded=embedded, **kwargs
+    )
     if isinstance(context, AsyncServer):
         for event in ServerLifecycleEvent:
             context.register_lifecycle_callback(
@@ -1010,3 +1012,28 @@ async def test_boot_a_and_connect_b_and_kill(
     assert context_b.boot_future.done()
     assert context_b.exit_future.done()
     logger.warning("END")
+
+
+@pytest.mark.parametrize("context_class", [AsyncServer, Server])
+def test_in_process_requires_embedded(
+    context_class: Type[AsyncServer | Server],
+) -> None:
+    with pytest.raises(ValueError):
+        context_class(in_process=True)
+
+
+@_skip_no_scsynth
+@pytest.mark.asyncio
+@pytest.mark.parametrize("context_class", [AsyncServer, Server])
+async def test_in_process_boot_and_quit(
+    context_class: Type[AsyncServer | Server],
+) -> None:
+    """
+    An in-process embedded World round-trips OSC without opening a UDP port.
+    """
+    context = context_class(embedded=True, in_process=True)
+    await get(context.boot())
+    assert context.boot_status == BootStatus.ONLINE
+    assert (await get(context.query_version())) is not None
+    await get(context.quit())
+    assert context.boot_status == BootStatus.OFFLINE
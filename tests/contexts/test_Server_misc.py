@@ -2,6 +2,7 @@ import asyncio
 import logging
 import re
 import subprocess
+import warnings
 from typing import AsyncGenerator
 
 import pytest
@@ -21,10 +22,24 @@ from supriya import (
     default,
     scsynth,
 )
-from supriya.contexts.responses import StatusInfo, VersionInfo
+from supriya.contexts.requests import (
+    GetBufferRange,
+    GetControlBus,
+    GetSynthControl,
+    QueryVersion,
+    Requestable,
+    Sync,
+)
+from supriya.contexts.responses import (
+    GetControlBusInfo,
+    GetNodeControlInfo,
+    StatusInfo,
+    SyncedInfo,
+    VersionInfo,
+)
 from supriya.exceptions import ServerOffline
 from supriya.osc import find_free_port
-from supriya.ugens import SYSTEM_SYNTHDEFS
+from supriya.ugens import SYSTEM_SYNTHDEFS, compile_synthdefs
 
 from .conftest import SERVER_PARAMS
 
@@ -1113,6 +1128,44 @@ async def test_dump_tree(context: AsyncServer | Server) -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_query_many(context: AsyncServer | Server) -> None:
+    buses = context.add_bus_group(count=100)
+    for i, bus in enumerate(buses):
+        bus.set(i / 100)
+    synth = context.add_synth(default, amplitude=0.25, frequency=333)
+    await get(context.sync())
+    requests: list[Requestable] = [GetControlBus(bus_ids=[bus]) for bus in buses]
+    requests.extend(
+        [
+            GetSynthControl(synth_id=synth, controls=["frequency"]),
+            GetSynthControl(synth_id=synth, controls=["amplitude"]),
+            Sync(sync_id=1234),
+            QueryVersion(),
+        ]
+    )
+    with context.osc_protocol.capture() as transcript:
+        responses = await get(context.query_many(requests))
+    for i, (bus, response) in enumerate(zip(buses, responses)):
+        assert isinstance(response, GetControlBusInfo)
+        assert response.items == [(bus.id_, pytest.approx(i / 100))]
+    assert responses[len(buses) : -1] == [
+        GetNodeControlInfo(node_id=synth.id_, items=[("frequency", 333.0)]),
+        GetNodeControlInfo(node_id=synth.id_, items=[("amplitude", 0.25)]),
+        SyncedInfo(sync_id=1234),
+    ]
+    assert isinstance(responses[-1], VersionInfo)
+    # requests are bundled into a handful of datagrams
+    assert len(list(transcript.filtered(received=False))) < 5
+    # requests without replies time out together
+    request = GetBufferRange(buffer_id=1234, items=[(0, 1)])
+    with (
+        warnings.catch_warnings(record=True),
+        pytest.raises((asyncio.TimeoutError, TimeoutError)),
+    ):
+        await get(context.query_many([request], timeout=0.1))
+
+
 @pytest.mark.asyncio
 async def test_query_status(context: AsyncServer | Server) -> None:
     assert isinstance(await get(context.query_status()), StatusInfo)
@@ -1237,10 +1290,7 @@ async def test_reboot(context: AsyncServer | Server) -> None:
         OscMessage("/quit"),
         OscMessage("/notify", 1),
         OscMessage("/g_new", 1, 1, 0),
-        *(
-            OscMessage("/d_recv", synthdef.compile())
-            for synthdef in SYSTEM_SYNTHDEFS.values()
-        ),
+        OscMessage("/d_recv", compile_synthdefs(*SYSTEM_SYNTHDEFS.values())),
         OscMessage("/sync", 0),
     ]
 
@@ -1291,10 +1341,7 @@ async def test_reset(context: AsyncServer | Server) -> None:
         ),
         OscMessage("/sync", 2),
         OscMessage("/g_new", 1, 1, 0),
-        *(
-            OscMessage("/d_recv", synthdef.compile())
-            for synthdef in SYSTEM_SYNTHDEFS.values()
-        ),
+        OscMessage("/d_recv", compile_synthdefs(*SYSTEM_SYNTHDEFS.values())),
         OscMessage("/sync", 0),
     ]
 
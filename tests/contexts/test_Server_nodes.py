@@ -1,13 +1,13 @@
 import asyncio
 import logging
-from typing import AsyncGenerator
+from typing import AsyncGenerator, cast
 
 import pytest
 import pytest_asyncio
 from uqbar.strings import normalize
 
 from supriya import AsyncServer, OscBundle, OscMessage, Server, SynthDef, default
-from supriya.contexts.responses import NodeInfo
+from supriya.contexts.responses import NodeInfo, QueryTreeDiff
 from supriya.enums import NodeAction
 
 from supriya.osc import find_free_port
@@ -61,11 +61,16 @@ async def test_Group_children(context: AsyncServer | Server) -> None:
     assert group.children == [synth_a]  # waiting for the /n_go response
     await get(context.sync())
     assert group.children == [synth_c, synth_a, synth_d, synth_b]
+    assert group.child_count == 4
+    assert context.default_group.descendant_count == 5
+    assert context.root_node.descendant_count == 6
     # freed groups have no children
     group.free()
     assert group.children == [synth_c, synth_a, synth_d, synth_b]  # waiting for /n_end
     await get(context.sync())
     assert group.children == []
+    assert group.child_count == 0
+    assert context.root_node.descendant_count == 1
     # no children on an unbooted context
     await get(context.quit())
     assert context.root_node.children == []
@@ -445,6 +450,28 @@ async def test_set_node(context: AsyncServer | Server) -> None:
     ]
 
 
+@pytest.mark.asyncio
+async def test_set_node_control_indices(context: AsyncServer | Server) -> None:
+    context.set_prefer_control_indices(True)
+    with context.osc_protocol.capture() as transcript:
+        synth = context.add_synth(default, amplitude=0.25, frequency=330)
+        synth.set(frequency=220, pan=[0.5])
+        synth.set((3, 2.0), amplitude=0.1, foo=1.5)
+        # groups have no SynthDef to resolve names against
+        context.default_group.set(amplitude=0.1)
+    assert [entry.message for entry in transcript.filtered(received=False)] == [
+        OscMessage("/s_new", "supriya:default", 1000, 0, 1, 1, 0.25, 2, 330.0),
+        OscBundle(
+            contents=(
+                OscMessage("/n_set", 1000, 2, 220.0),
+                OscMessage("/n_setn", 1000, 4, 1, 0.5),
+            ),
+        ),
+        OscMessage("/n_set", 1000, 3, 2.0, 1, 0.1, "foo", 1.5),
+        OscMessage("/n_set", 1, "amplitude", 0.1),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_set_node_range(context: AsyncServer | Server) -> None:
     group = context.add_group()
@@ -455,6 +482,56 @@ async def test_set_node_range(context: AsyncServer | Server) -> None:
     ]
 
 
+@pytest.mark.asyncio
+async def test_snapshot_tree(context: AsyncServer | Server) -> None:
+    group = context.add_group()
+    synth_a = group.add_synth(default)
+    synth_b = group.add_synth(default, add_action="ADD_TO_TAIL", frequency=443)
+    await get(context.sync())
+    # snapshots without controls are built locally
+    with context.osc_protocol.capture() as transcript:
+        snapshot_a = await get(context.snapshot_tree(group))
+    assert [entry.message for entry in transcript.filtered(received=False)] == []
+    assert normalize(str(snapshot_a)) == normalize(
+        """
+        NODE TREE 1000 group
+            1001 supriya:default
+            1002 supriya:default
+        """
+    )
+    # only the requested synths' controls are refreshed
+    with context.osc_protocol.capture() as transcript:
+        snapshot_b = await get(context.snapshot_tree(group, include_controls=[synth_b]))
+    assert [
+        cast(OscMessage, message).address
+        for entry in transcript.filtered(received=False)
+        for message in cast(OscBundle, entry.message).contents
+    ] == ["/s_getn", "/sync"]
+    assert normalize(str(snapshot_b)) == normalize(
+        """
+        NODE TREE 1000 group
+            1001 supriya:default
+            1002 supriya:default
+                out: 0.0, amplitude: 0.1, frequency: 443.0, gate: 1.0, pan: 0.5
+        """
+    )
+    assert snapshot_a.diff(snapshot_b) == QueryTreeDiff(changed_ids=[1002])
+    # snapshots match the server's own tree
+    synth_a.free()
+    group.add_group(add_action="ADD_TO_HEAD")
+    synth_c = context.add_synth(default)
+    synth_c.move(group, "ADD_TO_HEAD")
+    await get(context.sync())
+    snapshot_c = await get(context.snapshot_tree(group, include_controls=True))
+    assert str(snapshot_c) == str(await get(context.query_tree(group)))
+    assert snapshot_a.diff(snapshot_c) == QueryTreeDiff(
+        added_ids=[1003, 1004],
+        changed_ids=[1002],
+        removed_ids=[1001],
+    )
+    assert not snapshot_c.diff(snapshot_c)
+
+
 @pytest.mark.asyncio
 async def test_trace_node(context: AsyncServer | Server) -> None:
     for _ in range(5):
@@ -0,0 +1,167 @@
+import pytest
+
+from supriya import Score, default
+from supriya.contexts.requests import (
+    AllocateBuffer,
+    EncodedRequest,
+    FreeNode,
+    NewGroup,
+    ReceiveSynthDefs,
+)
+from supriya.contexts.timelines import (
+    BaseTimeline,
+    EncodedTimeline,
+    Timeline,
+    _split_completion,
+)
+
+
+@pytest.fixture(params=[Timeline, EncodedTimeline])
+def timeline(request) -> BaseTimeline:
+    timeline = request.param()
+    timeline.add(1.0, [FreeNode(node_ids=[1])])
+    timeline.add(3.0, [FreeNode(node_ids=[3])])
+    timeline.add(2.0, [FreeNode(node_ids=[2])])  # out of order
+    timeline.add(1.0, [FreeNode(node_ids=[4])])
+    timeline.add(4.0, [])
+    return timeline
+
+
+def test_iterate(timeline: BaseTimeline) -> None:
+    assert timeline.timestamps == (1.0, 2.0, 3.0, 4.0)
+    assert len(timeline) == 4
+    assert [
+        (timestamp, [x.to_osc() for x in requests])
+        for timestamp, requests in timeline.iterate()
+    ] == [
+        (1.0, [FreeNode(node_ids=[1]).to_osc(), FreeNode(node_ids=[4]).to_osc()]),
+        (2.0, [FreeNode(node_ids=[2]).to_osc()]),
+        (3.0, [FreeNode(node_ids=[3]).to_osc()]),
+        (4.0, []),
+    ]
+
+
+@pytest.mark.parametrize(
+    "start, stop, inclusive, expected",
+    [
+        (None, None, False, [1.0, 2.0, 3.0, 4.0]),
+        (1.5, None, False, [2.0, 3.0, 4.0]),
+        (None, 3.0, False, [1.0, 2.0]),
+        (None, 3.0, True, [1.0, 2.0, 3.0]),
+        (2.0, 2.0, True, [2.0]),
+        (2.0, 2.0, False, []),
+    ],
+)
+def test_iterate_range(
+    timeline: BaseTimeline,
+    start: float | None,
+    stop: float | None,
+    inclusive: bool,
+    expected: list[float],
+) -> None:
+    assert [
+        timestamp for timestamp, _ in timeline.iterate(start, stop, inclusive)
+    ] == expected
+    assert [
+        timestamp for timestamp, _ in timeline.iterate_encoded(start, stop, inclusive)
+    ] == expected
+
+
+def test_timestamps(timeline: BaseTimeline) -> None:
+    # cached until a new timestamp is added
+    assert timeline.timestamps is timeline.timestamps
+    timeline.add(4.0, [FreeNode(node_ids=[5])])
+    assert timeline.timestamps == (1.0, 2.0, 3.0, 4.0)
+    assert len(timeline) == 4
+    timeline.add(5.0, [])
+    assert len(timeline) == 5
+    assert timeline.timestamps == (1.0, 2.0, 3.0, 4.0, 5.0)
+    timeline.add(0.5, [FreeNode(node_ids=[6])])
+    timeline.add(0.5, [FreeNode(node_ids=[7])])
+    assert len(timeline) == 6
+    assert timeline.timestamps == (0.5, 1.0, 2.0, 3.0, 4.0, 5.0)
+
+
+def test_get(timeline: BaseTimeline) -> None:
+    assert [x.to_osc() for x in timeline.get(2.0)] == [FreeNode(node_ids=[2]).to_osc()]
+    assert timeline.get(2.5) == []
+
+
+def test_encoded_timeline_decodes_lazily() -> None:
+    timeline = EncodedTimeline()
+    timeline.add(0.0, [ReceiveSynthDefs(synthdefs=[default])])
+    ((_, requests),) = timeline.iterate()
+    assert isinstance(requests[0], EncodedRequest)
+    # encoded requests are stored as-is, keeping blobs intact
+    timeline.add(1.0, requests)
+    assert [datagrams for _, datagrams in timeline.iterate_encoded()] == [
+        [ReceiveSynthDefs(synthdefs=[default]).to_osc().to_datagram()]
+    ] * 2
+
+
+def test_score_datagrams() -> None:
+    scores = [Score(), Score(timeline=EncodedTimeline())]
+    for score in scores:
+        with score.at(0):
+            with score.add_synthdefs(default):
+                group = score.add_group()
+                score.add_synth(default, target_node=group)
+        with score.at(2):
+            score.add_buffer(channel_count=1, frame_count=512)
+        with score.at(1):
+            score.add_synth(default, target_node=group, frequency=550.0)
+    assert list(scores[0].iterate_datagrams()) == list(scores[1].iterate_datagrams())
+    assert list(scores[0].iterate_datagrams(until=1.5)) == list(
+        scores[1].iterate_datagrams(until=1.5)
+    )
+    assert [x.timestamp for x in scores[1].iterate_request_bundles(until=3)] == [
+        0.0,
+        1.0,
+        2.0,
+        3.0,
+    ]
+
+
+def test_score_osc_bundles() -> None:
+    scores = [Score(), Score(timeline=EncodedTimeline())]
+    for score in scores:
+        with score.at(0):
+            with score.add_synthdefs(default):
+                score.add_synth(default)
+            score.add_synthdefs(default)
+        # decoding keeps SynthDef blobs intact
+        assert [
+            bundle.to_datagram(realtime=False) for bundle in score.iterate_osc_bundles()
+        ] == list(score.iterate_datagrams())
+    assert list(scores[0].iterate_osc_bundles()) == list(
+        scores[1].iterate_osc_bundles()
+    )
+
+
+@pytest.mark.parametrize(
+    "request_, expected_prefix, expected_completion",
+    [
+        (FreeNode(node_ids=[1]), FreeNode(node_ids=[1]), None),
+        (ReceiveSynthDefs(synthdefs=[default]), ReceiveSynthDefs([default]), None),
+        (
+            ReceiveSynthDefs(synthdefs=[default], on_completion=FreeNode([1])),
+            ReceiveSynthDefs([default]),
+            FreeNode([1]),
+        ),
+        (
+            AllocateBuffer(
+                buffer_id=0,
+                frame_count=512,
+                on_completion=NewGroup(items=[(1000, 0, 0)]),
+            ),
+            AllocateBuffer(buffer_id=0, frame_count=512),
+            NewGroup(items=[(1000, 0, 0)]),
+        ),
+    ],
+)
+def test_split_completion(request_, expected_prefix, expected_completion) -> None:
+    prefix, completion = _split_completion(request_.to_osc().to_datagram())
+    assert prefix == expected_prefix.to_osc().to_datagram()
+    assert completion == (
+        expected_completion.to_osc().to_datagram() if expected_completion else None
+    )
@@ -1,10 +1,12 @@
 import asyncio
 import concurrent.futures
 import logging
+import math
 
 import pytest
 from uqbar.strings import normalize
 
+import supriya.osc
 from supriya.enums import BootStatus
 from supriya.osc import (
     NTP_DELTA,
@@ -12,6 +14,7 @@ from supriya.osc import (
     HealthCheck,
     OscBundle,
     OscMessage,
+    OscTemplate,
     ThreadedOscProtocol,
     find_free_port,
 )
@@ -69,6 +72,49 @@ def test_OscMessage() -> None:
     )
 
 
+@pytest.mark.parametrize("native", [False, True])
+def test_OscTemplate(monkeypatch, native: bool) -> None:
+    if not native:
+        monkeypatch.setattr(supriya.osc, "_fill_template", None)
+    elif supriya.osc._fill_template is None:
+        pytest.skip("native module does not provide fill_template")
+    template = OscTemplate("/n_set", 1000, "frequency", float, "gate", int, [1, 2.5])
+    assert repr(template) == (
+        "OscTemplate('/n_set', 1000, 'frequency', float, 'gate', int, [1, 2.5])"
+    )
+    for values in [(0.0, 0), (443.25, 1), (-1.5, -2)]:
+        expected = OscMessage(
+            "/n_set", 1000, "frequency", values[0], "gate", values[1], [1, 2.5]
+        )
+        osc_message = template(*values)
+        assert osc_message == expected
+        assert expected == osc_message
+        assert osc_message.to_datagram() == expected.to_datagram()
+        assert OscMessage.from_datagram(osc_message.to_datagram()) == expected
+    # Integer addresses and integers in float slots
+    assert OscTemplate(15, float).to_datagram(3) == OscMessage(15, 3.0).to_datagram()
+    assert template(440, 1).contents[2:4] == (440.0, "gate")
+    assert isinstance(template(440, 1).contents[2], float)
+    # Floats beyond float32's range encode as infinity
+    for value, expected_value in [(1e39, math.inf), (-1e39, -math.inf)]:
+        datagram = OscTemplate(15, float).to_datagram(value)
+        assert OscMessage.from_datagram(datagram).contents == (expected_value,)
+    # Template messages nest in bundles
+    bundle = OscBundle(contents=[template(440.0, 1), OscMessage("/sync", 1)])
+    assert OscBundle.from_datagram(bundle.to_datagram()) == OscBundle(
+        contents=[
+            OscMessage("/n_set", 1000, "frequency", 440.0, "gate", 1, [1, 2.5]),
+            OscMessage("/sync", 1),
+        ]
+    )
+    with pytest.raises(ValueError):
+        template(440.0)
+    with pytest.raises(ValueError):
+        template.to_datagram(440.0, 1, 2)
+    with pytest.raises(TypeError):
+        template.to_datagram(440.0, 1.5)
+
+
 def test_new_ntp_era() -> None:
     """
     Check for NTP timestamp overflow.
@@ -135,3 +181,81 @@ async def test_OscProtocol(osc_protocol_class, process_protocol_class) -> None:
 
     finally:
         await get(process_protocol.quit())
+
+
+@pytest.mark.parametrize("osc_protocol_class", [AsyncOscProtocol, ThreadedOscProtocol])
+@pytest.mark.asyncio
+async def test_OscProtocol_callbacks(osc_protocol_class) -> None:
+    def process_commands() -> None:
+        if isinstance(osc_protocol, ThreadedOscProtocol):
+            osc_protocol._process_command_queue()
+
+    def match(*contents) -> list[str]:
+        return [
+            callback.procedure.__name__
+            for callback in osc_protocol._match_callbacks(OscMessage(*contents))
+        ]
+
+    def a(message): ...
+
+    def b(message): ...
+
+    def c(message): ...
+
+    osc_protocol = osc_protocol_class()
+    callback_a = osc_protocol.register(pattern=["/n_go"], procedure=a)
+    callback_b = osc_protocol.register(
+        pattern=["/n_go", 1000], procedure=b, failure_pattern=["/fail", "/n_go"]
+    )
+    # equal callbacks are distinct handles
+    callback_b_copy = osc_protocol.register(
+        pattern=["/n_go", 1000], procedure=b, failure_pattern=["/fail", "/n_go"]
+    )
+    callback_c, callback_d = osc_protocol.register_many(
+        [(["/synced", 1], c, None), (["/synced", 2], c, None)], once=True
+    )
+    process_commands()
+    assert match("/n_go", 1000, 1) == ["a", "b", "b"]
+    assert match("/n_go", 1001, 1) == ["a"]
+    assert match("/n_go", [1000], 1) == ["a"]
+    assert match("/fail", "/n_go", "Node not found") == ["b", "b"]
+    assert match("/synced", 1) == ["c"]
+    assert match("/synced", 1) == []
+    osc_protocol.unregister(callback_b)
+    osc_protocol.unregister(callback_c)  # already unregistered
+    process_commands()
+    assert match("/n_go", 1000, 1) == ["a", "b"]
+    osc_protocol.unregister_many([callback_a, callback_b_copy, callback_d])
+    process_commands()
+    assert match("/n_go", 1000, 1) == []
+    assert match("/synced", 2) == []
+    assert osc_protocol.callbacks == {}
+
+
+def test_OscProtocol_logging(caplog) -> None:
+    class Message(OscMessage):
+        def __repr__(self) -> str:
+            formatted.append(self)
+            return super().__repr__()
+
+    formatted: list[OscMessage] = []
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.status = BootStatus.ONLINE
+    message = Message("/n_set", 1000, "frequency", 440.0)
+    # nothing is formatted when nothing is listening
+    with caplog.at_level(logging.WARNING, logger="supriya"):
+        assert osc_protocol._send(message) == message.to_datagram()
+    assert formatted == []
+    assert caplog.records == []
+    with caplog.at_level(logging.DEBUG, logger="supriya.osc.out"):
+        osc_protocol._send(message)
+    assert formatted == [message]
+    assert [record.name for record in caplog.records] == ["supriya.osc.out"]
+    # captures still see every message
+    with osc_protocol.capture() as transcript:
+        osc_protocol._send(message)
+        list(osc_protocol._validate_receive(message.to_datagram()))
+    assert [(entry.label, entry.message) for entry in transcript] == [
+        ("S", message),
+        ("R", OscMessage("/n_set", 1000, "frequency", 440.0)),
+    ]
@@ -0,0 +1,33 @@
+import pytest
+
+from supriya.soundfiles import read_float_wave, write_float_wave
+
+numpy = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("channel_count", [1, 2, 8])
+def test_float_wave_round_trip(tmp_path, channel_count: int) -> None:
+    array = (
+        numpy.random.default_rng(0)
+        .uniform(-1, 1, (1000, channel_count))
+        .astype(numpy.float32)
+    )
+    path = tmp_path / "test.wav"
+    write_float_wave(path, array, sample_rate=48000)
+    assert numpy.array_equal(read_float_wave(path), array)
+
+
+def test_read_float_wave_truncated(tmp_path) -> None:
+    # files still being written by scsynth may claim more data than they hold
+    array = numpy.ones((100, 2), dtype=numpy.float32)
+    path = tmp_path / "test.wav"
+    write_float_wave(path, array)
+    path.write_bytes(path.read_bytes()[:-20])
+    assert read_float_wave(path).shape == (97, 2)
+
+
+def test_read_float_wave_not_float(tmp_path) -> None:
+    path = tmp_path / "test.wav"
+    path.write_bytes(b"RIFF\x00\x00\x00\x00WAVE")
+    with pytest.raises(ValueError):
+        read_float_wave(path)
@@ -1,16 +1,38 @@
+import struct
+from pathlib import Path
+
+import pytest
+
 from supriya.ugens import (
     Decay2,
     DelayC,
+    Impulse,
     In,
+    LocalBuf,
     Mix,
     Out,
     Parameter,
+    SendReply,
     SinOsc,
     SynthDefBuilder,
+    compile_synthdefs,
+    core,
     decompile_synthdef,
+    decompile_synthdef_directory,
+    decompile_synthdefs,
+    default,
 )
 
 
+@pytest.fixture(params=["native", "python"])
+def decoder(request, monkeypatch) -> str:
+    if request.param == "native" and core._synthdef_native is None:
+        pytest.skip("native SynthDef decoder not built")
+    if request.param == "python":
+        monkeypatch.setattr(core, "_synthdef_native", None)
+    return request.param
+
+
 def test_SynthDefDecompiler_01() -> None:
     r"""Anonymous SynthDef without parameters."""
     with SynthDefBuilder() as builder:
@@ -148,3 +170,82 @@ def test_SynthDefDecompiler_08() -> None:
     assert compiled_synthdef == new_synthdef.compile()
     assert old_synthdef.anonymous_name == new_synthdef.anonymous_name
     assert old_synthdef.name == new_synthdef.name
+
+
+def test_SynthDefDecompiler_09(decoder: str) -> None:
+    r"""Multiple unexpanded inputs and synthetic LocalBuf inputs."""
+    with SynthDefBuilder(freq=440) as builder:
+        sine = SinOsc.ar(frequency=builder["freq"])
+        SendReply.kr(
+            trigger=Impulse.kr(frequency=10),
+            source=[sine, sine * 2],
+            command_name="/reply",
+        )
+        LocalBuf.ir(channel_count=1, frame_count=512)
+    old_synthdef = builder.build("replies")
+    compiled_synthdef = old_synthdef.compile()
+    new_synthdef = decompile_synthdef(compiled_synthdef)
+    assert str(old_synthdef) == str(new_synthdef)
+    assert old_synthdef.indexed_parameters == new_synthdef.indexed_parameters
+    assert compiled_synthdef == new_synthdef.compile()
+
+
+def test_SynthDefDecompiler_10(decoder: str) -> None:
+    r"""Variants are skipped, version 1 files are decoded."""
+    with SynthDefBuilder(freq=440) as builder:
+        Out.ar(bus=0, source=SinOsc.ar(frequency=builder["freq"]))
+    synthdef = builder.build("variants")
+    header, body = b"SCgf\x00\x00\x00\x02\x00\x02", synthdef.compile()[10:-2]
+    variant = b"\x00\x01\x01a" + struct.pack(">f", 220.0)
+    synthdefs = decompile_synthdefs(header + body + variant + default.compile()[10:])
+    assert synthdefs == [synthdef, default]
+    # version 1 uses 16-bit counts and input specs
+    with SynthDefBuilder() as builder:
+        Out.ar(bus=0, source=SinOsc.ar())
+    synthdef = builder.build("version-1")
+    version_1 = b"".join(
+        [
+            b"SCgf\x00\x00\x00\x01\x00\x01\x09version-1",
+            struct.pack(">Hff", 2, 440.0, 0.0),
+            struct.pack(">HH", 0, 0),
+            struct.pack(">H", 2),
+            b"\x06SinOsc\x02" + struct.pack(">HHH", 2, 1, 0),
+            struct.pack(">HHHH", 0xFFFF, 0, 0xFFFF, 1) + b"\x02",
+            b"\x03Out\x02" + struct.pack(">HHH", 2, 0, 0),
+            struct.pack(">HHHH", 0xFFFF, 1, 0, 0),
+            b"\x00\x00",
+        ]
+    )
+    assert decompile_synthdef(version_1).compile() == synthdef.compile()
+
+
+def test_SynthDefDecompiler_11(decoder: str) -> None:
+    r"""Malformed SynthDef files raise ValueError."""
+    compiled_synthdef = default.compile()
+    for value in [
+        b"",
+        b"SCgf",
+        compiled_synthdef[:-8],
+        b"XXXX" + compiled_synthdef[4:],
+    ]:
+        with pytest.raises(ValueError):
+            decompile_synthdefs(value)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_decompile_synthdef_directory(max_workers: int, tmp_path: Path) -> None:
+    synthdefs = []
+    for i in range(4):
+        with SynthDefBuilder(freq=440 + i) as builder:
+            Out.ar(bus=i, source=SinOsc.ar(frequency=builder["freq"]))
+        synthdefs.append(builder.build(f"test-{i}"))
+        (tmp_path / f"test-{i}.scsyndef").write_bytes(synthdefs[-1].compile())
+    (tmp_path / "both.scsyndef").write_bytes(compile_synthdefs(*synthdefs[:2]))
+    (tmp_path / "ignored.txt").write_text("ignored")
+    assert decompile_synthdef_directory(tmp_path, max_workers=max_workers) == {
+        tmp_path / "both.scsyndef": synthdefs[:2],
+        **{
+            tmp_path / f"test-{i}.scsyndef": [synthdef]
+            for i, synthdef in enumerate(synthdefs)
+        },
+    }
@@ -5,7 +5,17 @@ import pytest
 from uqbar.strings import normalize
 
 from ..conftest import _skip_no_sclang_exe
-from supriya.ugens import SuperColliderSynthDef, decompile_synthdef
+from supriya.ugens import (
+    LFNoise1,
+    Out,
+    Pan2,
+    SinOsc,
+    SuperColliderSynthDef,
+    SynthDef,
+    SynthDefBuilder,
+    UGen,
+    decompile_synthdef,
+)
 
 
 @pytest.fixture
@@ -100,3 +110,23 @@ def test_sc_format(sc_synthdef_expansion: SuperColliderSynthDef) -> None:
                     source[1]: UnaryOpUGen(SOFTCLIP).ar/7[0]
         """
     )
+
+
+def build_bank() -> SynthDef:
+    with SynthDefBuilder(frequency=110, amplitude=[0.1, 0.2]) as builder:
+        sines = SinOsc.ar(
+            frequency=[builder["frequency"] * (i + 1) for i in range(16)],
+            phase=[0.0, 0.5, 0.25],
+        )
+        amplitudes = LFNoise1.kr(frequency=[[0.1, 0.2], 3]) * [1, 0.5, 0.25]
+        panned = Pan2.ar(source=SinOsc.ar(frequency=[1, 2, 3]), position=[-1, 1])
+        Out.ar(bus=0, source=sines * amplitudes - builder["amplitude"])
+        Out.ar(bus=2, source=panned)
+    return builder.build(name="bank")
+
+
+def test_flat_expansion(monkeypatch: pytest.MonkeyPatch) -> None:
+    compiled = build_bank().compile()
+    # Force every expansion down the recursive path
+    monkeypatch.setattr(UGen, "_expand_flat_params", staticmethod(lambda *_: None))
+    assert build_bank().compile() == compiled
@@ -1,5 +1,7 @@
 import os
 import platform
+import subprocess
+import sys
 
 import pytest
 from uqbar.strings import normalize
@@ -745,3 +747,24 @@ def test_sclang(
     compiled = SuperColliderSynthDef(sclang_name, sclang_body, sclang_rates).compile()
     synthdef = decompile_synthdef(compiled)
     assert normalize(str(synthdef)) == normalize(expected_str)
+
+
+def test_lazy_registries() -> None:
+    script = (
+        "from supriya.ugens import system\n"
+        "registries = [\n"
+        "    system.AMPLITUDE_SCOPE_SYNTHDEFS,\n"
+        "    system.FREQUENCY_SCOPE_SYNTHDEFS,\n"
+        "    system.SYSTEM_SYNTHDEFS,\n"
+        "]\n"
+        "assert [len(x._synthdefs) for x in registries] == [0, 0, 0]\n"
+        "assert [len(x) for x in registries] == [32, 8, 32]\n"
+        "synthdef = system.system_link_audio_2\n"
+        "assert system.SYSTEM_SYNTHDEFS['supriya:link-ar:2'] is synthdef\n"
+        "assert [len(x._synthdefs) for x in registries] == [0, 0, 1]\n"
+        "for registry in registries:\n"
+        "    for name, synthdef in registry.items():\n"
+        "        assert synthdef.effective_name == name\n"
+    )
+    # registries are module globals, so check laziness in a fresh interpreter
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+def import_ugens(pycache_prefix: Path) -> int:
+    environment = {**os.environ, "PYTHONPYCACHEPREFIX": str(pycache_prefix)}
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    return int(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from supriya.ugens import core; print(core._generated_code_misses)",
+            ],
+            capture_output=True,
+            check=True,
+            env=environment,
+            text=True,
+        ).stdout
+    )
+
+
+def test_generated_code_cache(tmp_path: Path) -> None:
+    assert import_ugens(tmp_path) > 0
+    (path,) = tmp_path.rglob("ugens.*.marshal")
+    assert import_ugens(tmp_path) == 0
+    # corrupt caches are ignored and rewritten
+    path.write_bytes(b"garbage")
+    assert import_ugens(tmp_path) > 0
+    assert import_ugens(tmp_path) == 0
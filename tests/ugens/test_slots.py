@@ -0,0 +1,54 @@
+import copy
+import pickle
+
+import pytest
+
+from supriya.enums import CalculationRate
+from supriya.ugens import (
+    BinaryOpUGen,
+    Control,
+    In,
+    Out,
+    OutputProxy,
+    Parameter,
+    SinOsc,
+    SynthDefBuilder,
+    UGen,
+)
+
+
+@pytest.mark.parametrize(
+    "ugen",
+    [
+        BinaryOpUGen(calculation_rate=CalculationRate.AUDIO, left=1.0, right=2.0),
+        In(calculation_rate=CalculationRate.AUDIO, channel_count=2),
+        Parameter(name="frequency", value=440),
+        Control(
+            parameters=[Parameter(name="frequency", value=440)],
+            calculation_rate=CalculationRate.CONTROL,
+        ),
+    ],
+)
+def test_slots(ugen: UGen) -> None:
+    assert not hasattr(ugen, "__dict__")
+    assert not hasattr(ugen[0], "__dict__")
+    with pytest.raises(AttributeError):
+        ugen.foo = "bar"  # type: ignore
+
+
+def test_output_proxies() -> None:
+    ugen = In(calculation_rate=CalculationRate.AUDIO, channel_count=2)
+    assert ugen[0] is ugen[0]
+    assert list(ugen) == [ugen[0], ugen[1]]
+    assert len({ugen[0], ugen[1], OutputProxy(ugen=ugen, index=0)}) == 2
+    for copied in [copy.deepcopy(ugen), pickle.loads(pickle.dumps(ugen))]:
+        assert copied[1].ugen is copied
+        assert copied[1] == OutputProxy(ugen=copied, index=1)
+        assert hash(copied[1]) == hash(OutputProxy(ugen=copied, index=1))
+        assert copied[1] != ugen[1]
+
+
+def test_super_in_decorated_class() -> None:
+    with SynthDefBuilder() as builder:
+        Out.ar(bus=0, source=SinOsc.ar() * 2)
+    assert "BinaryOpUGen" in str(builder.build())